@@ -295,3 +295,6 @@ WEBPACK_LOADER = {
 }
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Longest side of stored student photos and resource images, in pixels; larger
+# uploads are downscaled before they are stored (see academics.image_ingest)
+ACADEMICS_IMAGE_MAX_DIMENSION = env.int("ACADEMICS_IMAGE_MAX_DIMENSION", 2048)
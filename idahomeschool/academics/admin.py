@@ -7,6 +7,7 @@ from .models import CourseTemplate
 from .models import CurriculumResource
 from .models import DailyLog
 from .models import GradeLevel
+from .models import ReportExport
 from .models import Resource
 from .models import SchoolYear
 from .models import Student
@@ -463,3 +464,20 @@ class CourseNoteAdmin(admin.ModelAdmin):
             },
         ),
     ]
+
+
+@admin.register(ReportExport)
+class ReportExportAdmin(admin.ModelAdmin):
+    """Admin for ReportExport model."""
+
+    list_display = ["filename", "kind", "status", "user", "created_at", "finished_at"]
+    list_filter = ["kind", "status", "created_at"]
+    search_fields = ["filename", "input_hash", "user__name", "user__email"]
+    readonly_fields = [
+        "input_hash",
+        "started_at",
+        "finished_at",
+        "created_at",
+        "updated_at",
+    ]
+    exclude = ["source"]
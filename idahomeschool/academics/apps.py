@@ -1,3 +1,5 @@
+import contextlib
+
 from django.apps import AppConfig
 
 
@@ -5,3 +7,7 @@ class AcademicsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "idahomeschool.academics"
     verbose_name = "Academic Records"
+
+    def ready(self):
+        with contextlib.suppress(ImportError):
+            import idahomeschool.academics.signals  # noqa: F401, PLC0415
@@ -0,0 +1,172 @@
+"""Attendance calendar grid construction shared by the calendar views."""
+
+from datetime import timedelta
+
+from django.db.models import Count
+from django.db.models import Exists
+from django.db.models import FilteredRelation
+from django.db.models import Max
+from django.db.models import OuterRef
+from django.db.models import Q
+
+from idahomeschool.academics.models import CourseNote
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.models import Student
+from idahomeschool.academics.status_registry import get_attendance_statuses
+
+
+def calendar_dates(view_type, ref_date):
+    """
+    Get the dates shown by a week or month calendar.
+
+    Weeks run Sunday to Saturday. Month calendars are padded with the days of
+    the previous and next month needed to fill whole weeks.
+
+    Args:
+        view_type: "week" or "month"
+        ref_date: Any date in the week or month to show
+
+    Returns:
+        Tuple of (start_date, end_date, date_range): the first and last day
+        of the week or month, and a list of ``{"date", "is_current_month"}``
+        dicts for every cell of the calendar
+    """
+    if view_type == "week":
+        # Calculate the start of the week (Sunday)
+        days_since_sunday = (ref_date.weekday() + 1) % 7
+        start_date = ref_date - timedelta(days=days_since_sunday)
+        end_date = start_date + timedelta(days=6)
+        date_range = [
+            {"date": start_date + timedelta(days=i), "is_current_month": True}
+            for i in range(7)
+        ]
+        return start_date, end_date, date_range
+
+    # Calculate the start and end of the month
+    month_start = ref_date.replace(day=1)
+    if ref_date.month == 12:  # noqa: PLR2004
+        next_month = ref_date.replace(year=ref_date.year + 1, month=1, day=1)
+    else:
+        next_month = ref_date.replace(month=ref_date.month + 1, day=1)
+    month_end = next_month - timedelta(days=1)
+
+    # Start from the Sunday before (or on) the first of the month
+    calendar_start_date = month_start - timedelta(days=(month_start.weekday() + 1) % 7)
+    # End on the Saturday after (or on) the last of the month
+    calendar_end_date = month_end + timedelta(days=(5 - month_end.weekday()) % 7)
+
+    date_range = []
+    current = calendar_start_date
+    while current <= calendar_end_date:
+        date_range.append(
+            {
+                "date": current,
+                "is_current_month": (
+                    current.month == ref_date.month and current.year == ref_date.year
+                ),
+            },
+        )
+        current += timedelta(days=1)
+    return month_start, month_end, date_range
+
+
+def calendar_version(user, start_date, end_date, student_id=None):
+    """
+    Summarize everything a calendar page renders, in a single query.
+
+    Covers the user's students, the daily logs and course notes in the date
+    range and the (cached) attendance statuses. Counts are included next to
+    the latest ``updated_at`` values so deletions change the summary too.
+
+    Args:
+        user: Owner of the calendar
+        start_date: First date shown
+        end_date: Last date shown
+        student_id: Optional id of the only student whose logs are shown
+
+    Returns:
+        Tuple of (summary, last_modified): a tuple that changes whenever the
+        rendered calendar would, and the latest change as a datetime (or
+        None if there is no data at all)
+    """
+    logs_in_range = Q(daily_logs__date__gte=start_date, daily_logs__date__lte=end_date)
+    if student_id:
+        logs_in_range &= Q(daily_logs__student_id=student_id)
+
+    data = (
+        Student.objects.filter(user=user)
+        .alias(range_logs=FilteredRelation("daily_logs", condition=logs_in_range))
+        .aggregate(
+            students_changed=Max("updated_at"),
+            student_count=Count("id", distinct=True),
+            logs_changed=Max("range_logs__updated_at"),
+            log_count=Count("range_logs", distinct=True),
+            notes_changed=Max("range_logs__course_notes__updated_at"),
+            note_count=Count("range_logs__course_notes", distinct=True),
+        )
+    )
+    statuses = get_attendance_statuses(user).all()
+    statuses_changed = max((status.updated_at for status in statuses), default=None)
+
+    summary = (*sorted(data.items()), statuses_changed, len(statuses))
+    changes = [
+        changed
+        for changed in (
+            data["students_changed"],
+            data["logs_changed"],
+            data["notes_changed"],
+            statuses_changed,
+        )
+        if changed
+    ]
+    return summary, max(changes, default=None)
+
+
+def build_attendance_grid(user, students, dates):
+    """
+    Build the student-by-date attendance grid for a calendar.
+
+    All logs in the date range are fetched in a single query, with course
+    note existence annotated on each log, so the number of queries does not
+    grow with the number of students, days or logs.
+
+    Args:
+        user: Owner of the daily logs
+        students: Iterable of Student instances, one grid row each
+        dates: Iterable of dates (or ``{"date": ...}`` dicts), one cell each
+
+    Returns:
+        List of dicts (one per student, in the given order) with the keys
+        ``student`` and ``dates``; each date cell is a dict with the keys
+        ``date``, ``log`` (DailyLog or None) and ``has_notes``
+    """
+    students = list(students)
+    dates = [d["date"] if isinstance(d, dict) else d for d in dates]
+
+    logs_by_student_date = {}
+    if students and dates:
+        daily_logs = (
+            DailyLog.objects.filter(
+                user=user,
+                student__in=students,
+                date__gte=min(dates),
+                date__lte=max(dates),
+            )
+            .select_related("attendance_status")
+            .annotate(
+                has_notes=Exists(CourseNote.objects.filter(daily_log=OuterRef("pk"))),
+            )
+        )
+        logs_by_student_date = {(log.student_id, log.date): log for log in daily_logs}
+
+    attendance_grid = []
+    for student in students:
+        row = {"student": student, "dates": []}
+        for d in dates:
+            log = logs_by_student_date.get((student.id, d))
+            row["dates"].append(
+                {"date": d, "log": log, "has_notes": bool(log and log.has_notes)},
+            )
+        attendance_grid.append(row)
+
+    return attendance_grid
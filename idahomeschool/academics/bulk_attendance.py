@@ -0,0 +1,64 @@
+"""Marking attendance for many students and dates at once."""
+
+from django.db import transaction
+
+from idahomeschool.academics.dashboard import invalidate_dashboard
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.rollups import record_daily_log_changes
+
+
+def bulk_mark_attendance(user, students, dates, attendance_status):
+    """
+    Set the attendance status of every (student, date) cell.
+
+    Missing logs are created and existing ones get the new status, all in a
+    single upsert on the ``(student, date)`` unique constraint. ``bulk_create``
+    does not send model signals, so the attendance rollups are updated and the
+    dashboard summary invalidated here.
+
+    Args:
+        user: Owner of the students and daily logs
+        students: Iterable of Student instances
+        dates: Iterable of dates to mark
+        attendance_status: AttendanceStatus to apply to every cell
+
+    Returns:
+        List of the written DailyLog instances
+    """
+    students = list(students)
+    dates = sorted(set(dates))
+    if not students or not dates:
+        return []
+
+    with transaction.atomic():
+        previous_keys = {
+            (student_id, log_date): (user_id, student_id, log_date, status_id)
+            for user_id, student_id, log_date, status_id in DailyLog.objects.filter(
+                student__in=students,
+                date__in=dates,
+            ).values_list(*DailyLog.ROLLUP_FIELDS)
+        }
+
+        daily_logs = DailyLog.objects.bulk_create(
+            [
+                DailyLog(
+                    user=user,
+                    student=student,
+                    date=log_date,
+                    attendance_status=attendance_status,
+                )
+                for student in students
+                for log_date in dates
+            ],
+            update_conflicts=True,
+            unique_fields=["student", "date"],
+            update_fields=["attendance_status", "updated_at"],
+        )
+
+        record_daily_log_changes(
+            (previous_keys.get((log.student_id, log.date)), log.rollup_key)
+            for log in daily_logs
+        )
+        transaction.on_commit(lambda: invalidate_dashboard(user.pk))
+
+    return daily_logs
@@ -0,0 +1,36 @@
+"""Version counters for invalidating groups of entries in Django's cache."""
+
+from django.core.cache import cache
+
+
+def get_version(key):
+    """
+    Get the current version stored under a key, starting at 1.
+
+    Cached entries include the version in their own keys, so they are only
+    found again while the version stays the same.
+
+    Args:
+        key: Cache key of the version counter
+
+    Returns:
+        Current version number
+    """
+    return cache.get_or_set(key, 1, None)
+
+
+def bump_version(key):
+    """
+    Increment the version stored under a key.
+
+    Every process misses on its next lookup of entries keyed by the old
+    version, without having to delete them; they expire on their own.
+
+    Args:
+        key: Cache key of the version counter
+    """
+    try:
+        cache.incr(key)
+    except ValueError:
+        # No version stored yet (or it was evicted)
+        cache.set(key, 2, None)
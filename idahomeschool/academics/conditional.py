@@ -0,0 +1,183 @@
+"""Conditional GET (ETag / Last-Modified) for read-only academics pages."""
+
+import hashlib
+
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models import Max
+from django.db.models import Value
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.cache import patch_cache_control
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.utils.http import quote_etag
+
+from idahomeschool.academics.cache_versions import bump_version
+from idahomeschool.academics.cache_versions import get_version
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _label(model):
+    return model._meta.label_lower  # noqa: SLF001
+
+
+def _version_key(user_id, label):
+    return f"academics:data:{user_id}:{label}:version"
+
+
+def _summary_key(user_id, label, version):
+    return f"academics:data:{user_id}:{label}:v{version}"
+
+
+def invalidate_data_version(user_id, *models):
+    """
+    Invalidate the cached data versions of some of a user's models.
+
+    Args:
+        user_id: Primary key of the user whose rows changed
+        *models: Model classes whose rows were created, changed or deleted
+    """
+    for model in models:
+        bump_version(_version_key(user_id, _label(model)))
+
+
+def _summarize(user, models):
+    """Get the latest change and row count of each model in one query."""
+    querysets = [
+        model.objects.filter(user=user)
+        .order_by()
+        .values("user")
+        .annotate(
+            label=Value(_label(model)),
+            changed=Max("updated_at"),
+            rows=Count("pk"),
+        )
+        .values_list("label", "changed", "rows")
+        for model in models
+    ]
+    rows = querysets[0].union(*querysets[1:], all=True)
+    summaries = dict.fromkeys(map(_label, models), (None, 0))
+    summaries.update({label: (changed, count) for label, changed, count in rows})
+    return summaries
+
+
+def get_data_version(user, models):
+    """
+    Get a cheap version of a user's rows of some models.
+
+    Each model's latest ``updated_at`` and row count are cached per user and
+    model. The cache entries are invalidated whenever one of the user's rows
+    is saved or deleted, or a many-to-many relation of it changes (see
+    academics.signals); on a miss all stale models are summarized together
+    in one query.
+
+    Args:
+        user: User whose data to version
+        models: Model classes with ``user`` and ``updated_at`` fields
+
+    Returns:
+        Tuple of (summary, last_modified): a tuple that changes whenever any
+        of the rows change, and the latest ``updated_at`` (None if there are
+        no rows at all)
+    """
+    models = {_label(model): model for model in models}
+    versions = {label: get_version(_version_key(user.pk, label)) for label in models}
+    keys = {
+        label: _summary_key(user.pk, label, version)
+        for label, version in versions.items()
+    }
+    cached = cache.get_many(keys.values())
+    stale = [label for label, key in keys.items() if key not in cached]
+    if stale:
+        fresh = _summarize(user, [models[label] for label in stale])
+        fresh = {keys[label]: summary for label, summary in fresh.items()}
+        cache.set_many(fresh, CACHE_TIMEOUT)
+        cached.update(fresh)
+
+    summary = tuple(
+        (label, versions[label], *cached[keys[label]]) for label in sorted(models)
+    )
+    last_modified = max(
+        (changed for _name, _version, changed, _rows in summary if changed),
+        default=None,
+    )
+    return summary, last_modified
+
+
+def conditional_response(request, summary, last_modified, render):
+    """
+    Answer a GET with 304 Not Modified if the client's copy is current.
+
+    The ETag covers the data summary plus everything else a page depends
+    on: the user, the full URL, HTMX (fragment) requests, the CSRF secret
+    embedded in every page and the current date.
+
+    Args:
+        request: The GET request
+        summary: Hashable description of the data the page shows
+        last_modified: Latest change of that data as a datetime, or None
+        render: Callable returning the full response, only called when the
+            client's copy is stale
+
+    Returns:
+        HttpResponse with ETag, Last-Modified and Cache-Control headers
+    """
+    # Pending flash messages are shown on the page, so it must be rendered
+    if get_messages(request):
+        return render()
+
+    fingerprint = repr(
+        (
+            request.user.pk,
+            request.get_full_path(),
+            bool(request.htmx),
+            request.META.get("CSRF_COOKIE"),
+            timezone.localdate(),
+            summary,
+        ),
+    )
+    etag = quote_etag(hashlib.sha256(fingerprint.encode()).hexdigest())
+    timestamp = last_modified.timestamp() if last_modified else None
+
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=timestamp,
+    )
+    if response is None:
+        response = render()
+    response["ETag"] = etag
+    if timestamp:
+        response["Last-Modified"] = http_date(timestamp)
+    # Private and revalidated on every use, but cheap to revalidate
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ["HX-Request"])
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    Answer conditional GETs before the view does any real work.
+
+    Views list the models their pages read in ``conditional_models``. The
+    ETag and Last-Modified come from the cached data version of those models
+    (see get_data_version), so a revisit of an unchanged page costs no
+    queries beyond the session and user, and renders nothing.
+    """
+
+    conditional_models = ()
+
+    def get(self, request, *args, **kwargs):
+        summary, last_modified = get_data_version(
+            request.user,
+            self.conditional_models,
+        )
+        return conditional_response(
+            request,
+            summary,
+            last_modified,
+            lambda: super(ConditionalGetMixin, self).get(request, *args, **kwargs),
+        )
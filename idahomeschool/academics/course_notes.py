@@ -0,0 +1,87 @@
+"""Saving the per-course notes of a daily log."""
+
+from django.db import transaction
+from django.utils import timezone
+
+from idahomeschool.academics.models import CourseEnrollment
+from idahomeschool.academics.models import CourseNote
+
+
+def active_enrollment_ids(user, student, school_year):
+    """
+    Return ids of the student's enrollments shown on the daily log forms.
+
+    Args:
+        user: Owner of the enrollments
+        student: Student whose enrollments to return
+        school_year: Active SchoolYear to limit the enrollments to, or None
+            to return all of the student's enrollments
+
+    Returns:
+        List of CourseEnrollment ids
+    """
+    enrollments = CourseEnrollment.objects.filter(user=user, student=student)
+    if school_year:
+        enrollments = enrollments.filter(school_year=school_year)
+    return list(enrollments.values_list("id", flat=True))
+
+
+def sync_course_notes(daily_log, notes_by_enrollment, user):
+    """
+    Make a daily log's course notes match the submitted text.
+
+    Existing notes are loaded once and compared in memory; new notes are
+    inserted with one bulk_create, changed ones written with one bulk_update
+    and cleared ones removed with one delete.
+
+    Args:
+        daily_log: Saved DailyLog the notes belong to
+        notes_by_enrollment: Dict of CourseEnrollment id to submitted note
+            text; blank text deletes the note
+        user: Owner of the notes
+
+    Returns:
+        True if the daily log has any course notes after the sync
+    """
+    existing = {}
+    other_notes = False
+    for note in CourseNote.objects.filter(daily_log=daily_log):
+        if note.course_enrollment_id in notes_by_enrollment:
+            existing[note.course_enrollment_id] = note
+        else:
+            # Notes for enrollments outside the form (e.g. other school years)
+            other_notes = True
+
+    to_create = []
+    to_update = []
+    to_delete = []
+    now = timezone.now()
+    for enrollment_id, submitted in notes_by_enrollment.items():
+        text = submitted.strip()
+        note = existing.get(enrollment_id)
+        if note is None:
+            if text:
+                to_create.append(
+                    CourseNote(
+                        daily_log=daily_log,
+                        course_enrollment_id=enrollment_id,
+                        notes=text,
+                        user=user,
+                    ),
+                )
+        elif not text:
+            to_delete.append(note.pk)
+        elif note.notes != text:
+            note.notes = text
+            # bulk_update does not apply auto_now
+            note.updated_at = now
+            to_update.append(note)
+
+    with transaction.atomic():
+        # Both are no-ops without a query when given no objects
+        CourseNote.objects.bulk_create(to_create)
+        CourseNote.objects.bulk_update(to_update, ["notes", "updated_at"])
+        if to_delete:
+            CourseNote.objects.filter(pk__in=to_delete).delete()
+
+    return other_notes or len(existing) - len(to_delete) + len(to_create) > 0
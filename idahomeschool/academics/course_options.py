@@ -0,0 +1,78 @@
+"""Per-user course choices for enrollment forms, cached in Django's cache."""
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils.html import format_html
+from django.utils.html import format_html_join
+
+from idahomeschool.academics.cache_versions import bump_version
+from idahomeschool.academics.cache_versions import get_version
+from idahomeschool.academics.models import Course
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+EMPTY_LABEL = "---------"
+
+
+def _version_key(user_id):
+    return f"academics:course-options:{user_id}:version"
+
+
+def _options_key(user_id, version, grade_level_id):
+    return f"academics:course-options:{user_id}:v{version}:{grade_level_id or 'all'}"
+
+
+def invalidate_course_options(user_id):
+    """
+    Invalidate the cached course options for a user.
+
+    Args:
+        user_id: Primary key of the user whose courses or grade levels changed
+    """
+    bump_version(_version_key(user_id))
+
+
+def _build_options(user, grade_level_id):
+    courses = Course.objects.filter(user=user).select_related("grade_level")
+    if grade_level_id:
+        # Matching grade level or no grade level (universal)
+        courses = courses.filter(
+            Q(grade_level_id=grade_level_id) | Q(grade_level__isnull=True),
+        )
+    choices = [("", EMPTY_LABEL)]
+    for course in courses.order_by("grade_level__order", "name"):
+        grade_label = course.grade_level.name if course.grade_level else "Any"
+        choices.append((course.pk, f"{course.name} ({grade_label})"))
+    html = format_html('<option value="">{}</option>', EMPTY_LABEL) + format_html_join(
+        "",
+        '<option value="{}">{}</option>',
+        choices[1:],
+    )
+    return {"choices": choices, "html": str(html)}
+
+
+def get_course_options(user, grade_level=None):
+    """
+    Get the course choices offered when enrolling a student.
+
+    Options are built with one query and cached per user and grade level;
+    the cache entries are invalidated whenever one of the user's courses or
+    grade levels is saved or deleted (see academics.signals).
+
+    Args:
+        user: Owner of the courses
+        grade_level: GradeLevel to offer courses for (plus universal
+            courses), or None for every course
+
+    Returns:
+        Dict with ``choices`` (list of (pk, label) pairs, starting with the
+        empty choice) and ``html`` (the same choices as ``<option>`` tags)
+    """
+    grade_level_id = grade_level.pk if grade_level else None
+    version = get_version(_version_key(user.pk))
+    key = _options_key(user.pk, version, grade_level_id)
+    options = cache.get(key)
+    if options is None:
+        options = _build_options(user, grade_level_id)
+        cache.set(key, options, CACHE_TIMEOUT)
+    return options
@@ -0,0 +1,126 @@
+"""Per-user dashboard summary cached in Django's cache."""
+
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models import Q
+
+from idahomeschool.academics.cache_versions import bump_version
+from idahomeschool.academics.cache_versions import get_version
+from idahomeschool.academics.models import Course
+from idahomeschool.academics.models import CourseEnrollment
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.models import Student
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+RECENT_LIMIT = 5
+
+
+def _version_key(user_id):
+    return f"academics:dashboard:{user_id}:version"
+
+
+def _summary_key(user_id, version, active_year, week_start):
+    year_id = active_year.pk if active_year else "none"
+    return (
+        f"academics:dashboard:{user_id}:v{version}:{year_id}:{week_start.isoformat()}"
+    )
+
+
+def invalidate_dashboard(user_id):
+    """
+    Invalidate the cached dashboard summary for a user.
+
+    Args:
+        user_id: Primary key of the user whose records changed
+    """
+    bump_version(_version_key(user_id))
+
+
+def _attendance_counts(user, active_year, week_start, week_end):
+    """Count the year's and the week's attendance in a single aggregate."""
+    instructional = Q(attendance_status__is_instructional=True)
+    this_week = Q(date__gte=week_start, date__lte=week_end)
+    counts = {
+        "week_days_logged": Count("date", filter=this_week, distinct=True),
+        "week_instructional_days": Count(
+            "date",
+            filter=this_week & instructional,
+            distinct=True,
+        ),
+        "week_students_count": Count("student", filter=this_week, distinct=True),
+    }
+    if active_year:
+        in_year = Q(date__gte=active_year.start_date, date__lte=active_year.end_date)
+        counts["total_attendance_days"] = Count("id", filter=in_year)
+        counts["instructional_days"] = Count("id", filter=in_year & instructional)
+    return DailyLog.objects.filter(user=user).aggregate(**counts)
+
+
+def _build_summary(user, active_year, week_start):
+    summary = _attendance_counts(
+        user,
+        active_year,
+        week_start,
+        week_start + timedelta(days=6),
+    )
+
+    if active_year:
+        active_enrollments = list(
+            CourseEnrollment.objects.filter(
+                user=user,
+                school_year=active_year,
+                status="IN_PROGRESS",
+            ).select_related("student", "course", "school_year"),
+        )
+        summary["active_enrollments"] = active_enrollments
+        summary["active_courses_count"] = len(
+            {enrollment.course_id for enrollment in active_enrollments},
+        )
+        # For template conditional check
+        summary["active_courses"] = bool(active_enrollments)
+
+    summary["recent_daily_logs"] = list(
+        DailyLog.objects.filter(user=user)
+        .select_related("student")
+        .order_by("-date")[:RECENT_LIMIT],
+    )
+    summary["recent_students"] = list(
+        Student.objects.filter(user=user).order_by("-created_at")[:RECENT_LIMIT],
+    )
+    summary["recent_courses"] = list(
+        Course.objects.filter(user=user)
+        .select_related("course_template")
+        .annotate(enrollment_count=Count("enrollments"))
+        .order_by("-created_at")[:RECENT_LIMIT],
+    )
+    return summary
+
+
+def get_dashboard_summary(user, active_year, today):
+    """
+    Get the statistics and recent records shown on a user's dashboard.
+
+    The summary is cached per user, active school year and week; the cache
+    entry is invalidated whenever one of the user's daily logs, enrollments,
+    students, courses, school years or attendance statuses is saved or
+    deleted (see academics.signals).
+
+    Args:
+        user: User whose dashboard to summarize
+        active_year: The user's active SchoolYear, or None
+        today: Date the weekly summary is computed for
+
+    Returns:
+        Dict of template context for the dashboard
+    """
+    week_start = today - timedelta(days=today.weekday())  # Monday
+    version = get_version(_version_key(user.pk))
+    key = _summary_key(user.pk, version, active_year, week_start)
+    summary = cache.get(key)
+    if summary is None:
+        summary = _build_summary(user, active_year, week_start)
+        cache.set(key, summary, CACHE_TIMEOUT)
+    return summary
@@ -0,0 +1,137 @@
+"""Background generation of report files (see the run_report_exports command)."""
+
+import hashlib
+import logging
+from datetime import timedelta
+
+from django.core.files.base import ContentFile
+from django.db import IntegrityError
+from django.db import transaction
+from django.utils import timezone
+
+from idahomeschool.academics.models import ReportExport
+
+logger = logging.getLogger(__name__)
+
+# Running jobs older than this are assumed to belong to a dead worker
+STALE_EXPORT_AGE = timedelta(minutes=10)
+
+
+def _render_pdf(source):
+    # WeasyPrint needs system libraries (pango) that only the worker has to load
+    from weasyprint import HTML  # noqa: PLC0415
+
+    return HTML(string=source).write_pdf()
+
+
+RENDERERS = {
+    ReportExport.KIND_ATTENDANCE_PDF: _render_pdf,
+}
+
+
+def request_report_export(user, kind, source, filename):
+    """
+    Get the export for a rendered report, queueing a job if needed.
+
+    Args:
+        user: Owner of the report
+        kind: One of ReportExport.KIND_CHOICES
+        source: Rendered report source (e.g. HTML for a PDF)
+        filename: File name offered when downloading
+
+    Returns:
+        ReportExport for the report; finished if an identical report was
+        generated before, otherwise pending
+    """
+    input_hash = hashlib.sha256(source.encode()).hexdigest()
+    lookup = {"user": user, "kind": kind, "input_hash": input_hash}
+
+    export = ReportExport.objects.filter(**lookup).first()
+    if export is None:
+        try:
+            with transaction.atomic():
+                return ReportExport.objects.create(
+                    **lookup,
+                    source=source,
+                    filename=filename,
+                )
+        except IntegrityError:
+            # Another request queued the same report first
+            export = ReportExport.objects.get(**lookup)
+
+    if export.status == ReportExport.STATUS_FAILED:
+        # Retry failed jobs when the report is requested again
+        export.status = ReportExport.STATUS_PENDING
+        export.source = source
+        export.error = ""
+        export.save(update_fields=["status", "source", "error", "updated_at"])
+
+    return export
+
+
+def requeue_stale_exports():
+    """
+    Return running jobs abandoned by a dead worker to the queue.
+
+    Returns:
+        Number of requeued jobs
+    """
+    return ReportExport.objects.filter(
+        status=ReportExport.STATUS_RUNNING,
+        started_at__lt=timezone.now() - STALE_EXPORT_AGE,
+    ).update(status=ReportExport.STATUS_PENDING, updated_at=timezone.now())
+
+
+def claim_next_export():
+    """
+    Mark the oldest pending job as running and return it.
+
+    Rows locked by other workers are skipped, so several workers can poll
+    the same queue.
+
+    Returns:
+        Claimed ReportExport, or None if the queue is empty
+    """
+    with transaction.atomic():
+        export = (
+            ReportExport.objects.select_for_update(skip_locked=True)
+            .filter(status=ReportExport.STATUS_PENDING)
+            .order_by("created_at")
+            .first()
+        )
+        if export is None:
+            return None
+        export.status = ReportExport.STATUS_RUNNING
+        export.started_at = timezone.now()
+        export.save(update_fields=["status", "started_at", "updated_at"])
+    return export
+
+
+def run_report_export(export):
+    """
+    Generate a claimed job's file and store it with the default storage.
+
+    Args:
+        export: ReportExport returned by claim_next_export
+
+    Returns:
+        The export, either done or failed
+    """
+    try:
+        content = RENDERERS[export.kind](export.source)
+        export.file.save(export.filename, ContentFile(content), save=False)
+        export.status = ReportExport.STATUS_DONE
+        export.source = ""
+        export.finished_at = timezone.now()
+        export.save(
+            update_fields=["file", "status", "source", "finished_at", "updated_at"],
+        )
+    except Exception as exc:
+        # Storage outages fail the job like renderer errors, so the worker
+        # keeps polling instead of crashing on it
+        logger.exception("Report export %s failed", export.pk)
+        export.status = ReportExport.STATUS_FAILED
+        export.error = str(exc)
+        export.finished_at = timezone.now()
+        export.save(update_fields=["status", "error", "finished_at", "updated_at"])
+    return export
@@ -0,0 +1,137 @@
+"""Facet counts for the resource library, cached per user and filter state."""
+
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import CharField
+from django.db.models import Count
+from django.db.models import Value
+from django.db.models.functions import Cast
+
+from idahomeschool.academics.conditional import get_data_version
+from idahomeschool.academics.models import Resource
+from idahomeschool.academics.models import Tag
+from idahomeschool.academics.search import search_resources
+from idahomeschool.academics.tags import filter_by_all_tags
+from idahomeschool.academics.tags import parse_tag_ids
+
+# Keys vary with the search text, so entries expire sooner than other caches
+CACHE_TIMEOUT = 60 * 60
+
+# Models whose changes invalidate the counts
+FACET_MODELS = (Resource, Tag)
+
+
+def parse_resource_filters(params):
+    """
+    Read the resource library filters from a query string.
+
+    Args:
+        params: QueryDict with ``search``, ``resource_type`` and repeated
+            ``tag`` parameters
+
+    Returns:
+        Dict with ``search``, ``resource_type`` and ``tag_ids``
+    """
+    return {
+        "search": params.get("search", "").strip(),
+        "resource_type": params.get("resource_type", ""),
+        "tag_ids": parse_tag_ids(params.getlist("tag")),
+    }
+
+
+def _facets_key(user_id, summary, filters):
+    state = repr((summary, sorted(filters.items())))
+    digest = hashlib.sha256(state.encode()).hexdigest()
+    return f"academics:resource-facets:{user_id}:{digest}"
+
+
+def _count_facets(user, search, resource_type, tag_ids):
+    """Count resource types and tags for the filters in one grouped query."""
+    matching = filter_by_all_tags(Resource.objects.filter(user=user), tag_ids)
+    if search:
+        matching = matching.filter(
+            pk__in=search_resources(matching, search).values("pk"),
+        )
+    # Other types stay countable while one is selected, so the type facet
+    # leaves out its own filter
+    by_type = (
+        matching.order_by()
+        .values("resource_type")
+        .annotate(
+            facet=Value("type"),
+            name=Value(""),
+            color=Value(""),
+            count=Count("pk"),
+        )
+        .values_list("facet", "resource_type", "name", "color", "count")
+    )
+    if resource_type:
+        matching = matching.filter(resource_type=resource_type)
+
+    through = Resource.tags.through
+    by_tag = (
+        through.objects.filter(resource__in=matching.values("pk"))
+        .order_by()
+        .values("tag", "tag__name", "tag__color")
+        .annotate(
+            facet=Value("tag"),
+            value=Cast("tag", CharField()),
+            count=Count("pk"),
+        )
+        .values_list("facet", "value", "tag__name", "tag__color", "count")
+    )
+
+    facets = {"types": [], "tags": []}
+    for facet, value, name, color, count in by_type.union(by_tag, all=True):
+        if facet == "type":
+            facets["types"].append((value, count))
+        else:
+            facets["tags"].append((int(value), name, color, count))
+
+    # Selected filters stay listed, so they can be cleared from the sidebar
+    # even when nothing matches them any more
+    if resource_type and resource_type not in dict(facets["types"]):
+        facets["types"].append((resource_type, 0))
+    missing = set(tag_ids) - {tag_id for tag_id, *_rest in facets["tags"]}
+    if missing:
+        facets["tags"] += [
+            (*tag, 0)
+            for tag in Tag.objects.filter(user=user, pk__in=missing).values_list(
+                "id",
+                "name",
+                "color",
+            )
+        ]
+    facets["types"].sort(key=lambda item: (-item[1], item[0]))
+    facets["tags"].sort(key=lambda item: (-item[3], item[1].casefold()))
+    return facets
+
+
+def get_resource_facets(user, filters):
+    """
+    Count a user's resources by type and by tag, within the current filters.
+
+    Type counts cover the results of every filter but the type, so another
+    type can be picked instead; tag counts cover the filtered results, so
+    they show how many resources remain when a tag is added. The selected
+    type and tags are always listed, with a count of 0 if nothing matches
+    them any more. Counts are cached per user and filter state, and keyed by
+    the data versions of resources and tags (see academics.conditional), so
+    any change to them or their tagging misses.
+
+    Args:
+        user: Owner of the resources
+        filters: Dict as returned by parse_resource_filters
+
+    Returns:
+        Dict with ``types`` (list of (resource_type, count)) and ``tags``
+        (list of (tag_id, name, color, count)), most common first
+    """
+    summary, _last_modified = get_data_version(user, FACET_MODELS)
+    key = _facets_key(user.pk, summary, filters)
+    facets = cache.get(key)
+    if facets is None:
+        facets = _count_facets(user, **filters)
+        cache.set(key, facets, CACHE_TIMEOUT)
+    return facets
@@ -1,4 +1,5 @@
 import json
+from datetime import timedelta
 
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Column
@@ -8,6 +9,7 @@ from crispy_forms.layout import Submit
 from django import forms
 from django.forms import modelformset_factory
 
+from .course_options import get_course_options
 from .models import BookTagPreference
 from .models import ColorPalette
 from .models import Course
@@ -23,6 +25,9 @@ from .models import SchoolYear
 from .models import Student
 from .models import StudentGradeYear
 from .models import Tag
+from .tags import parse_tags_data
+from .tags import resolve_tags
+from .tags import set_tags
 
 
 class SchoolYearForm(forms.ModelForm):
@@ -153,47 +158,8 @@ class ResourceForm(forms.ModelForm):
             instance.save()
 
             # Process tags from tag selector
-            tags_data = self.cleaned_data.get("tags_data", "[]")
-            try:
-                tags_list = json.loads(tags_data)
-            except (json.JSONDecodeError, TypeError):
-                tags_list = []
-
-            # Clear existing tags
-            instance.tags.clear()
-
-            # Process each tag
-            for tag_data in tags_list:
-                tag_id = tag_data.get("id")
-                tag_name = tag_data.get("name", "").strip()
-
-                if not tag_name:
-                    continue
-
-                # If ID is positive, it's an existing tag
-                if tag_id and tag_id > 0:
-                    try:
-                        tag = Tag.objects.get(id=tag_id, user=self.user)
-                        instance.tags.add(tag)
-                    except Tag.DoesNotExist:
-                        # Tag doesn't exist or doesn't belong to user, create new one
-                        tag = Tag.objects.create(
-                            user=self.user,
-                            name=tag_name,
-                            color=Tag.get_random_color_from_palette(self.user),
-                        )
-                        instance.tags.add(tag)
-                else:
-                    # Negative ID or no ID means it's a new tag
-                    # Check if tag with this name already exists for this user
-                    tag, _created = Tag.objects.get_or_create(
-                        user=self.user,
-                        name=tag_name,
-                        defaults={
-                            "color": Tag.get_random_color_from_palette(self.user),
-                        },
-                    )
-                    instance.tags.add(tag)
+            tags_list = parse_tags_data(self.cleaned_data.get("tags_data"))
+            set_tags(instance, resolve_tags(self.user, tags_list))
 
         return instance
 
@@ -391,18 +357,8 @@ class CourseEnrollmentForm(forms.ModelForm):
         )
 
         # Update course field to show grade level in options
-        course_choices = [("", "---------")]
-        for course in self.fields["course"].queryset.order_by(
-            "grade_level__order",
-            "name",
-        ):
-            grade_label = (
-                f" ({course.grade_level.name})" if course.grade_level else " (Any)"
-            )
-            label = f"{course.name}{grade_label}"
-            course_choices.append((course.pk, label))
-
-        self.fields["course"].choices = course_choices
+        if self.user:
+            self.fields["course"].choices = get_course_options(self.user)["choices"]
         self.fields["course"].help_text = (
             "Courses are filtered by student's grade level. "
             "Select a student and school year to see relevant courses."
@@ -507,6 +463,59 @@ class DailyLogForm(forms.ModelForm):
         return instance
 
 
+class BulkAttendanceForm(forms.Form):
+    """Form for marking one attendance status across students and dates."""
+
+    MAX_DAYS = 31
+
+    students = forms.ModelMultipleChoiceField(
+        queryset=Student.objects.none(),
+        widget=forms.CheckboxSelectMultiple,
+    )
+    start_date = forms.DateField(widget=forms.DateInput(attrs={"type": "date"}))
+    end_date = forms.DateField(widget=forms.DateInput(attrs={"type": "date"}))
+    status = forms.ChoiceField(label="Attendance Status")
+    weekdays_only = forms.BooleanField(
+        required=False,
+        initial=True,
+        label="Weekdays only",
+        help_text="Skip Saturdays and Sundays in the date range",
+    )
+
+    def __init__(self, *args, user=None, attendance_statuses=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        if user:
+            self.fields["students"].queryset = Student.objects.filter(user=user)
+        self.fields["status"].choices = [
+            (status.code, status.label) for status in attendance_statuses
+        ]
+
+    def clean(self):
+        cleaned_data = super().clean()
+        start_date = cleaned_data.get("start_date")
+        end_date = cleaned_data.get("end_date")
+
+        if start_date and end_date:
+            if end_date < start_date:
+                self.add_error("end_date", "End date must be on or after start date")
+            elif (end_date - start_date).days >= self.MAX_DAYS:
+                self.add_error(
+                    "end_date",
+                    f"Mark at most {self.MAX_DAYS} days at a time",
+                )
+
+        return cleaned_data
+
+    def get_dates(self):
+        """Return the dates in the submitted range."""
+        start_date = self.cleaned_data["start_date"]
+        days = (self.cleaned_data["end_date"] - start_date).days + 1
+        dates = [start_date + timedelta(days=offset) for offset in range(days)]
+        if self.cleaned_data["weekdays_only"]:
+            dates = [d for d in dates if d.weekday() < 5]  # noqa: PLR2004
+        return dates
+
+
 class CourseNoteForm(forms.ModelForm):
     """Form for creating and updating CourseNote instances."""
 
@@ -767,40 +776,13 @@ class BookTagPreferenceForm(forms.ModelForm):
         if commit:
             instance.save()
 
-            # Process tags from tag selector
-            tags_data = self.cleaned_data.get("tags_data", "[]")
-            try:
-                tags_list = json.loads(tags_data)
-            except (json.JSONDecodeError, TypeError):
-                tags_list = []
-
-            # Clear existing tags
-            instance.tags.clear()
-
-            # Process each tag
-            for tag_data in tags_list:
-                tag_id = tag_data.get("id")
-                tag_name = tag_data.get("name", "").strip()
-
-                if not tag_name:
-                    continue
-
-                # If ID is positive, it's an existing tag
-                if tag_id and tag_id > 0:
-                    try:
-                        tag = Tag.objects.get(id=tag_id, user=self.user)
-                        instance.tags.add(tag)
-                    except Tag.DoesNotExist:
-                        # Tag doesn't exist or doesn't belong to user
-                        pass
-                else:
-                    # Try to find existing tag by name
-                    try:
-                        tag = Tag.objects.get(user=self.user, name=tag_name)
-                        instance.tags.add(tag)
-                    except Tag.DoesNotExist:
-                        # Tag doesn't exist - user needs to create it first
-                        pass
+            # Process tags from tag selector (only existing tags are used;
+            # the user needs to create new tags first)
+            tags_list = parse_tags_data(self.cleaned_data.get("tags_data"))
+            set_tags(
+                instance,
+                resolve_tags(self.user, tags_list, create_missing=False),
+            )
 
         return instance
 
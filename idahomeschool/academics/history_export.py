@@ -0,0 +1,123 @@
+"""Streaming export of attendance and course note history."""
+
+import csv
+
+from django.db.models import F
+from django.db.models.functions import Coalesce
+
+from idahomeschool.academics.models import DailyLog
+
+EXPORT_CHUNK_SIZE = 2000
+
+HISTORY_HEADER = [
+    "Date",
+    "Student",
+    "Attendance Status",
+    "Instructional",
+    "General Notes",
+    "School Year",
+    "Course",
+    "Course Notes",
+]
+
+
+def attendance_history_rows(
+    user,
+    student=None,
+    school_year=None,
+    start_date=None,
+    end_date=None,
+):
+    """
+    Yield one row per course note, plus one per daily log without notes.
+
+    Rows are read with a server-side cursor in chunks, so memory use does
+    not grow with the size of the history.
+
+    Args:
+        user: Owner of the daily logs
+        student: Optional Student to limit the export to
+        school_year: Optional SchoolYear whose date range limits the export
+        start_date: Optional first date to include
+        end_date: Optional last date to include
+
+    Returns:
+        Generator of row lists, starting with HISTORY_HEADER
+    """
+    daily_logs = DailyLog.objects.filter(user=user)
+    if student is not None:
+        daily_logs = daily_logs.filter(student=student)
+    if school_year is not None:
+        daily_logs = daily_logs.filter(
+            date__gte=school_year.start_date,
+            date__lte=school_year.end_date,
+        )
+    if start_date is not None:
+        daily_logs = daily_logs.filter(date__gte=start_date)
+    if end_date is not None:
+        daily_logs = daily_logs.filter(date__lte=end_date)
+
+    # Joining course_notes gives one row per note (or one row with empty
+    # note columns for logs without notes)
+    rows = daily_logs.order_by(
+        "date",
+        "student__name",
+        "pk",
+        "course_notes__pk",
+    ).values_list(
+        "date",
+        "student__name",
+        Coalesce("attendance_status__label", F("status")),
+        "attendance_status__is_instructional",
+        "general_notes",
+        "course_notes__course_enrollment__school_year__name",
+        Coalesce(
+            "course_notes__course_enrollment__course__name",
+            "course_notes__course__name",
+        ),
+        "course_notes__notes",
+    )
+
+    yield HISTORY_HEADER
+    for (
+        log_date,
+        student_name,
+        status_label,
+        is_instructional,
+        general_notes,
+        school_year_name,
+        course_name,
+        notes,
+    ) in rows.iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        yield [
+            log_date.isoformat(),
+            student_name,
+            status_label,
+            "" if is_instructional is None else ("Yes" if is_instructional else "No"),
+            general_notes,
+            school_year_name or "",
+            course_name or "",
+            notes or "",
+        ]
+
+
+class _Echo:
+    """File-like object whose write() returns the value instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows):
+    """
+    Encode rows as CSV lines one at a time.
+
+    Args:
+        rows: Iterable of row lists
+
+    Returns:
+        Generator of CSV-formatted strings, one per row
+    """
+    writer = csv.writer(_Echo())
+    for row in rows:
+        yield writer.writerow(row)
@@ -0,0 +1,125 @@
+"""Downscaling of student photos and resource images before they are stored."""
+
+import logging
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import ExifTags
+from PIL import Image
+
+from idahomeschool.academics.renditions import RENDITION_FIELDS
+from idahomeschool.academics.renditions import decode_reduced
+from idahomeschool.academics.renditions import delete_renditions
+from idahomeschool.academics.renditions import flatten_to_rgb
+from idahomeschool.academics.renditions import renditions_field_name
+from idahomeschool.academics.renditions import scaled_size
+
+logger = logging.getLogger(__name__)
+
+# Renditions are made from the stored originals, so these stay high quality
+ORIGINAL_FORMATS = {
+    "jpeg": {"format": "JPEG", "quality": 90, "optimize": True},
+    "png": {"format": "PNG", "optimize": True},
+}
+
+
+def _has_alpha(img):
+    return img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+
+
+def prepare_upload(file, max_dimension=None):
+    """
+    Downscale and orient an image before it is stored.
+
+    Images larger than the maximum dimension, or rotated by their EXIF
+    orientation, are re-encoded upright: as PNG if they have transparency
+    and as JPEG otherwise, without their metadata. Large JPEGs are decoded
+    at a reduced scale (see decode_reduced), so memory use follows the
+    stored size rather than the camera's. Anything else, including
+    animations and files Pillow cannot read, is stored as uploaded.
+
+    Args:
+        file: Uploaded file or opened FieldFile of the image
+        max_dimension: Longest side to keep, in pixels (default:
+            ``settings.ACADEMICS_IMAGE_MAX_DIMENSION``)
+
+    Returns:
+        ContentFile to store instead, or None to store the file as it is
+    """
+    max_dimension = max_dimension or settings.ACADEMICS_IMAGE_MAX_DIMENSION
+    try:
+        file.seek(0)
+        with Image.open(file) as original:
+            scale = min(1, max_dimension / max(original.size))
+            orientation = original.getexif().get(ExifTags.Base.Orientation, 1)
+            if getattr(original, "is_animated", False) or (
+                scale == 1 and orientation == 1
+            ):
+                return None
+
+            image_format = "png" if _has_alpha(original) else "jpeg"
+            img = decode_reduced(original, scaled_size(original.size, scale))
+            img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+            if image_format == "jpeg":
+                img = flatten_to_rgb(img)
+            buffer = BytesIO()
+            img.save(buffer, **ORIGINAL_FORMATS[image_format])
+    except (OSError, ValueError, Image.DecompressionBombError):
+        logger.warning("Could not downscale %s", file.name, exc_info=True)
+        return None
+    finally:
+        file.seek(0)
+
+    name = PurePosixPath(file.name).with_suffix(f".{image_format}").name
+    return ContentFile(buffer.getvalue(), name=name)
+
+
+def downscale_stored_image(instance, max_dimension=None):
+    """
+    Downscale the stored image of a Student or Resource like a new upload.
+
+    For images stored before uploads were downscaled. The new file is saved
+    next to the old one and the row's renditions are reset, so the worker
+    renders them again; the old files are deleted once the row is saved.
+
+    Args:
+        instance: Student or Resource with an image
+        max_dimension: Longest side to keep, in pixels (default:
+            ``settings.ACADEMICS_IMAGE_MAX_DIMENSION``)
+
+    Returns:
+        True if the image was replaced, False if it was already small enough
+
+    Raises:
+        OSError: If the stored image cannot be read
+    """
+    model = type(instance)
+    field_name, _sizes = RENDITION_FIELDS[model]
+    image = getattr(instance, field_name)
+    with image.open("rb"):
+        prepared = prepare_upload(image, max_dimension)
+    if prepared is None:
+        return False
+
+    storage = image.storage
+    old_name = image.name
+    new_name = storage.save(
+        str(PurePosixPath(old_name).with_name(prepared.name)),
+        prepared,
+    )
+    renditions_field = renditions_field_name(model)
+    renditions = getattr(instance, renditions_field)
+    try:
+        with transaction.atomic():
+            setattr(instance, field_name, new_name)
+            setattr(instance, renditions_field, {})
+            instance.save(update_fields=[field_name, renditions_field, "updated_at"])
+            transaction.on_commit(lambda: storage.delete(old_name))
+            transaction.on_commit(lambda: delete_renditions(storage, renditions))
+    except Exception:
+        storage.delete(new_name)
+        raise
+    return True
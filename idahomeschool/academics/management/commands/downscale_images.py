@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from idahomeschool.academics.image_ingest import downscale_stored_image
+from idahomeschool.academics.renditions import RENDITION_FIELDS
+
+
+class Command(BaseCommand):
+    help = (
+        "Downscale student photos and resource images stored before uploads "
+        "were downscaled, and queue their renditions again."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-dimension",
+            type=int,
+            default=settings.ACADEMICS_IMAGE_MAX_DIMENSION,
+            help=(
+                "Longest side to keep, in pixels "
+                f"(default: {settings.ACADEMICS_IMAGE_MAX_DIMENSION})"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        replaced = 0
+        for model, (field_name, _sizes) in RENDITION_FIELDS.items():
+            images = (
+                model.objects.exclude(**{field_name: ""})
+                .exclude(**{f"{field_name}__isnull": True})
+                .order_by("pk")
+            )
+            for instance in images.iterator(chunk_size=100):
+                name = getattr(instance, field_name).name
+                try:
+                    changed = downscale_stored_image(
+                        instance,
+                        options["max_dimension"],
+                    )
+                except OSError as exc:
+                    self.stderr.write(f"Could not downscale {name}: {exc}")
+                    continue
+                if changed:
+                    replaced += 1
+                    self.stdout.write(f"Downscaled {name}")
+
+        self.stdout.write(self.style.SUCCESS(f"Downscaled {replaced} images"))
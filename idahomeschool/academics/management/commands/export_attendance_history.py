@@ -0,0 +1,93 @@
+from datetime import date
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from idahomeschool.academics.history_export import attendance_history_rows
+from idahomeschool.academics.history_export import iter_csv
+from idahomeschool.academics.models import SchoolYear
+from idahomeschool.academics.models import Student
+
+
+class Command(BaseCommand):
+    help = "Export a user's daily logs and course notes as CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "username",
+            help="Username of the user whose history to export",
+        )
+        parser.add_argument(
+            "--student",
+            type=int,
+            help="Only export the student with this id",
+        )
+        parser.add_argument(
+            "--school-year",
+            type=int,
+            help="Only export logs within the school year with this id",
+        )
+        parser.add_argument(
+            "--start",
+            type=date.fromisoformat,
+            help="First date to export (YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--end",
+            type=date.fromisoformat,
+            help="Last date to export (YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--output",
+            help="File to write to instead of stdout",
+        )
+
+    def handle(self, *args, **options):
+        user_model = get_user_model()
+        try:
+            user = user_model.objects.get(username=options["username"])
+        except user_model.DoesNotExist as exc:
+            msg = f"User '{options['username']}' does not exist"
+            raise CommandError(msg) from exc
+
+        student = None
+        if options["student"]:
+            student = Student.objects.filter(pk=options["student"], user=user).first()
+            if student is None:
+                msg = f"Student {options['student']} does not exist"
+                raise CommandError(msg)
+
+        school_year = None
+        if options["school_year"]:
+            school_year = SchoolYear.objects.filter(
+                pk=options["school_year"],
+                user=user,
+            ).first()
+            if school_year is None:
+                msg = f"School year {options['school_year']} does not exist"
+                raise CommandError(msg)
+
+        rows = attendance_history_rows(
+            user,
+            student=student,
+            school_year=school_year,
+            start_date=options["start"],
+            end_date=options["end"],
+        )
+
+        if options["output"]:
+            path = Path(options["output"])
+            with path.open("w", newline="", encoding="utf-8") as output:
+                count = self._write(output.write, rows)
+            self.stderr.write(self.style.SUCCESS(f"Wrote {count} row(s) to {path}"))
+        else:
+            self._write(lambda line: self.stdout.write(line, ending=""), rows)
+
+    def _write(self, write, rows):
+        """Write CSV lines and return the number of rows after the header."""
+        count = 0
+        for count, line in enumerate(iter_csv(rows)):  # noqa: B007
+            write(line)
+        return count
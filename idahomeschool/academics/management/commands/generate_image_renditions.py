@@ -0,0 +1,49 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from idahomeschool.academics.renditions import generate_next_renditions
+from idahomeschool.academics.renditions import renditions_field_name
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate WebP/JPEG renditions of uploaded student photos and resource "
+        "images in the background."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once no image is waiting instead of polling for new ones",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait between polls when no image is waiting (default: 5)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            instance = generate_next_renditions()
+            if instance is None:
+                if options["once"]:
+                    return
+                time.sleep(options["interval"])
+                continue
+
+            renditions = getattr(instance, renditions_field_name(type(instance)))
+            if "error" in renditions:
+                self.stderr.write(
+                    f"Renditions of {renditions['source']} failed: "
+                    f"{renditions['error']}",
+                )
+            else:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Generated {len(renditions['images'])} renditions of "
+                        f"{renditions['source']}",
+                    ),
+                )
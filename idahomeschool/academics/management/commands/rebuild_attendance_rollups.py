@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from idahomeschool.academics.rollups import find_attendance_rollup_drift
+from idahomeschool.academics.rollups import rebuild_attendance_rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild the attendance rollup table from daily logs and report drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Only process the user with this username",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only report drift between rollups and daily logs; exit 1 if any",
+        )
+
+    def handle(self, *args, **options):
+        user = None
+        if options["user"]:
+            user_model = get_user_model()
+            try:
+                user = user_model.objects.get(username=options["user"])
+            except user_model.DoesNotExist as exc:
+                msg = f"User '{options['user']}' does not exist"
+                raise CommandError(msg) from exc
+
+        drift = find_attendance_rollup_drift(user=user)
+        for student_id, school_year_id, status_id, expected, actual in drift:
+            self.stdout.write(
+                f"student={student_id} school_year={school_year_id} "
+                f"status={status_id}: expected {expected}, found {actual}",
+            )
+
+        if options["check"]:
+            if drift:
+                msg = f"{len(drift)} attendance rollup row(s) out of date"
+                raise CommandError(msg)
+            self.stdout.write(self.style.SUCCESS("Attendance rollups are up to date"))
+            return
+
+        written = rebuild_attendance_rollups(user=user)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {written} attendance rollup row(s), "
+                f"fixed {len(drift)} drifted row(s)",
+            ),
+        )
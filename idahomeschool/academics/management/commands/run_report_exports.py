@@ -0,0 +1,46 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from idahomeschool.academics.exports import claim_next_export
+from idahomeschool.academics.exports import requeue_stale_exports
+from idahomeschool.academics.exports import run_report_export
+from idahomeschool.academics.models import ReportExport
+
+
+class Command(BaseCommand):
+    help = "Generate queued report exports (attendance PDFs) in the background."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty instead of polling for new jobs",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between polls of an empty queue (default: 2)",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            requeued = requeue_stale_exports()
+            if requeued:
+                self.stdout.write(f"Requeued {requeued} stale export(s)")
+
+            export = claim_next_export()
+            if export is None:
+                if options["once"]:
+                    return
+                time.sleep(options["interval"])
+                continue
+
+            export = run_report_export(export)
+            if export.status == ReportExport.STATUS_DONE:
+                self.stdout.write(
+                    self.style.SUCCESS(f"Generated {export.file.name}"),
+                )
+            else:
+                self.stderr.write(f"Export {export.pk} failed: {export.error}")
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_attendance_rollups(apps, schema_editor):
+    """Count existing daily logs into the new rollup table."""
+    AttendanceRollup = apps.get_model("academics", "AttendanceRollup")
+    DailyLog = apps.get_model("academics", "DailyLog")
+    SchoolYear = apps.get_model("academics", "SchoolYear")
+
+    rollups = []
+    for school_year in SchoolYear.objects.all():
+        rows = (
+            DailyLog.objects.filter(
+                user_id=school_year.user_id,
+                date__gte=school_year.start_date,
+                date__lte=school_year.end_date,
+            )
+            .values("student_id", "attendance_status_id")
+            .annotate(day_count=Count("id"))
+            .order_by()
+        )
+        rollups.extend(
+            AttendanceRollup(
+                user_id=school_year.user_id,
+                student_id=row["student_id"],
+                school_year_id=school_year.id,
+                attendance_status_id=row["attendance_status_id"],
+                day_count=row["day_count"],
+            )
+            for row in rows
+        )
+    AttendanceRollup.objects.bulk_create(rollups, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0015_add_resource_image'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('attendance_status', models.ForeignKey(blank=True, help_text='Empty for legacy logs without a custom attendance status', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='attendance_rollups', to='academics.attendancestatus')),
+                ('school_year', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_rollups', to='academics.schoolyear')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_rollups', to='academics.student')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Attendance Rollup',
+                'verbose_name_plural': 'Attendance Rollups',
+                'indexes': [models.Index(fields=['school_year', 'student'], name='academics_a_school__714a06_idx')],
+                'constraints': [models.UniqueConstraint(fields=('student', 'school_year', 'attendance_status'), name='unique_attendance_rollup', nulls_distinct=False)],
+            },
+        ),
+        migrations.RunPython(
+            populate_attendance_rollups,
+            reverse_code=migrations.RunPython.noop,
+        ),
+    ]
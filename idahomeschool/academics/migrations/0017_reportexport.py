@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:26
+
+import django.db.models.deletion
+import idahomeschool.academics.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0016_attendancerollup'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportExport',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('ATTENDANCE_PDF', 'Attendance Report PDF')], max_length=20)),
+                ('input_hash', models.CharField(help_text='SHA-256 of the rendered report source', max_length=64)),
+                ('filename', models.CharField(help_text='File name offered when downloading', max_length=255)),
+                ('source', models.TextField(blank=True, help_text='Rendered report source, cleared once the file is generated')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('DONE', 'Done'), ('FAILED', 'Failed')], default='PENDING', max_length=10)),
+                ('file', models.FileField(blank=True, upload_to=idahomeschool.academics.models.report_export_path)),
+                ('error', models.TextField(blank=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='report_exports', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Report Export',
+                'verbose_name_plural': 'Report Exports',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='academics_r_status_747fce_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'kind', 'input_hash'), name='unique_report_export')],
+            },
+        ),
+    ]
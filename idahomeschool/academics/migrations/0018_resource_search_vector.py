@@ -0,0 +1,71 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:30
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+# Title and author rank above publisher and description; the ISBN is indexed
+# digits-only so it matches with or without dashes.
+CREATE_TRIGGER = """
+CREATE FUNCTION academics_resource_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(NEW.author, '')), 'B')
+        || setweight(
+            to_tsvector('simple', regexp_replace(coalesce(NEW.isbn, ''), '[^0-9Xx]', '', 'g')),
+            'B'
+        )
+        || setweight(to_tsvector('english', coalesce(NEW.publisher, '')), 'C')
+        || setweight(to_tsvector('english', coalesce(NEW.description, '')), 'D');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER academics_resource_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, author, isbn, publisher, description, search_vector
+ON academics_resource
+FOR EACH ROW EXECUTE FUNCTION academics_resource_search_vector_update();
+
+UPDATE academics_resource SET search_vector = NULL;
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS academics_resource_search_vector_trigger ON academics_resource;
+DROP FUNCTION IF EXISTS academics_resource_search_vector_update();
+"""
+
+# pg_trgm powers the typo-tolerant fallback. Hosted databases that do not
+# ship it still get full-text search (see academics.search).
+CREATE_TRIGRAM_EXTENSION = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    END IF;
+END
+$$;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0017_reportexport'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resource',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='resource',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='resource_search_vector_idx'),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER, DROP_TRIGGER),
+        migrations.RunSQL(CREATE_TRIGRAM_EXTENSION, migrations.RunSQL.noop),
+    ]
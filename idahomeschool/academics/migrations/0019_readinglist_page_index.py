@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0018_resource_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='readinglist',
+            index=models.Index(fields=['user', '-updated_at', 'id'], name='academics_r_user_id_636e61_idx'),
+        ),
+    ]
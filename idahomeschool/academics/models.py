@@ -1,6 +1,8 @@
 import random
 
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
 
@@ -84,6 +86,8 @@ class Student(models.Model):
         null=True,
         help_text="Student photo (optional)",
     )
+    # Written by the rendition worker (see academics.renditions)
+    photo_renditions = models.JSONField(default=dict, blank=True, editable=False)
     paperless_tag_id = models.IntegerField(
         null=True,
         blank=True,
@@ -130,16 +134,31 @@ class Student(models.Model):
         )
 
     def get_grade_for_year(self, school_year):
-        """Get the grade level for a specific school year."""
+        """
+        Get the grade level for a specific school year.
+
+        Uses prefetched ``grade_years`` when present instead of querying; the
+        prefetch must not be filtered to other school years. To resolve the
+        grades of many students use ``student_grades.grades_for_students``.
+        """
         if not school_year:
             return None
 
-        try:
-            grade_year = self.grade_years.get(school_year=school_year)
-        except StudentGradeYear.DoesNotExist:
+        prefetched = getattr(self, "_prefetched_objects_cache", {}).get(
+            "grade_years",
+        )
+        if prefetched is not None:
+            for grade_year in prefetched:
+                if grade_year.school_year_id == school_year.pk:
+                    return grade_year.grade_level
             return None
-        else:
-            return grade_year.grade_level
+
+        grade_year = (
+            self.grade_years.filter(school_year=school_year)
+            .select_related("grade_level")
+            .first()
+        )
+        return grade_year.grade_level if grade_year else None
 
 
 class GradeLevel(models.Model):
@@ -559,11 +578,15 @@ class Resource(models.Model):
         null=True,
         help_text="Optional cover image or thumbnail",
     )
+    # Written by the rendition worker (see academics.renditions)
+    image_renditions = models.JSONField(default=dict, blank=True, editable=False)
     tags = models.ManyToManyField(
         Tag,
         blank=True,
         related_name="resources",
     )
+    # Maintained by a database trigger (see migration 0018_resource_search_vector)
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -573,6 +596,7 @@ class Resource(models.Model):
         verbose_name_plural = "Resources"
         indexes = [
             models.Index(fields=["user", "title"]),
+            GinIndex(fields=["search_vector"], name="resource_search_vector_idx"),
         ]
 
     def __str__(self):
@@ -808,6 +832,9 @@ class DailyLog(models.Model):
         ("FIELD_TRIP", "Field Trip"),
     ]
 
+    # Fields that decide which AttendanceRollup row a log is counted in
+    ROLLUP_FIELDS = ("user_id", "student_id", "date", "attendance_status_id")
+
     student = models.ForeignKey(
         Student,
         on_delete=models.CASCADE,
@@ -868,6 +895,73 @@ class DailyLog(models.Model):
         # Fallback for old status field during migration
         return self.status in ["PRESENT", "FIELD_TRIP"]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the persisted values so rollup signals can compute deltas
+        loaded = dict(zip(field_names, values, strict=True))
+        if all(name in loaded for name in cls.ROLLUP_FIELDS):
+            instance._rollup_key = tuple(  # noqa: SLF001
+                loaded[name] for name in cls.ROLLUP_FIELDS
+            )
+        return instance
+
+    @property
+    def rollup_key(self):
+        """Current values of ROLLUP_FIELDS as a tuple."""
+        return tuple(getattr(self, name) for name in self.ROLLUP_FIELDS)
+
+
+class AttendanceRollup(models.Model):
+    """Materialized count of a student's daily logs per status in a school year.
+
+    Kept current by the DailyLog signals in ``academics.signals`` and rebuilt
+    with the ``rebuild_attendance_rollups`` management command.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="attendance_rollups",
+    )
+    student = models.ForeignKey(
+        Student,
+        on_delete=models.CASCADE,
+        related_name="attendance_rollups",
+    )
+    school_year = models.ForeignKey(
+        SchoolYear,
+        on_delete=models.CASCADE,
+        related_name="attendance_rollups",
+    )
+    attendance_status = models.ForeignKey(
+        AttendanceStatus,
+        on_delete=models.CASCADE,
+        related_name="attendance_rollups",
+        null=True,
+        blank=True,
+        help_text="Empty for legacy logs without a custom attendance status",
+    )
+    day_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Attendance Rollup"
+        verbose_name_plural = "Attendance Rollups"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["student", "school_year", "attendance_status"],
+                name="unique_attendance_rollup",
+                nulls_distinct=False,
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["school_year", "student"]),
+        ]
+
+    def __str__(self):
+        return f"{self.student.name} - {self.school_year.name}: {self.day_count}"
+
 
 class CourseNote(models.Model):
     """Represents notes for a specific course enrollment on a specific day."""
@@ -1034,6 +1128,7 @@ class ReadingList(models.Model):
             models.Index(fields=["student", "status"]),
             models.Index(fields=["user", "status"]),
             models.Index(fields=["student", "school_year"]),
+            models.Index(fields=["user", "-updated_at", "id"]),
         ]
 
     def __str__(self):
@@ -1053,3 +1148,86 @@ class ReadingList(models.Model):
             "DID_NOT_FINISH": "warning",
         }
         return badge_map.get(self.status, "secondary")
+
+
+def report_export_path(instance, filename):
+    """Generate upload path for generated report files."""
+    # Store reports in: media/reports/<user_id>/<input_hash>_<filename>
+    return f"reports/{instance.user.id}/{instance.input_hash}_{filename}"
+
+
+class ReportExport(models.Model):
+    """A report file generated in the background by the run_report_exports worker.
+
+    Exports are keyed by a hash of the rendered report, so requesting an
+    unchanged report again reuses the finished file instead of queueing a
+    new job.
+    """
+
+    KIND_ATTENDANCE_PDF = "ATTENDANCE_PDF"
+    KIND_CHOICES = [
+        (KIND_ATTENDANCE_PDF, "Attendance Report PDF"),
+    ]
+
+    STATUS_PENDING = "PENDING"
+    STATUS_RUNNING = "RUNNING"
+    STATUS_DONE = "DONE"
+    STATUS_FAILED = "FAILED"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_DONE, "Done"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="report_exports",
+    )
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    input_hash = models.CharField(
+        max_length=64,
+        help_text="SHA-256 of the rendered report source",
+    )
+    filename = models.CharField(
+        max_length=255,
+        help_text="File name offered when downloading",
+    )
+    source = models.TextField(
+        blank=True,
+        help_text="Rendered report source, cleared once the file is generated",
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    file = models.FileField(upload_to=report_export_path, blank=True)
+    error = models.TextField(blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Report Export"
+        verbose_name_plural = "Report Exports"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "kind", "input_hash"],
+                name="unique_report_export",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} - {self.filename} ({self.status})"
+
+    @property
+    def is_finished(self):
+        """Returns True if the job will not change state without a retry."""
+        return self.status in (self.STATUS_DONE, self.STATUS_FAILED)
@@ -0,0 +1,134 @@
+"""Reading list statistics per student, cached in Django's cache."""
+
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models import Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from idahomeschool.academics.cache_versions import bump_version
+from idahomeschool.academics.cache_versions import get_version
+from idahomeschool.academics.models import ReadingList
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+# Months covered by the books-per-month series, including the current one
+MONTHS = 12
+
+
+def _version_key(user_id):
+    return f"academics:reading-stats:{user_id}:version"
+
+
+def _stats_key(user_id, version, student_id, month):
+    return (
+        f"academics:reading-stats:{user_id}:v{version}:"
+        f"{student_id or 'all'}:{month.isoformat()}"
+    )
+
+
+def invalidate_reading_stats(user_id):
+    """
+    Invalidate the cached reading statistics of all of a user's students.
+
+    Args:
+        user_id: Primary key of the user whose reading list or school years
+            changed
+    """
+    bump_version(_version_key(user_id))
+
+
+def _month_starts(today):
+    """First days of the last MONTHS months, oldest first."""
+    months = []
+    year, month = today.year, today.month
+    for _ in range(MONTHS):
+        months.append(today.replace(year=year, month=month, day=1))
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    return months[::-1]
+
+
+def _build_stats(user, student, today):
+    entries = ReadingList.objects.filter(user=user)
+    if student is not None:
+        entries = entries.filter(student=student)
+    # One grouped query; every statistic is a sum over its rows
+    rows = (
+        entries.order_by()
+        .values("status", "school_year__name", "school_year__start_date")
+        .annotate(
+            month=TruncMonth("completed_date"),
+            entries=Count("id"),
+            rating_total=Sum("rating"),
+            rated=Count("rating"),
+        )
+    )
+
+    status_counts = dict.fromkeys(
+        (status for status, _label in ReadingList.STATUS_CHOICES),
+        0,
+    )
+    months = _month_starts(today)
+    by_month = dict.fromkeys(months, 0)
+    by_year = {}
+    rating_total = rated = 0
+    for row in rows:
+        status_counts[row["status"]] += row["entries"]
+        rating_total += row["rating_total"] or 0
+        rated += row["rated"]
+        if row["status"] != "COMPLETED":
+            continue
+        year = (row["school_year__start_date"], row["school_year__name"])
+        by_year[year] = by_year.get(year, 0) + row["entries"]
+        if row["month"] in by_month:
+            by_month[row["month"]] += row["entries"]
+
+    # Books without a school year come last
+    completed_by_year = [
+        (name, count)
+        for (_start, name), count in sorted(
+            by_year.items(),
+            key=lambda item: (item[0][0] is None, item[0][0]),
+        )
+    ]
+    return {
+        "status_counts": status_counts,
+        "total": sum(status_counts.values()),
+        "average_rating": round(rating_total / rated, 1) if rated else None,
+        "completed_by_year": completed_by_year,
+        "completed_by_month": list(by_month.items()),
+        "books_per_month": round(sum(by_month.values()) / MONTHS, 1),
+    }
+
+
+def get_reading_stats(user, student=None, today=None):
+    """
+    Get reading list statistics for one student or a whole household.
+
+    Computed in one grouped query and cached per student (and per month,
+    as the monthly series ends with the current month); the cache entries
+    are invalidated whenever one of the user's reading list entries or
+    school years is saved or deleted (see academics.signals).
+
+    Args:
+        user: Owner of the reading list
+        student: Student to summarize, or None for all of the user's students
+        today: Date the monthly series ends on (defaults to the local date)
+
+    Returns:
+        Dict with ``status_counts`` (entries per status code), ``total``,
+        ``average_rating`` (None without ratings), ``completed_by_year``
+        (list of (school year name or None, count)), ``completed_by_month``
+        (list of (first day of month, count) for the last MONTHS months) and
+        ``books_per_month`` (average completions over those months)
+    """
+    today = today or timezone.localdate()
+    month = today.replace(day=1)
+    student_id = student.pk if student is not None else None
+    version = get_version(_version_key(user.pk))
+    key = _stats_key(user.pk, version, student_id, month)
+    stats = cache.get(key)
+    if stats is None:
+        stats = _build_stats(user, student, today)
+        cache.set(key, stats, CACHE_TIMEOUT)
+    return stats
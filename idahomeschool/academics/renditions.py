@@ -0,0 +1,249 @@
+"""Smaller WebP/JPEG renditions of uploaded images (see generate_image_renditions)."""
+
+import logging
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image
+from PIL import ImageOps
+
+from idahomeschool.academics.models import Resource
+from idahomeschool.academics.models import Student
+
+logger = logging.getLogger(__name__)
+
+# Image field of each model and the sizes of the shorter side to render.
+# Avatars are shown at up to 80px and covers at up to ~350px, at 1x and 2x.
+RENDITION_FIELDS = {
+    Student: ("photo", (64, 128, 256)),
+    Resource: ("image", (64, 128, 256, 512)),
+}
+
+FORMATS = {
+    "webp": {"format": "WEBP", "quality": 80, "method": 4},
+    "jpeg": {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True},
+}
+
+# Pixel densities offered in srcset
+DENSITIES = (1, 2)
+
+
+def renditions_field_name(model):
+    """Get the name of the field holding a model's image renditions."""
+    return f"{RENDITION_FIELDS[model][0]}_renditions"
+
+
+def flatten_to_rgb(img):
+    """
+    Convert an image to RGB, putting transparent parts on white.
+
+    Args:
+        img: PIL Image in any mode
+
+    Returns:
+        PIL Image in RGB mode
+    """
+    # Convert RGBA to RGB if necessary (for PNG with transparency)
+    if img.mode in ("RGBA", "LA", "P"):
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        img = img.convert("RGBA")
+        background.paste(img, mask=img.split()[-1])
+        return background
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    return img
+
+
+def decode_reduced(img, size):
+    """
+    Decode an opened image at a reduced scale and apply its EXIF orientation.
+
+    JPEGs are decoded at 1/2, 1/4 or 1/8 scale with ``draft()`` when that
+    still leaves at least ``size``, so a large photo is never decoded in
+    full; other formats are decoded as they are.
+
+    Args:
+        img: PIL Image straight from ``Image.open`` (not loaded yet)
+        size: Smallest (width, height) needed, in the stored orientation
+
+    Returns:
+        Loaded PIL Image, upright
+    """
+    img.draft(None, size)
+    return ImageOps.exif_transpose(img)
+
+
+def scaled_size(size, scale):
+    """Scale a (width, height) size, keeping both sides at least 1px."""
+    width, height = size
+    return (max(1, round(width * scale)), max(1, round(height * scale)))
+
+
+def _encode(img, image_format):
+    if image_format == "jpeg":
+        img = flatten_to_rgb(img)
+    elif img.mode not in ("RGB", "RGBA"):
+        # WebP keeps transparency
+        img = img.convert("RGBA")
+    buffer = BytesIO()
+    img.save(buffer, **FORMATS[image_format])
+    return buffer.getvalue()
+
+
+def generate_renditions(image, sizes):
+    """
+    Write renditions of an image next to it, with the image's storage.
+
+    Sizes at or above the original's shorter side are replaced by a single
+    rendition at the original size, so images are never upscaled. JPEGs are
+    only decoded at the scale the largest rendition needs.
+
+    Args:
+        image: FieldFile of the original image
+        sizes: Sizes of the shorter side to render, in pixels
+
+    Returns:
+        Dict to store in the model's renditions field
+    """
+    path = PurePosixPath(image.name)
+    with image.open("rb"), Image.open(image) as original:
+        stored_width, stored_height = original.size
+        largest = max(sizes) / min(original.size)
+        current = decode_reduced(original, scaled_size(original.size, largest))
+        width, height = current.size
+        shorter = min(width, height)
+
+        images = []
+        # Largest first, so each size is downscaled from the previous one
+        for size in sorted({min(size, shorter) for size in sizes}, reverse=True):
+            current = current.resize(
+                scaled_size((width, height), size / shorter),
+                Image.Resampling.LANCZOS,
+            )
+            for image_format in FORMATS:
+                name = image.storage.save(
+                    str(path.with_name(f"{path.stem}_{size}.{image_format}")),
+                    ContentFile(_encode(current, image_format)),
+                )
+                images.append({"size": size, "format": image_format, "name": name})
+
+    return {
+        "source": image.name,
+        "width": stored_width,
+        "height": stored_height,
+        "images": images,
+    }
+
+
+def delete_renditions(storage, renditions):
+    """
+    Delete the files of stored renditions.
+
+    Args:
+        storage: Storage the renditions were written to
+        renditions: Value of a model's renditions field
+    """
+    for rendition in renditions.get("images", []):
+        storage.delete(rendition["name"])
+
+
+def pending_images(model):
+    """
+    Get the rows of a model whose image has no renditions yet.
+
+    Args:
+        model: Student or Resource
+
+    Returns:
+        QuerySet of the waiting rows
+    """
+    field_name, _sizes = RENDITION_FIELDS[model]
+    return (
+        model.objects.exclude(**{field_name: ""})
+        .exclude(**{f"{field_name}__isnull": True})
+        .filter(**{renditions_field_name(model): {}})
+    )
+
+
+def generate_next_renditions():
+    """
+    Generate the renditions of the oldest image that has none.
+
+    Rows locked by other workers are skipped, so several workers can share
+    the work. Failures are recorded on the row instead of retried; the image
+    is then shown at its original size until it is replaced.
+
+    Returns:
+        The updated Student or Resource, or None if no image is waiting
+    """
+    for model, (field_name, sizes) in RENDITION_FIELDS.items():
+        with transaction.atomic():
+            instance = (
+                pending_images(model)
+                .select_for_update(skip_locked=True)
+                .order_by("pk")
+                .first()
+            )
+            if instance is None:
+                continue
+
+            image = getattr(instance, field_name)
+            try:
+                renditions = generate_renditions(image, sizes)
+            except Exception as exc:
+                logger.exception("Renditions of %s failed", image.name)
+                renditions = {"source": image.name, "error": str(exc)}
+
+            setattr(instance, renditions_field_name(model), renditions)
+            # A regular save, so cached pages showing the image are invalidated
+            instance.save(update_fields=[renditions_field_name(model), "updated_at"])
+        return instance
+    return None
+
+
+def image_sources(image, size):
+    """
+    Pick the smallest adequate renditions to show an image at.
+
+    Falls back to the original image until the worker has generated the
+    renditions of its current file.
+
+    Args:
+        image: FieldFile of a Student photo or Resource image
+        size: Displayed size of the image's shorter side, in CSS pixels
+
+    Returns:
+        Dict with ``src`` (the URL for a 1x display) and ``webp_srcset`` and
+        ``jpeg_srcset`` (empty when there are no renditions)
+    """
+    renditions = getattr(image.instance, f"{image.field.name}_renditions", None)
+    renditions = renditions or {}
+    images = renditions.get("images") if renditions.get("source") == image.name else []
+    if not images:
+        return {"src": image.url, "webp_srcset": "", "jpeg_srcset": ""}
+
+    sources = {}
+    for image_format in FORMATS:
+        candidates = sorted(
+            (rendition for rendition in images if rendition["format"] == image_format),
+            key=lambda rendition: rendition["size"],
+        )
+        picks = []
+        for density in DENSITIES:
+            pick = next(
+                (c for c in candidates if c["size"] >= size * density),
+                candidates[-1],
+            )
+            if not picks or picks[-1][0] != pick["name"]:
+                picks.append((pick["name"], density))
+        sources[image_format] = [
+            (image.storage.url(name), density) for name, density in picks
+        ]
+
+    return {
+        "src": sources["jpeg"][0][0],
+        "webp_srcset": ", ".join(f"{url} {d}x" for url, d in sources["webp"]),
+        "jpeg_srcset": ", ".join(f"{url} {d}x" for url, d in sources["jpeg"]),
+    }
@@ -0,0 +1,80 @@
+"""Attendance report aggregation shared by the report views."""
+
+from django.db.models import Count
+
+from idahomeschool.academics.models import AttendanceRollup
+from idahomeschool.academics.models import DailyLog
+
+
+def build_attendance_report(students, attendance_statuses, school_year=None):
+    """
+    Build attendance statistics for a set of students.
+
+    All counts come from a single query, so the number of queries does not
+    grow with the number of students or statuses. Reports for a school year
+    read the AttendanceRollup table; reports across all years group the
+    DailyLog rows by student and attendance status.
+
+    Args:
+        students: Iterable of Student instances to report on
+        attendance_statuses: Iterable of the user's AttendanceStatus instances
+        school_year: Optional SchoolYear used to limit the date range
+
+    Returns:
+        List of dicts (one per student, in the given order) with the keys
+        ``student``, ``total_days``, ``instructional_days`` and
+        ``status_counts`` (keyed by status code)
+    """
+    students = list(students)
+    attendance_statuses = list(attendance_statuses)
+    if not students:
+        return []
+
+    if school_year:
+        # Read the materialized per-year counts kept by academics.signals
+        rows = AttendanceRollup.objects.filter(
+            school_year=school_year,
+            student__in=students,
+        ).values("student_id", "attendance_status_id", "day_count")
+    else:
+        rows = (
+            DailyLog.objects.filter(student__in=students)
+            .values("student_id", "attendance_status_id")
+            .annotate(day_count=Count("id"))
+            .order_by()
+        )
+
+    # Log counts keyed by student id, then attendance status id
+    counts = {}
+    for row in rows:
+        student_counts = counts.setdefault(row["student_id"], {})
+        student_counts[row["attendance_status_id"]] = row["day_count"]
+
+    report_data = []
+    for student in students:
+        student_counts = counts.get(student.id, {})
+
+        status_counts = {}
+        instructional_days = 0
+        for status in attendance_statuses:
+            count = student_counts.get(status.id, 0)
+            status_counts[status.code] = {
+                "count": count,
+                "label": status.label,
+                "abbreviation": status.abbreviation,
+                "color": status.color,
+            }
+            if status.is_instructional:
+                instructional_days += count
+
+        report_data.append(
+            {
+                "student": student,
+                # Includes legacy logs without an attendance status
+                "total_days": sum(student_counts.values()),
+                "instructional_days": instructional_days,
+                "status_counts": status_counts,
+            },
+        )
+
+    return report_data
@@ -0,0 +1,260 @@
+"""Maintenance of the materialized AttendanceRollup table."""
+
+from django.db import IntegrityError
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import F
+
+from idahomeschool.academics.models import AttendanceRollup
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.models import SchoolYear
+
+
+def _school_year_ids_containing(user_id, log_date):
+    """Return ids of the user's school years whose date range includes a date."""
+    return list(
+        SchoolYear.objects.filter(
+            user_id=user_id,
+            start_date__lte=log_date,
+            end_date__gte=log_date,
+        ).values_list("id", flat=True),
+    )
+
+
+def _adjust_rollup(school_year_id, rollup_key, delta):
+    """Add ``delta`` to the rollup row for a log key in one school year."""
+    user_id, student_id, _log_date, attendance_status_id = rollup_key
+    rollups = AttendanceRollup.objects.filter(
+        student_id=student_id,
+        school_year_id=school_year_id,
+        attendance_status_id=attendance_status_id,
+    )
+    if rollups.update(day_count=F("day_count") + delta) or delta < 0:
+        return
+
+    try:
+        with transaction.atomic():
+            AttendanceRollup.objects.create(
+                user_id=user_id,
+                student_id=student_id,
+                school_year_id=school_year_id,
+                attendance_status_id=attendance_status_id,
+                day_count=delta,
+            )
+    except IntegrityError:
+        # Another request created the row first
+        rollups.update(day_count=F("day_count") + delta)
+
+
+def record_daily_log_change(previous_key, current_key):
+    """
+    Apply a DailyLog change to the rollup table.
+
+    Args:
+        previous_key: DailyLog.rollup_key as persisted before the change,
+            or None if the log did not exist
+        current_key: DailyLog.rollup_key after the change, or None if the
+            log was deleted
+    """
+    if previous_key == current_key:
+        return
+
+    school_years_by_date = {}
+    for key, delta in ((previous_key, -1), (current_key, 1)):
+        if key is None:
+            continue
+        user_id, _student_id, log_date, _status_id = key
+        if log_date not in school_years_by_date:
+            school_years_by_date[log_date] = _school_year_ids_containing(
+                user_id,
+                log_date,
+            )
+        for school_year_id in school_years_by_date[log_date]:
+            _adjust_rollup(school_year_id, key, delta)
+
+
+def _rollup_deltas(changes):
+    """Sum non-zero deltas per (school_year_id, user_id, student_id, status_id)."""
+    user_ids = {key[0] for pair in changes for key in pair if key is not None}
+    school_years = list(
+        SchoolYear.objects.filter(user_id__in=user_ids).values_list(
+            "id",
+            "user_id",
+            "start_date",
+            "end_date",
+        ),
+    )
+
+    deltas = {}
+    for previous_key, current_key in changes:
+        for key, delta in ((previous_key, -1), (current_key, 1)):
+            if key is None:
+                continue
+            user_id, student_id, log_date, status_id = key
+            for school_year_id, year_user_id, start_date, end_date in school_years:
+                if year_user_id == user_id and start_date <= log_date <= end_date:
+                    rollup = (school_year_id, user_id, student_id, status_id)
+                    deltas[rollup] = deltas.get(rollup, 0) + delta
+    return {rollup: delta for rollup, delta in deltas.items() if delta}
+
+
+def record_daily_log_changes(changes):
+    """
+    Apply a batch of DailyLog changes to the rollup table.
+
+    Used for bulk writes that bypass model signals. Deltas are summed per
+    rollup row first, so each row is updated at most once.
+
+    Args:
+        changes: Iterable of ``(previous_key, current_key)`` pairs as taken
+            by record_daily_log_change
+    """
+    changes = [
+        (previous, current) for previous, current in changes if previous != current
+    ]
+    if not changes:
+        return
+
+    deltas = _rollup_deltas(changes)
+    if not deltas:
+        return
+
+    existing = set(
+        AttendanceRollup.objects.filter(
+            school_year_id__in={rollup[0] for rollup in deltas},
+            student_id__in={rollup[2] for rollup in deltas},
+        ).values_list(
+            "school_year_id",
+            "user_id",
+            "student_id",
+            "attendance_status_id",
+        ),
+    )
+
+    # Rows that do not exist yet are inserted together
+    missing = {
+        rollup: delta
+        for rollup, delta in deltas.items()
+        if delta > 0 and rollup not in existing
+    }
+    try:
+        with transaction.atomic():
+            AttendanceRollup.objects.bulk_create(
+                AttendanceRollup(
+                    user_id=user_id,
+                    student_id=student_id,
+                    school_year_id=school_year_id,
+                    attendance_status_id=status_id,
+                    day_count=delta,
+                )
+                for (school_year_id, user_id, student_id, status_id), delta in (
+                    missing.items()
+                )
+            )
+    except IntegrityError:
+        # Another request created some of the rows first
+        missing = {}
+
+    for rollup, delta in deltas.items():
+        if rollup not in missing:
+            school_year_id, user_id, student_id, status_id = rollup
+            rollup_key = (user_id, student_id, None, status_id)
+            _adjust_rollup(school_year_id, rollup_key, delta)
+
+
+def _expected_rollup_counts(school_years, student=None):
+    """Count DailyLogs per (student, school year, status) straight from the logs."""
+    counts = {}
+    for school_year in school_years:
+        logs = DailyLog.objects.filter(
+            user_id=school_year.user_id,
+            date__gte=school_year.start_date,
+            date__lte=school_year.end_date,
+        )
+        if student is not None:
+            logs = logs.filter(student=student)
+        for row in (
+            logs.values("student_id", "attendance_status_id")
+            .annotate(day_count=Count("id"))
+            .order_by()
+        ):
+            key = (row["student_id"], school_year.id, row["attendance_status_id"])
+            counts[key] = (school_year.user_id, row["day_count"])
+    return counts
+
+
+def _school_years_for(user=None, school_year=None, student=None):
+    school_years = SchoolYear.objects.all()
+    if user is not None:
+        school_years = school_years.filter(user=user)
+    if school_year is not None:
+        school_years = school_years.filter(pk=school_year.pk)
+    if student is not None:
+        school_years = school_years.filter(user_id=student.user_id)
+    return list(school_years)
+
+
+def rebuild_attendance_rollups(user=None, school_year=None, student=None):
+    """
+    Recompute rollup rows from DailyLog, replacing any existing rows.
+
+    Args:
+        user: Optional user to limit the rebuild to
+        school_year: Optional SchoolYear to limit the rebuild to
+        student: Optional Student to limit the rebuild to
+
+    Returns:
+        Number of rollup rows written
+    """
+    school_years = _school_years_for(user, school_year, student)
+    expected = _expected_rollup_counts(school_years, student)
+
+    with transaction.atomic():
+        existing = AttendanceRollup.objects.filter(school_year__in=school_years)
+        if student is not None:
+            existing = existing.filter(student=student)
+        existing.delete()
+        AttendanceRollup.objects.bulk_create(
+            [
+                AttendanceRollup(
+                    user_id=user_id,
+                    student_id=student_id,
+                    school_year_id=school_year_id,
+                    attendance_status_id=attendance_status_id,
+                    day_count=day_count,
+                )
+                for (
+                    (student_id, school_year_id, attendance_status_id),
+                    (user_id, day_count),
+                ) in expected.items()
+            ],
+            batch_size=1000,
+        )
+    return len(expected)
+
+
+def find_attendance_rollup_drift(user=None, school_year=None):
+    """
+    Compare rollup rows with live DailyLog counts.
+
+    Returns:
+        List of ``(student_id, school_year_id, attendance_status_id,
+        expected, actual)`` tuples for every mismatched row
+    """
+    school_years = _school_years_for(user, school_year)
+    expected = {
+        key: day_count
+        for key, (_user_id, day_count) in _expected_rollup_counts(
+            school_years,
+        ).items()
+    }
+    actual = {
+        (row.student_id, row.school_year_id, row.attendance_status_id): row.day_count
+        for row in AttendanceRollup.objects.filter(school_year__in=school_years)
+        if row.day_count
+    }
+    return [
+        (*key, expected.get(key, 0), actual.get(key, 0))
+        for key in sorted(expected.keys() | actual.keys(), key=str)
+        if expected.get(key, 0) != actual.get(key, 0)
+    ]
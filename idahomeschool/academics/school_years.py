@@ -0,0 +1,75 @@
+"""Per-user active school year lookups cached in Django's cache."""
+
+from django.core.cache import cache
+
+from idahomeschool.academics.cache_versions import bump_version
+from idahomeschool.academics.cache_versions import get_version
+from idahomeschool.academics.models import SchoolYear
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+# Cached in place of None, which the cache cannot tell apart from a miss
+_NO_ACTIVE_YEAR = "none"
+
+_REQUEST_ATTRIBUTE = "_academics_active_school_year"
+
+
+def _version_key(user_id):
+    return f"academics:active-school-year:{user_id}:version"
+
+
+def _active_year_key(user_id, version):
+    return f"academics:active-school-year:{user_id}:v{version}"
+
+
+def invalidate_active_school_year(user_id):
+    """
+    Invalidate the cached active school year for a user.
+
+    Args:
+        user_id: Primary key of the user whose school years changed
+    """
+    bump_version(_version_key(user_id))
+
+
+def get_active_school_year(user):
+    """
+    Get a user's active school year.
+
+    The result is cached per user; the cache entry is invalidated whenever
+    one of the user's school years is saved or deleted (see academics.signals).
+
+    Args:
+        user: User whose active school year to look up
+
+    Returns:
+        The active SchoolYear, or None if no year is active
+    """
+    version = get_version(_version_key(user.pk))
+    key = _active_year_key(user.pk, version)
+    school_year = cache.get(key)
+    if school_year is None:
+        school_year = (
+            SchoolYear.objects.filter(user=user, is_active=True).first()
+            or _NO_ACTIVE_YEAR
+        )
+        cache.set(key, school_year, CACHE_TIMEOUT)
+    return None if school_year == _NO_ACTIVE_YEAR else school_year
+
+
+def get_request_active_school_year(request):
+    """
+    Get the active school year of the requesting user.
+
+    Resolved at most once per request (and usually from the cache), so
+    views, forms and helpers can all call this freely.
+
+    Args:
+        request: HttpRequest with an authenticated user
+
+    Returns:
+        The active SchoolYear, or None if no year is active
+    """
+    if not hasattr(request, _REQUEST_ATTRIBUTE):
+        setattr(request, _REQUEST_ATTRIBUTE, get_active_school_year(request.user))
+    return getattr(request, _REQUEST_ATTRIBUTE)
@@ -0,0 +1,89 @@
+"""Ranked full-text search over the resource library."""
+
+import re
+from functools import cache
+
+from django.contrib.postgres.search import SearchQuery
+from django.contrib.postgres.search import SearchRank
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+# Minimum word similarity for a typo-tolerant match
+TRIGRAM_THRESHOLD = 0.3
+
+_ISBN_RE = re.compile(r"^[\d\s-]+[\dXx]?$")
+
+
+@cache
+def trigram_search_available():
+    """Return True if the pg_trgm extension is installed in the database."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def build_search_query(text):
+    """
+    Build a prefix-matching full-text query from user input.
+
+    Every word must match the start of an indexed word, so results narrow
+    while the user is still typing. ISBNs match with or without dashes.
+
+    Args:
+        text: Raw search box input
+
+    Returns:
+        SearchQuery, or None if the input has no searchable words
+    """
+    if _ISBN_RE.match(text.strip()) and any(c.isdigit() for c in text):
+        words = [re.sub(r"[^\dXx]", "", text)]
+        config = "simple"
+    else:
+        words = re.findall(r"\w+", text)
+        config = "english"
+    if not words:
+        return None
+    raw = " & ".join(f"{word}:*" for word in words)
+    return SearchQuery(raw, search_type="raw", config=config)
+
+
+def search_resources(queryset, text):
+    """
+    Filter and rank resources by a search string.
+
+    Matches against the trigger-maintained ``search_vector`` (title and
+    author weigh more than publisher and description), best matches first.
+    If nothing matches and pg_trgm is installed, falls back to trigram
+    similarity on title and author to tolerate typos.
+
+    Args:
+        queryset: Resource queryset to search within
+        text: Raw search box input
+
+    Returns:
+        Ordered Resource queryset
+    """
+    query = build_search_query(text)
+    if query is None:
+        return queryset.none()
+
+    results = (
+        queryset.filter(search_vector=query)
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "title")
+    )
+    if not trigram_search_available() or results.exists():
+        return results
+
+    return (
+        queryset.annotate(
+            similarity=Greatest(
+                TrigramWordSimilarity(text, "title"),
+                TrigramWordSimilarity(text, "author"),
+            ),
+        )
+        .filter(similarity__gte=TRIGRAM_THRESHOLD)
+        .order_by("-similarity", "title")
+    )
@@ -0,0 +1,243 @@
+"""Signal handlers keeping derived academics data in sync."""
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed
+from django.db.models.signals import post_delete
+from django.db.models.signals import post_save
+from django.db.models.signals import pre_save
+from django.dispatch import receiver
+
+from idahomeschool.academics.conditional import invalidate_data_version
+from idahomeschool.academics.course_options import invalidate_course_options
+from idahomeschool.academics.dashboard import invalidate_dashboard
+from idahomeschool.academics.image_ingest import prepare_upload
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.models import Color
+from idahomeschool.academics.models import ColorPalette
+from idahomeschool.academics.models import Course
+from idahomeschool.academics.models import CourseEnrollment
+from idahomeschool.academics.models import CourseTemplate
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.models import GradeLevel
+from idahomeschool.academics.models import ReadingList
+from idahomeschool.academics.models import Resource
+from idahomeschool.academics.models import SchoolYear
+from idahomeschool.academics.models import Student
+from idahomeschool.academics.models import StudentGradeYear
+from idahomeschool.academics.models import Tag
+from idahomeschool.academics.reading_stats import invalidate_reading_stats
+from idahomeschool.academics.renditions import RENDITION_FIELDS
+from idahomeschool.academics.renditions import delete_renditions
+from idahomeschool.academics.renditions import renditions_field_name
+from idahomeschool.academics.rollups import rebuild_attendance_rollups
+from idahomeschool.academics.rollups import record_daily_log_change
+from idahomeschool.academics.school_years import invalidate_active_school_year
+from idahomeschool.academics.status_registry import invalidate_attendance_statuses
+from idahomeschool.academics.tag_index import invalidate_tag_index
+
+
+@receiver(post_save, sender=DailyLog)
+def update_rollup_on_daily_log_save(sender, instance, created, raw, **kwargs):
+    """Move the log's count to its new rollup row after a save."""
+    if raw:
+        return
+
+    if created:
+        record_daily_log_change(None, instance.rollup_key)
+    elif hasattr(instance, "_rollup_key"):
+        record_daily_log_change(instance._rollup_key, instance.rollup_key)  # noqa: SLF001
+    else:
+        # Previous values are unknown (instance was not loaded from the db)
+        rebuild_attendance_rollups(student=instance.student)
+    instance._rollup_key = instance.rollup_key  # noqa: SLF001
+
+
+@receiver(post_delete, sender=DailyLog)
+def update_rollup_on_daily_log_delete(sender, instance, **kwargs):
+    """Remove a deleted log from its rollup row."""
+    previous_key = getattr(instance, "_rollup_key", instance.rollup_key)
+    record_daily_log_change(previous_key, None)
+
+
+@receiver(pre_save, sender=SchoolYear)
+def remember_school_year_dates(sender, instance, raw, **kwargs):
+    """Store the persisted date range so post_save can tell if it changed."""
+    if raw or not instance.pk:
+        return
+    instance._previous_date_range = (  # noqa: SLF001
+        SchoolYear.objects.filter(pk=instance.pk)
+        .values_list("start_date", "end_date")
+        .first()
+    )
+
+
+@receiver(post_save, sender=SchoolYear)
+def rebuild_rollups_on_school_year_save(sender, instance, created, raw, **kwargs):
+    """Recount a school year's rollups when its date range changes."""
+    if raw:
+        return
+    previous = getattr(instance, "_previous_date_range", None)
+    if created or previous != (instance.start_date, instance.end_date):
+        rebuild_attendance_rollups(school_year=instance)
+
+
+@receiver(post_save, sender=SchoolYear)
+@receiver(post_delete, sender=SchoolYear)
+def invalidate_cached_active_school_year(sender, instance, **kwargs):
+    """Drop the user's cached active school year once the change is committed."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_active_school_year(user_id))
+
+
+@receiver(post_save, sender=AttendanceStatus)
+@receiver(post_delete, sender=AttendanceStatus)
+def invalidate_cached_attendance_statuses(sender, instance, **kwargs):
+    """Drop the user's cached status registry once the change is committed."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_attendance_statuses(user_id))
+
+
+@receiver(post_save, sender=DailyLog)
+@receiver(post_delete, sender=DailyLog)
+@receiver(post_save, sender=CourseEnrollment)
+@receiver(post_delete, sender=CourseEnrollment)
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+@receiver(post_save, sender=CourseTemplate)
+@receiver(post_delete, sender=CourseTemplate)
+@receiver(post_save, sender=SchoolYear)
+@receiver(post_delete, sender=SchoolYear)
+@receiver(post_save, sender=AttendanceStatus)
+@receiver(post_delete, sender=AttendanceStatus)
+def invalidate_cached_dashboard(sender, instance, **kwargs):
+    """Drop the user's cached dashboard summary once the change is committed."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_dashboard(user_id))
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+@receiver(post_save, sender=GradeLevel)
+@receiver(post_delete, sender=GradeLevel)
+def invalidate_cached_course_options(sender, instance, **kwargs):
+    """Drop the user's cached course options when a course or grade level changes."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_course_options(user_id))
+
+
+@receiver(post_save, sender=ReadingList)
+@receiver(post_delete, sender=ReadingList)
+@receiver(post_save, sender=SchoolYear)
+@receiver(post_delete, sender=SchoolYear)
+def invalidate_cached_reading_stats(sender, instance, **kwargs):
+    """Drop the user's cached reading statistics when an entry or year changes."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_reading_stats(user_id))
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=Resource)
+def invalidate_cached_tag_index(sender, instance, **kwargs):
+    """Drop the user's tag index when a tag or a tagged resource changes."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_tag_index(user_id))
+
+
+@receiver(m2m_changed, sender=Resource.tags.through)
+def invalidate_cached_tag_index_on_tagging(sender, instance, action, **kwargs):
+    """Drop the user's tag index when tags are added to or removed from resources."""
+    if not action.startswith("post_"):
+        return
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_tag_index(user_id))
+
+
+@receiver(pre_save, sender=Student)
+@receiver(pre_save, sender=Resource)
+def downscale_image_upload(sender, instance, raw, **kwargs):
+    """Store a new image upload downscaled and upright (see prepare_upload)."""
+    if raw:
+        return
+    field_name = RENDITION_FIELDS[sender][0]
+    image = getattr(instance, field_name)
+    if image and not image._committed:  # noqa: SLF001
+        prepared = prepare_upload(image.file)
+        if prepared is not None:
+            setattr(instance, field_name, prepared)
+
+
+@receiver(pre_save, sender=Student)
+@receiver(pre_save, sender=Resource)
+def reset_image_renditions(sender, instance, raw, **kwargs):
+    """Drop the renditions of a replaced or removed image, so the worker redoes them."""
+    if raw:
+        return
+    image = getattr(instance, RENDITION_FIELDS[sender][0])
+    # A new upload is not committed to storage until the field's pre_save
+    if image and image._committed:  # noqa: SLF001
+        return
+    field_name = renditions_field_name(sender)
+    renditions = getattr(instance, field_name)
+    if renditions:
+        setattr(instance, field_name, {})
+        storage = image.storage
+        transaction.on_commit(lambda: delete_renditions(storage, renditions))
+
+
+@receiver(post_delete, sender=Student)
+@receiver(post_delete, sender=Resource)
+def delete_image_renditions(sender, instance, **kwargs):
+    """Delete the rendition files of a deleted row's image."""
+    renditions = getattr(instance, renditions_field_name(sender))
+    if renditions:
+        storage = getattr(instance, RENDITION_FIELDS[sender][0]).storage
+        transaction.on_commit(lambda: delete_renditions(storage, renditions))
+
+
+# Models whose data versions answer conditional GETs (see academics.conditional)
+VERSIONED_MODELS = (
+    Color,
+    ColorPalette,
+    Course,
+    CourseEnrollment,
+    CourseTemplate,
+    GradeLevel,
+    ReadingList,
+    Resource,
+    SchoolYear,
+    Student,
+    StudentGradeYear,
+    Tag,
+)
+
+
+def invalidate_cached_data_version(sender, instance, **kwargs):
+    """Bump the user's data version of the model once the change is committed."""
+    user_id = instance.user_id
+    transaction.on_commit(lambda: invalidate_data_version(user_id, sender))
+
+
+def invalidate_cached_data_version_on_m2m(sender, instance, action, model, **kwargs):
+    """Bump the data versions of both sides of a changed many-to-many relation."""
+    if not action.startswith("post_"):
+        return
+    user_id = instance.user_id
+    models = (type(instance), model)
+    transaction.on_commit(lambda: invalidate_data_version(user_id, *models))
+
+
+for versioned_model in VERSIONED_MODELS:
+    post_save.connect(invalidate_cached_data_version, sender=versioned_model)
+    post_delete.connect(invalidate_cached_data_version, sender=versioned_model)
+
+for relation in (
+    Student.school_years,
+    Color.palettes,
+    Resource.tags,
+    CourseTemplate.suggested_resources,
+    Course.resources,
+):
+    m2m_changed.connect(invalidate_cached_data_version_on_m2m, sender=relation.through)
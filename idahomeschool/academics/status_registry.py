@@ -0,0 +1,91 @@
+"""Per-user attendance status lookups cached in Django's cache."""
+
+from django.core.cache import cache
+
+from idahomeschool.academics.cache_versions import bump_version
+from idahomeschool.academics.cache_versions import get_version
+from idahomeschool.academics.models import AttendanceStatus
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _version_key(user_id):
+    return f"academics:attendance-statuses:{user_id}:version"
+
+
+def _statuses_key(user_id, version):
+    return f"academics:attendance-statuses:{user_id}:v{version}"
+
+
+def invalidate_attendance_statuses(user_id):
+    """
+    Invalidate the cached statuses for a user.
+
+    The version number is part of the cache key, so bumping it makes every
+    process miss on its next lookup without having to delete entries.
+
+    Args:
+        user_id: Primary key of the user whose statuses changed
+    """
+    bump_version(_version_key(user_id))
+
+
+class AttendanceStatusRegistry:
+    """Read-only lookups over one user's attendance statuses."""
+
+    def __init__(self, statuses):
+        self._statuses = list(statuses)
+        self._by_id = {status.id: status for status in self._statuses}
+        self._by_code = {status.code: status for status in self._statuses}
+
+    def __iter__(self):
+        return iter(self._statuses)
+
+    def __len__(self):
+        return len(self._statuses)
+
+    def all(self):
+        """Return the statuses ordered by display order."""
+        return list(self._statuses)
+
+    def get_by_id(self, status_id):
+        """Return the status with this id, or None."""
+        return self._by_id.get(status_id)
+
+    def get_by_code(self, code):
+        """Return the status with this code, or None."""
+        return self._by_code.get(code)
+
+    def default(self):
+        """Return the default status, falling back to the first one."""
+        for status in self._statuses:
+            if status.is_default:
+                return status
+        return self._statuses[0] if self._statuses else None
+
+
+def get_attendance_statuses(user):
+    """
+    Get the attendance status registry for a user.
+
+    Statuses are cached per user; the cache entry is invalidated whenever one
+    of the user's statuses is saved or deleted (see academics.signals).
+
+    Args:
+        user: User whose statuses to look up
+
+    Returns:
+        AttendanceStatusRegistry for the user
+    """
+    version = get_version(_version_key(user.pk))
+    key = _statuses_key(user.pk, version)
+    statuses = cache.get(key)
+    if statuses is None:
+        statuses = list(
+            AttendanceStatus.objects.filter(user=user).order_by(
+                "display_order",
+                "label",
+            ),
+        )
+        cache.set(key, statuses, CACHE_TIMEOUT)
+    return AttendanceStatusRegistry(statuses)
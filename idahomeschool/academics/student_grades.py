@@ -0,0 +1,26 @@
+"""Looking up the grade levels of many students at once."""
+
+from idahomeschool.academics.models import StudentGradeYear
+
+
+def grades_for_students(students, school_year):
+    """
+    Get the grade level of each student for one school year in one query.
+
+    Args:
+        students: Iterable of Students or their primary keys, or a Student
+            queryset (used as a subquery)
+        school_year: SchoolYear or its primary key
+
+    Returns:
+        Dict mapping student id to GradeLevel; students without a grade
+        assignment for the year are left out
+    """
+    if not school_year:
+        return {}
+
+    grade_years = StudentGradeYear.objects.filter(
+        student__in=students,
+        school_year=school_year,
+    ).select_related("grade_level")
+    return {grade_year.student_id: grade_year.grade_level for grade_year in grade_years}
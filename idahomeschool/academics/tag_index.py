@@ -0,0 +1,174 @@
+"""Per-user tag autocomplete index cached in Django's cache."""
+
+from bisect import bisect_left
+
+from django.core.cache import cache
+from django.db.models import Count
+
+from idahomeschool.academics.cache_versions import bump_version
+from idahomeschool.academics.cache_versions import get_version
+from idahomeschool.academics.models import Tag
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+# Most-used tags kept in the index; searches for rarer tags of users with
+# more than this many tags fall back to the database
+MAX_INDEXED_TAGS = 5000
+
+# Matches returned while typing
+SEARCH_LIMIT = 10
+
+
+def _version_key(user_id):
+    return f"academics:tag-index:{user_id}:version"
+
+
+def _index_key(user_id, version):
+    return f"academics:tag-index:{user_id}:v{version}"
+
+
+def invalidate_tag_index(user_id):
+    """
+    Invalidate the cached tag index for a user.
+
+    Args:
+        user_id: Primary key of the user whose tags or tagged resources changed
+    """
+    bump_version(_version_key(user_id))
+
+
+def _as_dict(entry):
+    _key, tag_id, name, color, _usage = entry
+    return {"id": tag_id, "name": name, "color": color}
+
+
+def _rank(entry):
+    key, _tag_id, _name, _color, usage = entry
+    return (-usage, key)
+
+
+class TagIndex:
+    """
+    Prefix and substring search over one user's tags, ranked by usage.
+
+    Entries are ``(key, id, name, color, usage)`` tuples sorted by ``key``,
+    the casefolded name, so prefix matches are found by bisection.
+    """
+
+    def __init__(self, entries, *, complete=True):
+        self._entries = entries
+        self._keys = [entry[0] for entry in entries]
+        self.complete = complete
+
+    def __len__(self):
+        return len(self._entries)
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """
+        Find tags whose name contains the query.
+
+        Names starting with the query come first, each group ranked by how
+        many resources use the tag, then by name.
+
+        Args:
+            query: Text typed so far; matched case-insensitively
+            limit: Maximum number of tags to return
+
+        Returns:
+            List of ``{"id", "name", "color"}`` dicts
+        """
+        query = query.casefold()
+        start = bisect_left(self._keys, query)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(query):
+            end += 1
+        prefixed = sorted(self._entries[start:end], key=_rank)
+        if len(prefixed) < limit:
+            prefixed += sorted(
+                (
+                    entry
+                    for entry in self._entries[:start] + self._entries[end:]
+                    if query in entry[0]
+                ),
+                key=_rank,
+            )
+        return [_as_dict(entry) for entry in prefixed[:limit]]
+
+    def all_tags(self):
+        """Return every indexed tag as ``{"id", "name", "color"}`` dicts, by name."""
+        return [_as_dict(entry) for entry in self._entries]
+
+
+def _build_entries(user):
+    tags = (
+        Tag.objects.filter(user=user)
+        .annotate(usage=Count("resources"))
+        .order_by("-usage", "name")
+        .values_list("id", "name", "color", "usage")[: MAX_INDEXED_TAGS + 1]
+    )
+    entries = [
+        (name.casefold(), tag_id, name, color, usage)
+        for tag_id, name, color, usage in tags
+    ]
+    complete = len(entries) <= MAX_INDEXED_TAGS
+    return sorted(entries[:MAX_INDEXED_TAGS]), complete
+
+
+def get_tag_index(user):
+    """
+    Get the tag autocomplete index for a user.
+
+    The index is built with one query and cached per user; the cache entry is
+    invalidated whenever one of the user's tags is saved or deleted, or the
+    tags of one of their resources change (see academics.signals).
+
+    Args:
+        user: User whose tags to index
+
+    Returns:
+        TagIndex for the user
+    """
+    version = get_version(_version_key(user.pk))
+    key = _index_key(user.pk, version)
+    cached = cache.get(key)
+    if cached is None:
+        cached = _build_entries(user)
+        cache.set(key, cached, CACHE_TIMEOUT)
+    entries, complete = cached
+    return TagIndex(entries, complete=complete)
+
+
+def search_tags(user, query, limit=SEARCH_LIMIT):
+    """
+    Find a user's tags for autocomplete.
+
+    Served from the cached index; only users with more tags than the index
+    holds reach the database, and only when the index has too few matches.
+
+    Args:
+        user: Owner of the tags
+        query: Text typed so far (an empty query lists every tag by name,
+            regardless of the limit)
+        limit: Maximum number of tags to return
+
+    Returns:
+        List of ``{"id", "name", "color"}`` dicts
+    """
+    index = get_tag_index(user)
+    if not query:
+        # Tag filters are built from the full list, so nothing may be left out
+        if index.complete:
+            return index.all_tags()
+        tags = Tag.objects.filter(user=user).order_by("name")
+        return list(tags.values("id", "name", "color"))
+
+    tags = index.search(query, limit)
+    if len(tags) < limit and not index.complete:
+        seen = {tag["id"] for tag in tags}
+        tags += list(
+            Tag.objects.filter(user=user, name__icontains=query)
+            .exclude(id__in=seen)
+            .order_by("name")
+            .values("id", "name", "color")[: limit - len(tags)],
+        )
+    return tags
@@ -0,0 +1,214 @@
+"""Batched tag assignment shared by the forms using the tag selector."""
+
+import json
+import random
+
+from django.db import transaction
+from django.db.models import Count
+from django.db.models import Q
+
+from idahomeschool.academics.conditional import invalidate_data_version
+from idahomeschool.academics.models import Tag
+from idahomeschool.academics.tag_index import invalidate_tag_index
+
+
+def parse_tags_data(tags_data):
+    """
+    Parse the JSON posted by the tag selector component.
+
+    Args:
+        tags_data: JSON list of ``{"id": ..., "name": ...}`` objects, where
+            new tags have a negative or missing id
+
+    Returns:
+        List of tag dicts; empty if the data is missing or malformed
+    """
+    try:
+        tags_list = json.loads(tags_data or "[]")
+    except (json.JSONDecodeError, TypeError):
+        return []
+    if not isinstance(tags_list, list):
+        return []
+    return [tag_data for tag_data in tags_list if isinstance(tag_data, dict)]
+
+
+def _submitted_tags(tags_list):
+    """Return (id, name) pairs in submission order; new tags get a None id."""
+    submitted = []
+    for tag_data in tags_list:
+        tag_name = str(tag_data.get("name") or "").strip()
+        if not tag_name:
+            continue
+        tag_id = tag_data.get("id")
+        if not isinstance(tag_id, int) or tag_id <= 0:
+            tag_id = None
+        submitted.append((tag_id, tag_name))
+    return submitted
+
+
+def resolve_tags(user, tags_list, *, create_missing=True):
+    """
+    Resolve submitted tags to the user's Tag instances.
+
+    Tags with a positive id are looked up by id, others by name; both are
+    fetched in one query. Unknown tags are either skipped or bulk-created
+    with colors from the user's palette (fetched once).
+
+    Args:
+        user: Owner of the tags
+        tags_list: Tag dicts as returned by parse_tags_data
+        create_missing: Create tags that do not exist yet instead of
+            skipping them
+
+    Returns:
+        List of distinct Tag instances
+    """
+    submitted = _submitted_tags(tags_list)
+    if not submitted:
+        return []
+
+    ids = {tag_id for tag_id, _ in submitted if tag_id}
+    # Unknown ids fall back to the name, so always look names up
+    names = {tag_name for _, tag_name in submitted}
+    existing = Tag.objects.filter(user=user).filter(
+        Q(id__in=ids) | Q(name__in=names),
+    )
+    by_id = {}
+    by_name = {}
+    for tag in existing:
+        by_id[tag.id] = tag
+        by_name[tag.name] = tag
+
+    if create_missing:
+        missing = {
+            tag_name
+            for tag_id, tag_name in submitted
+            if tag_id not in by_id and tag_name not in by_name
+        }
+        if missing:
+            palette_colors = Tag.get_palette_colors_for_user(user)
+            Tag.objects.bulk_create(
+                [
+                    Tag(
+                        user=user,
+                        name=tag_name,
+                        color=random.choice(palette_colors),  # noqa: S311
+                    )
+                    for tag_name in sorted(missing)
+                ],
+                # Another request may create the same tag concurrently
+                ignore_conflicts=True,
+            )
+            transaction.on_commit(lambda: invalidate_data_version(user.pk, Tag))
+            transaction.on_commit(lambda: invalidate_tag_index(user.pk))
+            for tag in Tag.objects.filter(user=user, name__in=missing):
+                by_name[tag.name] = tag
+
+    tags = {}
+    for tag_id, tag_name in submitted:
+        if create_missing or not tag_id:
+            tag = by_id.get(tag_id) or by_name.get(tag_name)
+        else:
+            # Without creation, a stale id is skipped rather than matched by name
+            tag = by_id.get(tag_id)
+        if tag is not None:
+            tags[tag.id] = tag
+    return list(tags.values())
+
+
+def set_tags(instance, tags):
+    """
+    Make ``instance.tags`` equal to ``tags``, writing only the difference.
+
+    Rows are inserted with one bulk_create on the through table and removed
+    with one delete, instead of clearing and re-adding every tag.
+
+    Args:
+        instance: Saved model instance with a ``tags`` many-to-many field
+        tags: Iterable of Tag instances to keep
+    """
+    field = instance._meta.get_field("tags")  # noqa: SLF001
+    through = field.remote_field.through
+    source = field.m2m_field_name()
+    target = field.m2m_reverse_field_name()
+
+    wanted = {tag.pk for tag in tags}
+    links = through.objects.filter(**{source: instance})
+    current = set(links.values_list(f"{target}_id", flat=True))
+
+    removed = current - wanted
+    if removed:
+        links.filter(**{f"{target}_id__in": removed}).delete()
+
+    added = wanted - current
+    if added:
+        through.objects.bulk_create(
+            [
+                through(**{f"{source}_id": instance.pk, f"{target}_id": tag_id})
+                for tag_id in sorted(added)
+            ],
+            ignore_conflicts=True,
+        )
+
+    if removed or added:
+        # The through table sends no signals
+        user_id = instance.user_id
+        model = type(instance)
+        transaction.on_commit(lambda: invalidate_data_version(user_id, model, Tag))
+        transaction.on_commit(lambda: invalidate_tag_index(user_id))
+
+    # Drop any stale prefetched tags
+    getattr(instance, "_prefetched_objects_cache", {}).pop(field.name, None)
+
+
+def parse_tag_ids(values):
+    """
+    Parse tag ids from query string values, skipping anything but integers.
+
+    Args:
+        values: List of strings, e.g. from ``request.GET.getlist``
+
+    Returns:
+        Sorted list of distinct tag ids
+    """
+    tag_ids = set()
+    for value in values:
+        try:
+            tag_ids.add(int(value))
+        except (TypeError, ValueError):
+            continue
+    return sorted(tag_ids)
+
+
+def filter_by_all_tags(queryset, tag_ids):
+    """
+    Keep the objects tagged with every one of the given tags.
+
+    The intersection is one grouped subquery on the through table
+    (``tag_id IN (...) GROUP BY ... HAVING COUNT(*) = n``) instead of one
+    join per tag plus ``distinct()``, so it stays cheap as more tags are
+    selected and leaves the outer queryset free to be annotated and ordered.
+
+    Args:
+        queryset: QuerySet of a model with a ``tags`` many-to-many field
+        tag_ids: Ids of the required tags
+
+    Returns:
+        Filtered queryset; unchanged if no tags are given
+    """
+    tag_ids = set(tag_ids)
+    if not tag_ids:
+        return queryset
+
+    field = queryset.model._meta.get_field("tags")  # noqa: SLF001
+    through = field.remote_field.through
+    source = f"{field.m2m_field_name()}_id"
+    target = f"{field.m2m_reverse_field_name()}_id"
+    tagged_with_all = (
+        through.objects.filter(**{f"{target}__in": tag_ids})
+        .values(source)
+        .annotate(matched=Count(target))
+        .filter(matched=len(tag_ids))
+        .values(source)
+    )
+    return queryset.filter(pk__in=tagged_with_all)
@@ -3,6 +3,8 @@
 from django import template
 from django.utils.safestring import mark_safe
 
+from idahomeschool.academics.renditions import image_sources
+
 register = template.Library()
 
 
@@ -97,3 +99,33 @@ def tag_badge(tag, size="md", clickable=False, link_to_detail=False):
         "clickable": clickable,
         "link_to_detail": link_to_detail,
     }
+
+
+@register.inclusion_tag("academics/partials/responsive_image.html")
+def responsive_image(image, size, alt="", css_class="", title="", style=""):  # noqa: PLR0913
+    """Render an uploaded image at the smallest adequate rendition.
+
+    WebP renditions are offered with a JPEG fallback, at 1x and 2x pixel
+    densities; the original is used until the renditions exist.
+
+    Usage:
+        {% responsive_image student.photo 64 alt=student.name css_class="size-16" %}
+
+    Args:
+        image: FieldFile of a Student photo or Resource image
+        size: Displayed size of the image's shorter side, in CSS pixels
+        alt: Alternative text
+        css_class: Classes of the img element
+        title: Optional title of the img element
+        style: Optional inline style of the img element
+
+    Returns:
+        Context for the picture element
+    """
+    return {
+        **image_sources(image, size),
+        "alt": alt,
+        "css_class": css_class,
+        "title": title,
+        "style": style,
+    }
@@ -0,0 +1,125 @@
+from datetime import date
+
+from factory import Faker
+from factory import LazyAttribute
+from factory import Sequence
+from factory import SubFactory
+from factory.django import DjangoModelFactory
+
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.models import Course
+from idahomeschool.academics.models import CourseEnrollment
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.models import GradeLevel
+from idahomeschool.academics.models import ReadingList
+from idahomeschool.academics.models import Resource
+from idahomeschool.academics.models import SchoolYear
+from idahomeschool.academics.models import Student
+from idahomeschool.academics.models import Tag
+from idahomeschool.users.tests.factories import UserFactory
+
+
+class SchoolYearFactory(DjangoModelFactory[SchoolYear]):
+    user = SubFactory(UserFactory)
+    name = Sequence(lambda n: f"{2000 + n}-{2001 + n}")
+    start_date = LazyAttribute(lambda o: date(int(o.name[:4]), 8, 1))
+    end_date = LazyAttribute(lambda o: date(int(o.name[:4]) + 1, 5, 31))
+
+    class Meta:
+        model = SchoolYear
+
+
+class StudentFactory(DjangoModelFactory[Student]):
+    user = SubFactory(UserFactory)
+    name = Faker("first_name")
+    date_of_birth = Faker("date_of_birth", minimum_age=5, maximum_age=17)
+    grade_level = "3"
+
+    class Meta:
+        model = Student
+
+
+class AttendanceStatusFactory(DjangoModelFactory[AttendanceStatus]):
+    user = SubFactory(UserFactory)
+    code = Sequence(lambda n: f"STATUS_{n}")
+    label = Sequence(lambda n: f"Status {n}")
+    abbreviation = "X"
+    color = "#198754"
+
+    class Meta:
+        model = AttendanceStatus
+
+
+class DailyLogFactory(DjangoModelFactory[DailyLog]):
+    student = SubFactory(StudentFactory)
+    user = LazyAttribute(lambda o: o.student.user)
+    date = Faker("date_this_year")
+
+    class Meta:
+        model = DailyLog
+
+
+class GradeLevelFactory(DjangoModelFactory[GradeLevel]):
+    user = SubFactory(UserFactory)
+    name = Sequence(lambda n: f"Grade {n}")
+    order = Sequence(lambda n: n)
+
+    class Meta:
+        model = GradeLevel
+
+
+class TagFactory(DjangoModelFactory[Tag]):
+    user = SubFactory(UserFactory)
+    name = Sequence(lambda n: f"Tag {n}")
+    color = Faker("hex_color")
+
+    class Meta:
+        model = Tag
+
+
+class ResourceFactory(DjangoModelFactory[Resource]):
+    user = SubFactory(UserFactory)
+    title = Faker("catch_phrase")
+    author = Faker("name")
+    publisher = Faker("company")
+    isbn = Faker("isbn13")
+    description = Faker("sentence")
+
+    class Meta:
+        model = Resource
+
+
+class CourseFactory(DjangoModelFactory[Course]):
+    user = SubFactory(UserFactory)
+    name = Sequence(lambda n: f"Course {n}")
+
+    class Meta:
+        model = Course
+
+
+class CourseEnrollmentFactory(DjangoModelFactory[CourseEnrollment]):
+    student = SubFactory(StudentFactory)
+    user = LazyAttribute(lambda o: o.student.user)
+    course = SubFactory(
+        CourseFactory,
+        user=LazyAttribute(lambda o: o.factory_parent.user),
+    )
+    school_year = SubFactory(
+        SchoolYearFactory,
+        user=LazyAttribute(lambda o: o.factory_parent.user),
+    )
+
+    class Meta:
+        model = CourseEnrollment
+
+
+class ReadingListFactory(DjangoModelFactory[ReadingList]):
+    student = SubFactory(StudentFactory)
+    user = LazyAttribute(lambda o: o.student.user)
+    resource = SubFactory(
+        ResourceFactory,
+        user=LazyAttribute(lambda o: o.factory_parent.user),
+    )
+
+    class Meta:
+        model = ReadingList
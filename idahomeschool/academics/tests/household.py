@@ -0,0 +1,309 @@
+"""Seed a large household for the query budget benchmarks."""
+
+import itertools
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.models import BookTagPreference
+from idahomeschool.academics.models import Color
+from idahomeschool.academics.models import ColorPalette
+from idahomeschool.academics.models import Course
+from idahomeschool.academics.models import CourseEnrollment
+from idahomeschool.academics.models import CourseNote
+from idahomeschool.academics.models import CourseTemplate
+from idahomeschool.academics.models import CurriculumResource
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.models import ReadingList
+from idahomeschool.academics.models import ReportExport
+from idahomeschool.academics.models import Resource
+from idahomeschool.academics.models import StudentGradeYear
+from idahomeschool.academics.models import Tag
+from idahomeschool.academics.rollups import rebuild_attendance_rollups
+from idahomeschool.academics.tests.factories import CourseEnrollmentFactory
+from idahomeschool.academics.tests.factories import CourseFactory
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import GradeLevelFactory
+from idahomeschool.academics.tests.factories import ReadingListFactory
+from idahomeschool.academics.tests.factories import ResourceFactory
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.academics.tests.factories import TagFactory
+
+BATCH_SIZE = 2000
+
+# SchoolYearFactory years run from August 1 to May 31
+SCHOOL_YEAR_START_MONTH = 8
+
+
+@dataclass(frozen=True)
+class HouseholdSize:
+    """Row counts for a seeded household."""
+
+    students: int
+    school_years: int
+    courses: int
+    logs_per_student_year: int
+    resources: int
+    tags: int
+    # Per student and school year
+    enrollments: int = 5
+    # Every nth daily log gets a course note for each enrollment
+    note_every: int = 5
+    tags_per_resource: int = 3
+    reading_list_per_student: int = 20
+
+
+# Enough rows of everything for per-row queries to stand out
+SMALL_HOUSEHOLD = HouseholdSize(
+    students=3,
+    school_years=2,
+    courses=8,
+    logs_per_student_year=20,
+    resources=60,
+    tags=20,
+    reading_list_per_student=5,
+)
+
+LARGE_HOUSEHOLD = HouseholdSize(
+    students=8,
+    school_years=5,
+    courses=40,
+    logs_per_student_year=180,
+    resources=10_000,
+    tags=500,
+)
+
+
+def _school_year_start(day):
+    """Return the calendar year in which the school year containing day began."""
+    return day.year if day.month >= SCHOOL_YEAR_START_MONTH else day.year - 1
+
+
+def _weekdays(start, count):
+    """Return the first ``count`` weekdays on or after ``start``."""
+    days = []
+    current = start
+    while len(days) < count:
+        if current.weekday() < 5:  # noqa: PLR2004
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+def seed_household(user, size):
+    """
+    Create a household of students, school years, logs and library data.
+
+    Rows are built with the test factories and written with bulk_create,
+    so the large household seeds in seconds. The most recent school year
+    contains today and is active, so the calendar and dashboard show data.
+
+    Args:
+        user: Owner of every created row
+        size: HouseholdSize with the row counts to create
+
+    Returns:
+        Dict of the created objects, keyed by kind
+    """
+    current_start_year = _school_year_start(timezone.localdate())
+
+    AttendanceStatus.create_defaults_for_user(user)
+    statuses = list(AttendanceStatus.objects.filter(user=user))
+
+    palette = ColorPalette.objects.create(user=user, name="Default", is_active=True)
+    colors = Color.objects.bulk_create(
+        [Color(user=user, color=value) for value in Color.get_default_colors()],
+    )
+    palette.colors.set(colors)
+
+    grade_levels = [
+        GradeLevelFactory.create(user=user, name=f"Grade {order}", order=order)
+        for order in range(size.students)
+    ]
+
+    school_years = []
+    for offset in reversed(range(size.school_years)):
+        start_year = current_start_year - offset
+        school_years.append(
+            SchoolYearFactory.create(
+                user=user,
+                name=f"{start_year}-{start_year + 1}",
+                is_active=offset == 0,
+            ),
+        )
+
+    students = [
+        StudentFactory.create(user=user, name=f"Student {index:02d}")
+        for index in range(size.students)
+    ]
+    for student in students:
+        student.school_years.set(school_years)
+    student_grade_years = StudentGradeYear.objects.bulk_create(
+        [
+            StudentGradeYear(
+                user=user,
+                student=student,
+                school_year=school_year,
+                grade_level=grade_levels[(index + year_index) % len(grade_levels)],
+            )
+            for index, student in enumerate(students)
+            for year_index, school_year in enumerate(school_years)
+        ],
+    )
+
+    tags = Tag.objects.bulk_create(
+        TagFactory.build_batch(size.tags, user=user),
+        batch_size=BATCH_SIZE,
+    )
+    resources = Resource.objects.bulk_create(
+        ResourceFactory.build_batch(size.resources, user=user),
+        batch_size=BATCH_SIZE,
+    )
+    resource_tags = Resource.tags.through
+    resource_tags.objects.bulk_create(
+        [
+            resource_tags(
+                resource_id=resource.pk,
+                tag_id=tags[(index + step) % len(tags)].pk,
+            )
+            for index, resource in enumerate(resources)
+            for step in range(size.tags_per_resource)
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    preference = BookTagPreference.objects.create(user=user)
+    preference.tags.set(tags[:1])
+
+    template = CourseTemplate.objects.create(user=user, name="Template")
+    template.suggested_resources.set(resources[:5])
+    courses = Course.objects.bulk_create(
+        CourseFactory.build_batch(
+            size.courses,
+            user=user,
+            course_template=template,
+            grade_level=grade_levels[0],
+        ),
+    )
+    course_resources = Course.resources.through
+    course_resources.objects.bulk_create(
+        [
+            course_resources(
+                course_id=course.pk,
+                resource_id=resources[(index * 2 + step) % len(resources)].pk,
+            )
+            for index, course in enumerate(courses)
+            for step in range(2)
+        ],
+    )
+    curriculum_resources = CurriculumResource.objects.bulk_create(
+        [
+            CurriculumResource(course=course, title=f"{course.name} Workbook")
+            for course in courses
+        ],
+    )
+
+    course_cycle = itertools.cycle(courses)
+    enrollments = CourseEnrollment.objects.bulk_create(
+        [
+            CourseEnrollmentFactory.build(
+                user=user,
+                student=student,
+                school_year=school_year,
+                course=next(course_cycle),
+            )
+            for school_year in school_years
+            for student in students
+            for _ in range(size.enrollments)
+        ],
+    )
+    enrollments_by_key = {}
+    for enrollment in enrollments:
+        key = (enrollment.student_id, enrollment.school_year_id)
+        enrollments_by_key.setdefault(key, []).append(enrollment)
+
+    status_cycle = itertools.cycle(statuses)
+    daily_logs = DailyLog.objects.bulk_create(
+        [
+            DailyLogFactory.build(
+                user=user,
+                student=student,
+                date=log_date,
+                attendance_status=next(status_cycle),
+            )
+            for school_year in school_years
+            for log_date in _weekdays(
+                school_year.start_date,
+                size.logs_per_student_year,
+            )
+            for student in students
+        ],
+        batch_size=BATCH_SIZE,
+    )
+    school_year_by_start = {year.start_date.year: year for year in school_years}
+    course_notes = []
+    for index, daily_log in enumerate(daily_logs):
+        if index % size.note_every:
+            continue
+        school_year = school_year_by_start[_school_year_start(daily_log.date)]
+        course_notes.extend(
+            CourseNote(
+                user=user,
+                daily_log=daily_log,
+                course_enrollment=enrollment,
+                notes=f"Lesson {index}",
+            )
+            for enrollment in enrollments_by_key[(daily_log.student_id, school_year.pk)]
+        )
+    CourseNote.objects.bulk_create(course_notes, batch_size=BATCH_SIZE)
+    rebuild_attendance_rollups(user=user)
+
+    reading_list = ReadingList.objects.bulk_create(
+        [
+            ReadingListFactory.build(
+                user=user,
+                student=student,
+                resource=resources[index * size.reading_list_per_student + step],
+                school_year=school_years[-1],
+                status="COMPLETED" if step % 2 else "READING",
+            )
+            for index, student in enumerate(students)
+            for step in range(size.reading_list_per_student)
+        ],
+    )
+
+    report_export = ReportExport.objects.create(
+        user=user,
+        kind=ReportExport.KIND_ATTENDANCE_PDF,
+        input_hash="0" * 64,
+        filename="attendance_report.pdf",
+        source="<html></html>",
+    )
+
+    # Give the planner statistics for the bulk-loaded rows, as autovacuum
+    # would in production
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+
+    return {
+        "statuses": statuses,
+        "palette": palette,
+        "palettes": [palette],
+        "colors": colors,
+        "grade_levels": grade_levels,
+        "school_years": school_years,
+        "students": students,
+        "student_grade_years": student_grade_years,
+        "tags": tags,
+        "resources": resources,
+        "templates": [template],
+        "courses": courses,
+        "curriculum_resources": curriculum_resources,
+        "enrollments": enrollments,
+        "daily_logs": daily_logs,
+        "reading_list": reading_list,
+        "report_export": report_export,
+    }
@@ -0,0 +1,115 @@
+from datetime import date
+
+import pytest
+from django.urls import reverse
+
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+WEEK = {"date": "2024-09-11"}
+HTMX = {"HX-Request": "true"}
+
+
+@pytest.fixture
+def student(user: User):
+    AttendanceStatus.create_defaults_for_user(user)
+    return StudentFactory(user=user)
+
+
+@pytest.fixture
+def calendar(client, user: User):
+    client.force_login(user)
+    url = reverse("academics:attendance_calendar")
+
+    def get(params=WEEK, headers=None):
+        return client.get(url, params, headers=headers)
+
+    return get
+
+
+def test_unchanged_calendar_is_not_modified(
+    calendar,
+    student,
+    django_assert_max_num_queries,
+):
+    DailyLogFactory(student=student, date=date(2024, 9, 9))
+    # The first page sets the CSRF cookie, which is part of the ETag
+    calendar()
+    response = calendar()
+    etag = response["ETag"]
+    assert response["Last-Modified"]
+    assert "private" in response["Cache-Control"]
+
+    # The session, the user and the summary, inside the request's savepoint
+    with django_assert_max_num_queries(5):
+        cached = calendar(headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304  # noqa: PLR2004
+    assert not cached.content
+    # Another week is a different grid
+    assert calendar({"date": "2024-09-18"})["ETag"] != etag
+    assert calendar(headers=HTMX)["ETag"] != etag
+
+
+def test_calendar_etag_changes_with_the_grid(client, calendar, student):
+    log = DailyLogFactory(student=student, date=date(2024, 9, 9))
+    calendar()
+    etag = calendar()["ETag"]
+    assert calendar(headers={"If-None-Match": etag}).status_code == 304  # noqa: PLR2004
+
+    client.post(
+        reverse("academics:attendance_quick_update", args=[student.pk, "2024-09-10"]),
+        {"status": "ABSENT"},
+    )
+    assert calendar(headers={"If-None-Match": etag}).status_code == 200  # noqa: PLR2004
+    etag = calendar()["ETag"]
+
+    log.delete()
+    assert calendar(headers={"If-None-Match": etag}).status_code == 200  # noqa: PLR2004
+
+
+def test_calendar_htmx_renders_grid_only(calendar, student):
+    response = calendar(headers=HTMX)
+    month = calendar({"view": "month", **WEEK}, headers=HTMX)
+
+    assert response.templates[0].name == "academics/partials/calendar_week_grid.html"
+    assert month.templates[0].name == "academics/partials/calendar_month_grid.html"
+    assert b"Status Legend" not in response.content
+    assert b"student-filter" not in response.content
+    assert "HX-Request" in response["Vary"]
+
+
+def test_calendar_lists_students_once(calendar, user: User, student):
+    other = StudentFactory(user=user)
+
+    response = calendar({"student": other.pk, **WEEK})
+
+    assert set(response.context["students"]) == {student, other}
+    assert [row["student"] for row in response.context["attendance_grid"]] == [other]
+
+
+def test_quick_update_swaps_both_copies_of_the_cell(client, calendar, student):
+    calendar()
+    cell = f"{student.pk}-2024-09-10"
+
+    response = client.post(
+        reverse("academics:attendance_quick_update", args=[student.pk, "2024-09-10"]),
+        {"status": "PRESENT"},
+    )
+    deleted = client.delete(
+        reverse("academics:attendance_quick_delete", args=[student.pk, "2024-09-10"]),
+    )
+
+    content = response.content.decode()
+    assert f'id="cell-{cell}" class="inline-flex items-center gap-1">' in content
+    assert (
+        f'id="day-cell-{cell}" class="inline-flex items-center gap-1" '
+        'hx-swap-oob="true"'
+    ) in content
+    assert f'id="day-cell-{cell}"' in deleted.content.decode()
+    assert not DailyLog.objects.filter(student=student).exists()
@@ -0,0 +1,132 @@
+from datetime import date
+from datetime import timedelta
+
+import pytest
+
+from idahomeschool.academics.attendance_grid import build_attendance_grid
+from idahomeschool.academics.attendance_grid import calendar_dates
+from idahomeschool.academics.attendance_grid import calendar_version
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.models import CourseNote
+from idahomeschool.academics.status_registry import get_attendance_statuses
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _month(start=date(2024, 9, 1), days=30):
+    return [{"date": start + timedelta(days=i)} for i in range(days)]
+
+
+def test_build_attendance_grid_cells(user: User):
+    AttendanceStatus.create_defaults_for_user(user)
+    present = AttendanceStatus.objects.get(user=user, code="PRESENT")
+    first, second = StudentFactory.create_batch(2, user=user)
+    dates = _month(days=3)
+    noted = DailyLogFactory(
+        student=first,
+        date=dates[0]["date"],
+        attendance_status=present,
+    )
+    CourseNote.objects.create(daily_log=noted, user=user, notes="Chapter 1")
+    plain = DailyLogFactory(
+        student=first,
+        date=dates[1]["date"],
+        attendance_status=present,
+    )
+    # Outside of the grid's date range
+    DailyLogFactory(student=second, date=date(2024, 10, 1))
+
+    grid = build_attendance_grid(user, [first, second], dates)
+
+    assert [row["student"] for row in grid] == [first, second]
+    first_cells = grid[0]["dates"]
+    assert [cell["date"] for cell in first_cells] == [d["date"] for d in dates]
+    assert first_cells[0]["log"] == noted
+    assert first_cells[0]["has_notes"] is True
+    assert first_cells[1]["log"] == plain
+    assert first_cells[1]["has_notes"] is False
+    assert first_cells[2]["log"] is None
+    assert all(cell["log"] is None for cell in grid[1]["dates"])
+
+
+def test_build_attendance_grid_query_count(user: User, django_assert_num_queries):
+    AttendanceStatus.create_defaults_for_user(user)
+    present = AttendanceStatus.objects.get(user=user, code="PRESENT")
+    students = StudentFactory.create_batch(6, user=user)
+    dates = _month()
+    for student in students:
+        for cell in dates:
+            log = DailyLogFactory(
+                student=student,
+                date=cell["date"],
+                attendance_status=present,
+            )
+            CourseNote.objects.create(daily_log=log, user=user, notes="Read")
+
+    with django_assert_num_queries(1):
+        grid = build_attendance_grid(user, students, dates)
+        for row in grid:
+            for cell in row["dates"]:
+                assert cell["log"].attendance_status == present
+                assert cell["has_notes"]
+
+
+@pytest.mark.parametrize(
+    ("ref_date", "first", "last"),
+    [
+        # Starts on a Sunday, ends on a Monday
+        (date(2024, 9, 15), date(2024, 9, 1), date(2024, 10, 5)),
+        # Starts on a Friday, ends on a Saturday
+        (date(2024, 11, 15), date(2024, 10, 27), date(2024, 11, 30)),
+        (date(2024, 12, 25), date(2024, 12, 1), date(2025, 1, 4)),
+    ],
+)
+def test_calendar_dates_month_fills_whole_weeks(ref_date, first, last):
+    start_date, end_date, date_range = calendar_dates("month", ref_date)
+
+    assert start_date == ref_date.replace(day=1)
+    assert end_date.month == ref_date.month
+    assert (end_date + timedelta(days=1)).day == 1
+    assert date_range[0]["date"] == first
+    assert date_range[-1]["date"] == last
+    assert len(date_range) % 7 == 0
+    assert all(
+        cell["is_current_month"] == (cell["date"].month == ref_date.month)
+        for cell in date_range
+    )
+
+
+def test_calendar_dates_week():
+    start_date, end_date, date_range = calendar_dates("week", date(2024, 9, 11))
+
+    assert start_date == date(2024, 9, 8)
+    assert end_date == date(2024, 9, 14)
+    assert [cell["date"] for cell in date_range] == [
+        start_date + timedelta(days=i) for i in range(7)
+    ]
+
+
+def test_calendar_version_tracks_range(user: User, django_assert_num_queries):
+    AttendanceStatus.create_defaults_for_user(user)
+    first, second = StudentFactory.create_batch(2, user=user)
+    start, end = date(2024, 9, 8), date(2024, 9, 14)
+    log = DailyLogFactory(student=first, date=date(2024, 9, 9))
+    # Statuses come from the cached registry
+    get_attendance_statuses(user)
+
+    with django_assert_num_queries(1):
+        version, last_modified = calendar_version(user, start, end, first.pk)
+    assert last_modified >= log.updated_at
+
+    # Outside of the range, or of the selected student
+    DailyLogFactory(student=first, date=date(2024, 9, 15))
+    DailyLogFactory(student=second, date=date(2024, 9, 10))
+    assert calendar_version(user, start, end, first.pk)[0] == version
+
+    note = CourseNote.objects.create(daily_log=log, user=user, notes="Read")
+    assert calendar_version(user, start, end, first.pk)[0] != version
+    note.delete()
+    assert calendar_version(user, start, end, first.pk)[0] == version
@@ -0,0 +1,96 @@
+from datetime import date
+from datetime import timedelta
+
+import pytest
+
+from idahomeschool.academics.bulk_attendance import bulk_mark_attendance
+from idahomeschool.academics.forms import BulkAttendanceForm
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.rollups import find_attendance_rollup_drift
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def statuses(user: User):
+    AttendanceStatus.create_defaults_for_user(user)
+    return {s.code: s for s in AttendanceStatus.objects.filter(user=user)}
+
+
+def test_bulk_mark_attendance_upserts_and_updates_rollups(user: User, statuses):
+    school_year = SchoolYearFactory(user=user)
+    students = StudentFactory.create_batch(4, user=user)
+    monday = date(school_year.start_date.year, 9, 2)
+    week = [monday + timedelta(days=offset) for offset in range(5)]
+    existing = DailyLogFactory(
+        student=students[0],
+        date=monday,
+        attendance_status=statuses["SICK"],
+        general_notes="Stayed in bed",
+    )
+
+    bulk_mark_attendance(user, students, week, statuses["PRESENT"])
+
+    logs = DailyLog.objects.filter(student__in=students, date__in=week)
+    assert logs.count() == 20  # noqa: PLR2004
+    assert set(logs.values_list("attendance_status__code", flat=True)) == {"PRESENT"}
+    existing.refresh_from_db()
+    assert existing.attendance_status == statuses["PRESENT"]
+    assert existing.general_notes == "Stayed in bed"
+    assert find_attendance_rollup_drift(user=user) == []
+
+    bulk_mark_attendance(user, students[:2], week[:1], statuses["HOLIDAY"])
+    assert find_attendance_rollup_drift(user=user) == []
+
+
+def test_bulk_mark_attendance_query_count(
+    user: User,
+    statuses,
+    django_assert_max_num_queries,
+):
+    SchoolYearFactory(user=user, name="2024-2025")
+    students = StudentFactory.create_batch(4, user=user)
+    week = [date(2024, 9, 2) + timedelta(days=offset) for offset in range(5)]
+
+    # Savepoint, existing logs, upsert, school years, one row per student
+    with django_assert_max_num_queries(10):
+        bulk_mark_attendance(user, students, week, statuses["PRESENT"])
+
+
+def test_bulk_attendance_form_dates(user: User, statuses):
+    student = StudentFactory(user=user)
+    form = BulkAttendanceForm(
+        {
+            "students": [student.id],
+            "start_date": "2024-09-01",
+            "end_date": "2024-09-08",
+            "status": "HOLIDAY",
+            "weekdays_only": "on",
+        },
+        user=user,
+        attendance_statuses=statuses.values(),
+    )
+
+    assert form.is_valid(), form.errors
+    assert form.get_dates() == [date(2024, 9, 2) + timedelta(days=i) for i in range(5)]
+
+
+def test_bulk_attendance_form_rejects_other_users_students(user: User, statuses):
+    form = BulkAttendanceForm(
+        {
+            "students": [StudentFactory().id],
+            "start_date": "2024-09-10",
+            "end_date": "2024-09-01",
+            "status": "PRESENT",
+        },
+        user=user,
+        attendance_statuses=statuses.values(),
+    )
+
+    assert not form.is_valid()
+    assert set(form.errors) == {"students", "end_date"}
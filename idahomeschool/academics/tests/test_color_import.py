@@ -0,0 +1,77 @@
+import pytest
+from django.urls import reverse
+
+from idahomeschool.academics.models import Color
+from idahomeschool.academics.models import ColorPalette
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _import(client, csv_content, palette):
+    return client.post(
+        reverse("academics:color_palette_import"),
+        {
+            "csv_content": csv_content,
+            "palette_choice": str(palette.pk),
+        },
+    )
+
+
+def test_import_is_set_based(client, user: User, django_assert_num_queries):
+    palette = ColorPalette.objects.create(user=user, name="Design tool")
+    client.force_login(user)
+    codes = [f"#{i:06X}" for i in range(500)]
+
+    # Session, user, form palette choices, palette, existing colors, color
+    # insert and palette links, plus the request's savepoint
+    with django_assert_num_queries(9):
+        response = _import(client, "\n".join(codes), palette)
+
+    assert response.status_code == 302  # noqa: PLR2004
+    assert Color.objects.filter(user=user).count() == 500  # noqa: PLR2004
+    assert palette.colors.count() == 500  # noqa: PLR2004
+
+
+def test_import_skips_repeated_and_existing_colors(client, user: User):
+    palette = ColorPalette.objects.create(user=user, name="Autumn")
+    existing = Color.objects.create(user=user, color="#B7410E")
+    # Another user's color is not reused
+    Color.objects.create(user=User.objects.create(username="other"), color="#112233")
+    client.force_login(user)
+
+    response = _import(client, "b7410e, #112233\n#112233\nnope", palette)
+
+    messages = [str(message) for message in response.wsgi_request._messages]  # noqa: SLF001
+    assert "Successfully imported 1 color(s)!" in messages
+    assert "Skipped 3 color(s) (duplicates or invalid)" in messages
+    assert set(palette.colors.values_list("color", flat=True)) == {
+        "#B7410E",
+        "#112233",
+    }
+    assert palette.colors.get(color="#B7410E") == existing
+
+    # Importing again only adds missing palette links
+    _import(client, "#B7410E", palette)
+    assert palette.colors.count() == 2  # noqa: PLR2004
+
+
+def test_preview_takes_one_query(client, user: User, django_assert_num_queries):
+    Color.objects.create(user=user, color="#112233")
+    client.force_login(user)
+    # Load the session and user first
+    client.get(reverse("academics:color_palette_import"))
+
+    # Session, user, the color lookup and the request's savepoint
+    with django_assert_num_queries(5):
+        response = client.post(
+            reverse("academics:color_palette_preview_htmx"),
+            {"csv_content": "#112233, 445566, #445566, nope"},
+        )
+
+    assert [
+        (color["hex_code"], color["exists"])
+        for color in response.context["preview_colors"]
+    ] == [("#112233", True), ("#445566", False)]
+    assert response.context["new_count"] == 1
+    assert len(response.context["preview_errors"]) == 1
@@ -0,0 +1,102 @@
+import pytest
+from django.urls import reverse
+
+from idahomeschool.academics.conditional import get_data_version
+from idahomeschool.academics.models import Color
+from idahomeschool.academics.models import ColorPalette
+from idahomeschool.academics.models import Resource
+from idahomeschool.academics.models import Tag
+from idahomeschool.academics.tags import set_tags
+from idahomeschool.academics.tests.factories import ResourceFactory
+from idahomeschool.academics.tests.factories import TagFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def test_data_version_cached(user: User, django_assert_num_queries):
+    resource = ResourceFactory(user=user)
+    # Another user's rows do not count
+    ResourceFactory()
+
+    with django_assert_num_queries(1):
+        summary, last_modified = get_data_version(user, [Resource, Tag])
+    with django_assert_num_queries(0):
+        assert get_data_version(user, [Tag, Resource]) == (summary, last_modified)
+
+    assert last_modified == resource.updated_at
+    assert {label: rows for label, _version, _changed, rows in summary} == {
+        "academics.resource": 1,
+        "academics.tag": 0,
+    }
+
+
+def test_data_version_invalidated(user: User, django_capture_on_commit_callbacks):
+    resource = ResourceFactory(user=user)
+    tag = TagFactory(user=user)
+    palette = ColorPalette.objects.create(user=user, name="Autumn")
+    color = Color.objects.create(user=user, name="Rust", color="#b7410e")
+
+    def version(*models):
+        return get_data_version(user, models)[0]
+
+    resources = version(Resource, Tag)
+    colors = version(Color, ColorPalette)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        resource.title = "Renamed"
+        resource.save()
+    assert version(Resource, Tag) != resources
+    assert version(Color, ColorPalette) == colors
+    resources = version(Resource, Tag)
+
+    # Through table writes send no signals of their own
+    with django_capture_on_commit_callbacks(execute=True):
+        set_tags(resource, [tag])
+    assert version(Resource, Tag) != resources
+
+    with django_capture_on_commit_callbacks(execute=True):
+        palette.colors.add(color)
+    assert version(Color, ColorPalette) != colors
+
+
+def test_unchanged_page_is_not_modified(
+    client,
+    user: User,
+    django_assert_max_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    ResourceFactory(user=user)
+    client.force_login(user)
+    url = reverse("academics:resource_list")
+    # The first page sets the CSRF cookie, which is part of the ETag
+    client.get(url)
+    response = client.get(url)
+    etag = response["ETag"]
+    assert response["Last-Modified"]
+
+    # Only the session and the user are loaded, inside the request's savepoint
+    with django_assert_max_num_queries(4):
+        cached = client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304  # noqa: PLR2004
+    # Another search is another page
+    searched = client.get(url, {"search": "x"}, headers={"If-None-Match": etag})
+    assert searched.status_code == 200  # noqa: PLR2004
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ResourceFactory(user=user)
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 200  # noqa: PLR2004
+
+
+def test_pending_messages_are_rendered(client, user: User):
+    client.force_login(user)
+    url = reverse("academics:color_palette_list")
+    client.get(url)
+    etag = client.get(url)["ETag"]
+
+    # Fails without changing any data, and redirects back with an error
+    client.get(reverse("academics:color_palette_set_active", args=[0]))
+    response = client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert b"Palette not found" in response.content
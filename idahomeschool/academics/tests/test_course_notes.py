@@ -0,0 +1,137 @@
+from datetime import date
+
+import pytest
+from django.urls import reverse
+
+from idahomeschool.academics.course_notes import active_enrollment_ids
+from idahomeschool.academics.course_notes import sync_course_notes
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.models import CourseNote
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.tests.factories import CourseEnrollmentFactory
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _notes(daily_log):
+    return dict(
+        daily_log.course_notes.values_list("course_enrollment_id", "notes"),
+    )
+
+
+def test_sync_course_notes_creates_updates_and_deletes(user: User):
+    student = StudentFactory(user=user)
+    school_year = SchoolYearFactory(user=user)
+    keep, change, clear, add = CourseEnrollmentFactory.create_batch(
+        4,
+        student=student,
+        school_year=school_year,
+    )
+    daily_log = DailyLogFactory(student=student)
+    for enrollment in (keep, change, clear):
+        CourseNote.objects.create(
+            user=user,
+            daily_log=daily_log,
+            course_enrollment=enrollment,
+            notes="Before",
+        )
+
+    has_notes = sync_course_notes(
+        daily_log,
+        {
+            keep.pk: "Before",
+            change.pk: " After ",
+            clear.pk: "  ",
+            add.pk: "New",
+        },
+        user,
+    )
+
+    assert has_notes
+    assert _notes(daily_log) == {
+        keep.pk: "Before",
+        change.pk: "After",
+        add.pk: "New",
+    }
+
+
+def test_sync_course_notes_reports_notes_outside_the_form(user: User):
+    student = StudentFactory(user=user)
+    old, current = CourseEnrollmentFactory.create_batch(2, student=student)
+    daily_log = DailyLogFactory(student=student)
+    for enrollment in (old, current):
+        CourseNote.objects.create(
+            user=user,
+            daily_log=daily_log,
+            course_enrollment=enrollment,
+            notes="Notes",
+        )
+
+    assert sync_course_notes(daily_log, {current.pk: ""}, user)
+    assert not sync_course_notes(daily_log, {old.pk: ""}, user)
+    assert not daily_log.course_notes.exists()
+
+
+def test_active_enrollment_ids(user: User):
+    student = StudentFactory(user=user)
+    past = CourseEnrollmentFactory(student=student)
+    current = CourseEnrollmentFactory(student=student)
+
+    assert sorted(active_enrollment_ids(user, student, None)) == [
+        past.pk,
+        current.pk,
+    ]
+    assert active_enrollment_ids(user, student, current.school_year) == [current.pk]
+
+
+def test_saving_course_notes_runs_constant_queries(
+    client,
+    user: User,
+    django_assert_max_num_queries,
+):
+    AttendanceStatus.create_defaults_for_user(user)
+    student = StudentFactory(user=user)
+    school_year = SchoolYearFactory(user=user, is_active=True)
+    enrollments = CourseEnrollmentFactory.create_batch(
+        8,
+        student=student,
+        school_year=school_year,
+    )
+    log_date = date(school_year.start_date.year, 9, 1)
+    client.force_login(user)
+    url = reverse(
+        "academics:attendance_save_course_notes",
+        kwargs={"student_pk": student.pk, "log_date": log_date.isoformat()},
+    )
+    # Warm the attendance status cache
+    client.post(url, {})
+
+    data = {f"enrollment_{enrollment.pk}": "Read" for enrollment in enrollments}
+    with django_assert_max_num_queries(15):
+        response = client.post(url, data)
+
+    assert response.status_code == 200  # noqa: PLR2004
+    daily_log = DailyLog.objects.get(student=student, date=log_date)
+    assert daily_log.course_notes.count() == 8  # noqa: PLR2004
+
+    url = reverse(
+        "academics:dailylog_entry_date",
+        kwargs={"student_pk": student.pk, "log_date": log_date.isoformat()},
+    )
+    data = {
+        "status": "ABSENT",
+        "general_notes": "Dentist",
+        f"course_notes_{enrollments[0].pk}": "Read",
+    }
+    # Includes moving the day between attendance rollups
+    with django_assert_max_num_queries(20):
+        client.post(url, data)
+
+    daily_log.refresh_from_db()
+    assert daily_log.attendance_status.code == "ABSENT"
+    assert daily_log.general_notes == "Dentist"
+    assert list(daily_log.course_notes.values_list("notes", flat=True)) == ["Read"]
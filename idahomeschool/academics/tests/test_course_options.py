@@ -0,0 +1,58 @@
+import pytest
+
+from idahomeschool.academics.course_options import get_course_options
+from idahomeschool.academics.tests.factories import CourseFactory
+from idahomeschool.academics.tests.factories import GradeLevelFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def test_course_options_per_grade(user: User, django_assert_num_queries):
+    third, fourth = GradeLevelFactory.create_batch(2, user=user)
+    matching = CourseFactory(user=user, grade_level=third, name="Math 3")
+    universal = CourseFactory(user=user, grade_level=None, name="Art")
+    other = CourseFactory(user=user, grade_level=fourth, name="Math 4")
+    # Another user's courses are never offered
+    CourseFactory()
+
+    with django_assert_num_queries(1):
+        options = get_course_options(user, third)
+    with django_assert_num_queries(0):
+        assert get_course_options(user, third) == options
+
+    # Ordered by grade level, universal courses last
+    assert [pk for pk, _label in options["choices"]] == ["", matching.pk, universal.pk]
+    assert options["choices"][1] == (matching.pk, f"Math 3 ({third.name})")
+    assert [pk for pk, _label in get_course_options(user)["choices"]] == [
+        "",
+        matching.pk,
+        other.pk,
+        universal.pk,
+    ]
+
+
+def test_course_options_html_is_escaped(user: User):
+    course = CourseFactory(user=user, grade_level=None, name="<b>Logic</b>")
+
+    html = get_course_options(user)["html"]
+
+    assert html == (
+        '<option value="">---------</option>'
+        f'<option value="{course.pk}">&lt;b&gt;Logic&lt;/b&gt; (Any)</option>'
+    )
+
+
+def test_course_options_invalidated(user: User, django_capture_on_commit_callbacks):
+    grade = GradeLevelFactory(user=user, name="Third")
+    course = CourseFactory(user=user, grade_level=grade, name="Reading")
+    assert get_course_options(user)["choices"][1] == (course.pk, "Reading (Third)")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        grade.name = "Year 3"
+        grade.save()
+    assert get_course_options(user)["choices"][1] == (course.pk, "Reading (Year 3)")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        course.delete()
+    assert get_course_options(user)["choices"] == [("", "---------")]
@@ -0,0 +1,181 @@
+from datetime import date
+
+import pytest
+from django.urls import reverse
+
+from idahomeschool.academics.bulk_attendance import bulk_mark_attendance
+from idahomeschool.academics.dashboard import get_dashboard_summary
+from idahomeschool.academics.models import CourseTemplate
+from idahomeschool.academics.tests.factories import AttendanceStatusFactory
+from idahomeschool.academics.tests.factories import CourseEnrollmentFactory
+from idahomeschool.academics.tests.factories import CourseFactory
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+# A Wednesday; its week runs from 2024-09-09 to 2024-09-15
+TODAY = date(2024, 9, 11)
+
+
+@pytest.fixture
+def school_year(user: User):
+    return SchoolYearFactory(user=user, name="2024-2025", is_active=True)
+
+
+def test_dashboard_summary_counts_instructional_statuses(
+    user: User,
+    school_year,
+    django_assert_num_queries,
+):
+    present = AttendanceStatusFactory(user=user, is_instructional=True)
+    # The legacy status field says PRESENT, but the status is not instructional
+    closed = AttendanceStatusFactory(user=user, is_instructional=False)
+    first, second = StudentFactory.create_batch(2, user=user)
+    DailyLogFactory(student=first, date=date(2024, 9, 9), attendance_status=present)
+    DailyLogFactory(student=second, date=date(2024, 9, 9), attendance_status=present)
+    DailyLogFactory(student=first, date=date(2024, 9, 10), attendance_status=closed)
+    DailyLogFactory(student=first, date=date(2024, 9, 2), attendance_status=present)
+    DailyLogFactory(student=first, date=date(2024, 7, 1), attendance_status=present)
+    CourseEnrollmentFactory.create_batch(
+        2,
+        student=first,
+        school_year=school_year,
+        status="IN_PROGRESS",
+    )
+    CourseEnrollmentFactory(student=first, school_year=school_year, status="COMPLETED")
+
+    # One aggregate plus the enrollments and the three recent lists
+    with django_assert_num_queries(5):
+        summary = get_dashboard_summary(user, school_year, TODAY)
+
+    assert summary["total_attendance_days"] == 4  # noqa: PLR2004
+    assert summary["instructional_days"] == 3  # noqa: PLR2004
+    assert summary["week_days_logged"] == 2  # noqa: PLR2004
+    assert summary["week_instructional_days"] == 1
+    assert summary["week_students_count"] == 2  # noqa: PLR2004
+    assert summary["active_courses_count"] == 2  # noqa: PLR2004
+    assert summary["active_courses"]
+    assert len(summary["recent_daily_logs"]) == 5  # noqa: PLR2004
+    assert [course.enrollment_count for course in summary["recent_courses"]] == [
+        1,
+        1,
+        1,
+    ]
+
+
+def test_dashboard_summary_cached(user: User, school_year, django_assert_num_queries):
+    DailyLogFactory(student=StudentFactory(user=user), date=TODAY)
+
+    get_dashboard_summary(user, school_year, TODAY)
+    with django_assert_num_queries(0):
+        summary = get_dashboard_summary(user, school_year, TODAY)
+
+    assert summary["total_attendance_days"] == 1
+    assert len(summary["recent_students"]) == 1
+
+
+def test_dashboard_summary_without_active_year(user: User):
+    DailyLogFactory(student=StudentFactory(user=user), date=TODAY)
+
+    summary = get_dashboard_summary(user, None, TODAY)
+
+    assert summary["week_days_logged"] == 1
+    assert "total_attendance_days" not in summary
+    assert "active_enrollments" not in summary
+
+
+def test_dashboard_summary_invalidated_on_changes(
+    user: User,
+    school_year,
+    django_capture_on_commit_callbacks,
+):
+    status = AttendanceStatusFactory(user=user, is_instructional=True)
+    student = StudentFactory(user=user)
+    assert get_dashboard_summary(user, school_year, TODAY)["instructional_days"] == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        daily_log = DailyLogFactory(
+            student=student,
+            date=TODAY,
+            attendance_status=status,
+        )
+    assert get_dashboard_summary(user, school_year, TODAY)["instructional_days"] == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        status.is_instructional = False
+        status.save()
+    assert get_dashboard_summary(user, school_year, TODAY)["instructional_days"] == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        daily_log.delete()
+    assert get_dashboard_summary(user, school_year, TODAY)["recent_daily_logs"] == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        CourseEnrollmentFactory(
+            student=student,
+            school_year=school_year,
+            status="IN_PROGRESS",
+        )
+    assert get_dashboard_summary(user, school_year, TODAY)["active_courses_count"] == 1
+
+
+def test_dashboard_summary_invalidated_on_template_rename(
+    user: User,
+    school_year,
+    django_capture_on_commit_callbacks,
+):
+    template = CourseTemplate.objects.create(user=user, name="Algebra")
+    CourseFactory(user=user, course_template=template)
+    (course,) = get_dashboard_summary(user, school_year, TODAY)["recent_courses"]
+    assert course.course_template.name == "Algebra"
+
+    # Recent courses are cached with their template
+    with django_capture_on_commit_callbacks(execute=True):
+        template.name = "Algebra 1"
+        template.save()
+    (course,) = get_dashboard_summary(user, school_year, TODAY)["recent_courses"]
+    assert course.course_template.name == "Algebra 1"
+
+
+def test_dashboard_summary_invalidated_by_bulk_attendance(
+    user: User,
+    school_year,
+    django_capture_on_commit_callbacks,
+):
+    status = AttendanceStatusFactory(user=user, is_instructional=True)
+    students = StudentFactory.create_batch(2, user=user)
+    assert get_dashboard_summary(user, school_year, TODAY)["week_days_logged"] == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        bulk_mark_attendance(user, students, [date(2024, 9, 9), TODAY], status)
+
+    summary = get_dashboard_summary(user, school_year, TODAY)
+    assert summary["week_days_logged"] == 2  # noqa: PLR2004
+    assert summary["week_students_count"] == 2  # noqa: PLR2004
+
+
+def test_dashboard_renders_from_cache(
+    client,
+    user: User,
+    school_year,
+    django_assert_max_num_queries,
+):
+    CourseEnrollmentFactory(
+        student=StudentFactory(user=user),
+        school_year=school_year,
+        status="IN_PROGRESS",
+    )
+    client.force_login(user)
+    url = reverse("academics:dashboard")
+    client.get(url)
+
+    # Only the session and the user are loaded on a repeat visit, inside the
+    # request's savepoint
+    with django_assert_max_num_queries(4):
+        response = client.get(url)
+
+    assert response.status_code == 200  # noqa: PLR2004
+    assert response.context["active_courses_count"] == 1
@@ -0,0 +1,130 @@
+from datetime import timedelta
+
+import pytest
+from django.core.files.storage import InMemoryStorage
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+from idahomeschool.academics import exports
+from idahomeschool.academics.exports import claim_next_export
+from idahomeschool.academics.exports import request_report_export
+from idahomeschool.academics.exports import requeue_stale_exports
+from idahomeschool.academics.exports import run_report_export
+from idahomeschool.academics.models import ReportExport
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+KIND = ReportExport.KIND_ATTENDANCE_PDF
+
+
+@pytest.fixture
+def renderer(monkeypatch, settings):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+    }
+    rendered = []
+
+    def render(source):
+        rendered.append(source)
+        return f"PDF {source}".encode()
+
+    monkeypatch.setitem(exports.RENDERERS, KIND, render)
+    return rendered
+
+
+def test_request_report_export_reuses_identical_reports(user: User):
+    first = request_report_export(user, KIND, "<html>a</html>", "a.pdf")
+    again = request_report_export(user, KIND, "<html>a</html>", "a.pdf")
+    other = request_report_export(user, KIND, "<html>b</html>", "b.pdf")
+
+    assert first.status == ReportExport.STATUS_PENDING
+    assert again.pk == first.pk
+    assert other.pk != first.pk
+
+
+def test_worker_generates_and_stores_file(user: User, renderer):
+    export = request_report_export(user, KIND, "<html>a</html>", "report.pdf")
+
+    call_command("run_report_exports", "--once")
+
+    export.refresh_from_db()
+    assert renderer == ["<html>a</html>"]
+    assert export.status == ReportExport.STATUS_DONE
+    assert export.source == ""
+    assert export.file.name.startswith(f"reports/{user.id}/{export.input_hash}_")
+    assert export.file.read() == b"PDF <html>a</html>"
+
+    # Unchanged report is served from the stored file without a new job
+    assert request_report_export(user, KIND, "<html>a</html>", "report.pdf") == export
+    assert claim_next_export() is None
+
+
+def test_failed_export_is_retried_on_next_request(user: User, monkeypatch):
+    def fail(source):
+        msg = "no fonts"
+        raise RuntimeError(msg)
+
+    monkeypatch.setitem(exports.RENDERERS, KIND, fail)
+    request_report_export(user, KIND, "<html/>", "x.pdf")
+
+    export = run_report_export(claim_next_export())
+
+    assert export.status == ReportExport.STATUS_FAILED
+    assert export.error == "no fonts"
+
+    retried = request_report_export(user, KIND, "<html/>", "x.pdf")
+    assert retried.pk == export.pk
+    assert retried.status == ReportExport.STATUS_PENDING
+
+
+def test_storage_error_fails_export(user: User, renderer, monkeypatch):
+    def unavailable(self, name, content):
+        msg = "storage unavailable"
+        raise OSError(msg)
+
+    monkeypatch.setattr(InMemoryStorage, "_save", unavailable)
+    export = request_report_export(user, KIND, "<html/>", "x.pdf")
+
+    # The worker survives the error
+    call_command("run_report_exports", "--once")
+
+    export.refresh_from_db()
+    assert export.status == ReportExport.STATUS_FAILED
+    assert export.error == "storage unavailable"
+    # The source is kept for the retry
+    assert export.source == "<html/>"
+
+
+def test_stale_running_exports_are_requeued(user: User):
+    request_report_export(user, KIND, "<html/>", "x.pdf")
+    export = claim_next_export()
+    assert claim_next_export() is None
+
+    ReportExport.objects.filter(pk=export.pk).update(
+        started_at=timezone.now() - timedelta(hours=1),
+    )
+
+    assert requeue_stale_exports() == 1
+    assert claim_next_export().pk == export.pk
+
+
+def test_pdf_view_queues_export_and_status_polls(client, user: User):
+    client.force_login(user)
+
+    response = client.get(reverse("academics:attendance_report_pdf"))
+
+    assert response.status_code == 200  # noqa: PLR2004
+    export = ReportExport.objects.get(user=user)
+    assert export.status == ReportExport.STATUS_PENDING
+    status_url = reverse("academics:report_export_status", args=[export.pk])
+    assert status_url in response.content.decode()
+
+    response = client.get(status_url)
+    assert response.status_code == 200  # noqa: PLR2004
+    assert 'hx-trigger="every 2s"' in response.content.decode()
+
+    download_url = reverse("academics:report_export_download", args=[export.pk])
+    assert client.get(download_url).status_code == 404  # noqa: PLR2004
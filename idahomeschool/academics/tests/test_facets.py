@@ -0,0 +1,108 @@
+import pytest
+from django.http import QueryDict
+from django.urls import reverse
+
+from idahomeschool.academics.facets import get_resource_facets
+from idahomeschool.academics.facets import parse_resource_filters
+from idahomeschool.academics.tests.factories import ResourceFactory
+from idahomeschool.academics.tests.factories import TagFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def library(user: User):
+    history, science = (
+        TagFactory(user=user, name=name) for name in ("History", "Science")
+    )
+    book = ResourceFactory(user=user, title="Ancient Egypt", resource_type="BOOK")
+    workbook = ResourceFactory(
+        user=user,
+        title="Egypt Map Work",
+        resource_type="WORKBOOK",
+    )
+    lab = ResourceFactory(user=user, title="Kitchen Chemistry", resource_type="BOOK")
+    book.tags.add(history)
+    workbook.tags.add(history, science)
+    lab.tags.add(science)
+    # Another user's resources never count
+    ResourceFactory(resource_type="BOOK").tags.add(TagFactory())
+    return {"history": history, "science": science}
+
+
+def _filters(query=""):
+    return parse_resource_filters(QueryDict(query))
+
+
+def test_facet_counts(user: User, library):
+    history, science = library["history"], library["science"]
+
+    facets = get_resource_facets(user, _filters())
+    assert facets["types"] == [("BOOK", 2), ("WORKBOOK", 1)]
+    assert facets["tags"] == [
+        (history.pk, "History", history.color, 2),
+        (science.pk, "Science", science.color, 2),
+    ]
+
+    # Tags count within the selected type; types ignore their own filter
+    facets = get_resource_facets(user, _filters("resource_type=WORKBOOK"))
+    assert facets["types"] == [("BOOK", 2), ("WORKBOOK", 1)]
+    assert [count for *_tag, count in facets["tags"]] == [1, 1]
+
+    facets = get_resource_facets(user, _filters(f"tag={science.pk}&search=egypt"))
+    assert facets["types"] == [("WORKBOOK", 1)]
+    assert [name for _id, name, _color, _count in facets["tags"]] == [
+        "History",
+        "Science",
+    ]
+
+
+def test_selected_filters_listed_without_matches(user: User, library):
+    history = library["history"]
+
+    facets = get_resource_facets(
+        user,
+        _filters(f"tag={history.pk}&resource_type=VIDEO&search=chemistry"),
+    )
+
+    assert ("VIDEO", 0) in facets["types"]
+    assert facets["tags"] == [(history.pk, "History", history.color, 0)]
+
+
+def test_facet_counts_cached(
+    user: User,
+    library,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    filters = _filters(f"tag={library['history'].pk}")
+
+    # The data version, then the counts in one grouped query
+    with django_assert_num_queries(2):
+        facets = get_resource_facets(user, filters)
+    with django_assert_num_queries(0):
+        assert get_resource_facets(user, filters) == facets
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ResourceFactory(user=user, resource_type="VIDEO").tags.add(library["history"])
+    assert ("VIDEO", 1) in get_resource_facets(user, filters)["types"]
+
+
+def test_facets_sidebar(client, user: User, library):
+    history, science = library["history"], library["science"]
+    client.force_login(user)
+
+    response = client.get(
+        reverse("academics:resource_facets_htmx"),
+        {"tag": history.pk, "page": 2},
+        headers={"HX-Request": "true"},
+    )
+
+    content = response.content.decode()
+    list_url = reverse("academics:resource_list")
+    # Selecting another tag keeps the current one, without the page
+    assert f'href="{list_url}?tag={history.pk}&amp;tag={science.pk}"' in content
+    # The selected tag and type links clear their filter
+    assert f'href="{list_url}"' in content
+    assert f'href="{list_url}?tag={history.pk}&amp;resource_type=BOOK"' in content
@@ -0,0 +1,128 @@
+import csv
+import io
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+from django.urls import reverse
+
+from idahomeschool.academics.history_export import HISTORY_HEADER
+from idahomeschool.academics.history_export import attendance_history_rows
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.models import Course
+from idahomeschool.academics.models import CourseEnrollment
+from idahomeschool.academics.models import CourseNote
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def history(user: User):
+    AttendanceStatus.create_defaults_for_user(user)
+    present = AttendanceStatus.objects.get(user=user, code="PRESENT")
+    school_year = SchoolYearFactory(user=user, name="2024-2025")
+    student = StudentFactory(user=user, name="Ada")
+    other = StudentFactory(user=user, name="Ben")
+    enrollments = [
+        CourseEnrollment.objects.create(
+            user=user,
+            student=student,
+            course=Course.objects.create(user=user, name=name),
+            school_year=school_year,
+        )
+        for name in ("Latin", "Math")
+    ]
+    log = DailyLogFactory(
+        student=student,
+        date=date(2024, 9, 3),
+        attendance_status=present,
+        general_notes="Good day",
+    )
+    for enrollment in enrollments:
+        CourseNote.objects.create(
+            daily_log=log,
+            course_enrollment=enrollment,
+            user=user,
+            notes=f"{enrollment.course.name} lesson 1",
+        )
+    DailyLogFactory(student=other, date=date(2024, 9, 4), attendance_status=present)
+    DailyLogFactory(student=student, date=date(2023, 5, 1), attendance_status=None)
+    return {"school_year": school_year, "student": student}
+
+
+def test_attendance_history_rows(user: User, history):
+    rows = list(attendance_history_rows(user))
+
+    assert rows == [
+        HISTORY_HEADER,
+        ["2023-05-01", "Ada", "PRESENT", "", "", "", "", ""],
+        [
+            "2024-09-03",
+            "Ada",
+            "Present",
+            "Yes",
+            "Good day",
+            "2024-2025",
+            "Latin",
+            "Latin lesson 1",
+        ],
+        [
+            "2024-09-03",
+            "Ada",
+            "Present",
+            "Yes",
+            "Good day",
+            "2024-2025",
+            "Math",
+            "Math lesson 1",
+        ],
+        ["2024-09-04", "Ben", "Present", "Yes", "", "", "", ""],
+    ]
+
+
+def test_attendance_history_rows_filters(user: User, history):
+    rows = attendance_history_rows(
+        user,
+        student=history["student"],
+        school_year=history["school_year"],
+        end_date=date(2024, 9, 3),
+    )
+
+    assert [row[6] for row in rows] == ["Course", "Latin", "Math"]
+
+
+def test_history_csv_view_streams(client, user: User, history):
+    client.force_login(user)
+
+    response = client.get(
+        reverse("academics:attendance_history_csv"),
+        {"year": history["school_year"].id},
+    )
+
+    assert response.streaming
+    content = b"".join(response.streaming_content).decode("utf-8-sig")
+    rows = list(csv.reader(io.StringIO(content)))
+    assert rows[0] == HISTORY_HEADER
+    assert len(rows) == 4  # noqa: PLR2004
+
+
+def test_export_attendance_history_command(user: User, history, tmp_path):
+    output = tmp_path / "history.csv"
+
+    call_command(
+        "export_attendance_history",
+        user.username,
+        "--student",
+        str(history["student"].id),
+        "--output",
+        str(output),
+    )
+
+    with output.open(newline="", encoding="utf-8") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert rows[0] == HISTORY_HEADER
+    assert [row[0] for row in rows[1:]] == ["2023-05-01", "2024-09-03", "2024-09-03"]
@@ -0,0 +1,95 @@
+from io import BytesIO
+from io import StringIO
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from PIL import ExifTags
+from PIL import Image
+
+from idahomeschool.academics.models import Student
+from idahomeschool.academics.renditions import decode_reduced
+from idahomeschool.academics.renditions import generate_next_renditions
+from idahomeschool.academics.tests.factories import ResourceFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _jpeg(size=(800, 600), orientation=1):
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = orientation
+    buffer = BytesIO()
+    Image.new("RGB", size, (20, 120, 200)).save(buffer, format="JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def _open(image):
+    with image.open("rb"), Image.open(image) as img:
+        return img.format, img.size, img.getexif().get(ExifTags.Base.Orientation)
+
+
+def test_decode_reduced_jpeg():
+    with Image.open(BytesIO(_jpeg())) as img:
+        # 1/8 scale still covers the requested size
+        assert decode_reduced(img, (100, 75)).size == (100, 75)
+    with Image.open(BytesIO(_jpeg())) as img:
+        assert decode_reduced(img, (101, 75)).size == (200, 150)
+
+
+def test_large_upload_is_downscaled_upright(user: User, settings):
+    settings.ACADEMICS_IMAGE_MAX_DIMENSION = 300
+    # Stored landscape, shown portrait
+    upload = SimpleUploadedFile("phone.JPG", _jpeg(orientation=6))
+
+    student = StudentFactory(user=user, photo=upload)
+
+    assert student.photo.name.endswith("_phone.jpeg")
+    assert _open(student.photo) == ("JPEG", (225, 300), None)
+
+
+def test_small_upload_is_stored_as_is(user: User, settings):
+    settings.ACADEMICS_IMAGE_MAX_DIMENSION = 300
+    buffer = BytesIO()
+    Image.new("RGBA", (120, 90), (200, 80, 40, 128)).save(buffer, format="PNG")
+
+    resource = ResourceFactory(
+        user=user,
+        image=SimpleUploadedFile("cover.png", buffer.getvalue()),
+    )
+
+    with resource.image.open("rb"):
+        assert resource.image.read() == buffer.getvalue()
+
+
+def test_downscale_images_backfill(
+    user: User,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    student = StudentFactory(user=user)
+    # Stored before uploads were downscaled
+    old_name = default_storage.save("students/old.jpg", ContentFile(_jpeg()))
+    Student.objects.filter(pk=student.pk).update(photo=old_name)
+    generate_next_renditions()
+    student.refresh_from_db()
+    old_renditions = [r["name"] for r in student.photo_renditions["images"]]
+    settings.ACADEMICS_IMAGE_MAX_DIMENSION = 400
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("downscale_images", stdout=StringIO())
+    student.refresh_from_db()
+
+    assert student.photo.name.startswith("students/old")
+    assert _open(student.photo) == ("JPEG", (400, 300), None)
+    assert student.photo_renditions == {}
+    assert not default_storage.exists(old_name)
+    assert not any(default_storage.exists(name) for name in old_renditions)
+
+    # Already small enough
+    out = StringIO()
+    call_command("downscale_images", stdout=out)
+    assert "Downscaled 0 images" in out.getvalue()
@@ -0,0 +1,157 @@
+from datetime import date
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.models import ReadingList
+from idahomeschool.academics.pagination import decode_cursor
+from idahomeschool.academics.pagination import encode_cursor
+from idahomeschool.academics.pagination import paginate_by_cursor
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import ReadingListFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+LOG_ORDERING = ("-date", "-id")
+
+
+@pytest.fixture
+def daily_logs(user: User):
+    students = StudentFactory.create_batch(3, user=user)
+    start = date(2024, 9, 2)
+    # Several logs share each date, so pages split ties
+    return [
+        DailyLogFactory(student=student, date=start + timedelta(days=offset))
+        for offset in range(10)
+        for student in students
+    ]
+
+
+def _walk(queryset, ordering, per_page):
+    pages = []
+    cursor = None
+    while True:
+        objects, cursor = paginate_by_cursor(queryset, ordering, cursor, per_page)
+        pages.append(objects)
+        if cursor is None:
+            return pages
+
+
+def test_paginate_by_cursor_visits_every_row_once(user: User, daily_logs):
+    queryset = DailyLog.objects.filter(user=user)
+
+    pages = _walk(queryset, LOG_ORDERING, 7)
+
+    assert [len(page) for page in pages] == [7, 7, 7, 7, 2]
+    assert [log for page in pages for log in page] == list(
+        queryset.order_by(*LOG_ORDERING),
+    )
+
+
+def test_paginate_by_cursor_mixed_directions(user: User):
+    entries = ReadingListFactory.create_batch(5, student=StudentFactory(user=user))
+    same_time = timezone.now()
+    ReadingList.objects.filter(pk__in=[e.pk for e in entries[:3]]).update(
+        updated_at=same_time,
+    )
+    ordering = ("-updated_at", "id")
+    queryset = ReadingList.objects.filter(user=user)
+
+    pages = _walk(queryset, ordering, 2)
+
+    assert [entry for page in pages for entry in page] == list(
+        queryset.order_by(*ordering),
+    )
+
+
+def test_cursor_round_trip_keeps_microseconds(user: User):
+    entry = ReadingListFactory(student=StudentFactory(user=user))
+    ordering = ("-updated_at", "id")
+
+    cursor = encode_cursor(entry, ordering)
+
+    assert decode_cursor(cursor, ReadingList, ordering) == [entry.updated_at, entry.pk]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        encode_cursor(DailyLog(date=None, id=1), LOG_ORDERING),
+        encode_cursor(DailyLog(date=1, id=2), LOG_ORDERING),
+        encode_cursor(DailyLog(date="nope", id=3), LOG_ORDERING),
+    ],
+)
+def test_malformed_cursor(cursor):
+    with pytest.raises(ValueError, match="Malformed cursor"):
+        decode_cursor(cursor, DailyLog, LOG_ORDERING)
+
+
+def test_deep_pages_cost_the_same_as_the_first(client, user: User, daily_logs):
+    client.force_login(user)
+    url = reverse("academics:dailylog_list")
+    seen = []
+    query_counts = []
+    while url:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url, headers={"HX-Request": "true"})
+        assert not any("COUNT(" in query["sql"] for query in queries)
+        query_counts.append(len(queries))
+        seen.extend(response.context["daily_logs"])
+        url = response.context["next_page_url"]
+
+    assert len(seen) == len(daily_logs)
+    assert len(set(query_counts[1:])) == 1
+
+
+def test_load_more_renders_rows_fragment(client, user: User, daily_logs):
+    client.force_login(user)
+    url = reverse("academics:dailylog_list")
+
+    # Leaves 27 of the 30 logs: a full page of 20 and 7 more
+    response = client.get(url, {"start_date": "2024-09-03"})
+    next_page_url = response.context["next_page_url"]
+    assert "start_date=2024-09-03" in next_page_url
+    assert "cursor=" in next_page_url
+
+    fragment = client.get(next_page_url, headers={"HX-Request": "true"})
+    page = client.get(next_page_url)
+
+    assert fragment.templates[0].name == "academics/partials/dailylog_rows.html"
+    assert b"<html" not in fragment.content
+    assert page.templates[0].name == "academics/dailylog_list.html"
+    assert len(fragment.context["daily_logs"]) == 7  # noqa: PLR2004
+    assert fragment.context["next_page_url"] is None
+
+
+def test_reading_list_load_more_appends_to_every_view(client, user: User):
+    ReadingListFactory.create_batch(25, student=StudentFactory(user=user))
+    client.force_login(user)
+
+    response = client.get(reverse("academics:reading_list"))
+    fragment = client.get(
+        response.context["next_page_url"],
+        headers={"HX-Request": "true"},
+    )
+
+    content = fragment.content.decode()
+    assert len(fragment.context["reading_list_entries"]) == 5  # noqa: PLR2004
+    assert 'hx-swap-oob="beforeend:#reading-list-cards"' in content
+    assert 'hx-swap-oob="beforeend:#reading-list-rows"' in content
+    assert 'hx-swap-oob="beforeend:#reading-list-dialogs"' in content
+    assert 'id="reading-list-more"' not in content
+
+
+def test_invalid_cursor_is_not_found(client, user: User):
+    client.force_login(user)
+
+    response = client.get(reverse("academics:reading_list"), {"cursor": "bogus"})
+
+    assert response.status_code == 404  # noqa: PLR2004
@@ -0,0 +1,500 @@
+"""
+Query budgets for every academics URL.
+
+Each view is requested against a seeded household and fails if it runs more
+queries than its recorded budget, which catches N+1 regressions before they
+ship. Budgets are recorded against a small household; set
+``ACADEMICS_BENCHMARK=large`` to seed a realistically large one (8 students,
+5 school years, 10k resources) and also enforce a latency budget.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db import transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from idahomeschool.academics.tests.household import LARGE_HOUSEHOLD
+from idahomeschool.academics.tests.household import SMALL_HOUSEHOLD
+from idahomeschool.academics.tests.household import seed_household
+from idahomeschool.academics.urls import urlpatterns
+from idahomeschool.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+LARGE = os.environ.get("ACADEMICS_BENCHMARK") == "large"
+
+# Seconds a single request may take against the large household
+LATENCY_BUDGET = 1.0
+
+# Needs a finished export file on disk; covered by test_exports
+UNBENCHMARKED_URLS = {"report_export_download"}
+
+
+@dataclass(frozen=True)
+class ViewCase:
+    """A request to benchmark and the most queries it may run."""
+
+    id: str
+    url_name: str
+    budget: int
+    # Each callable receives the seeded household
+    kwargs: object = None
+    params: object = None
+    method: str = "get"
+    htmx: bool = False
+    # Still runs queries per row, so the budget only holds for the small
+    # household
+    per_row: bool = False
+
+
+def _pk(kind, index=0):
+    return lambda household: {"pk": household[kind][index].pk}
+
+
+def _student_day(household):
+    log = household["daily_logs"][-1]
+    return {"student_pk": log.student_id, "log_date": log.date.isoformat()}
+
+
+def _latest_day(household):
+    return {"date": household["daily_logs"][-1].date.isoformat()}
+
+
+def _active_year(household):
+    return {"year": household["school_years"][-1].pk}
+
+
+CASES = [
+    ViewCase("dashboard", "dashboard", 11),
+    # School years
+    ViewCase("schoolyear_list", "schoolyear_list", 6),
+    ViewCase("schoolyear_create", "schoolyear_create", 4),
+    ViewCase("schoolyear_detail", "schoolyear_detail", 12, _pk("school_years", -1)),
+    ViewCase("schoolyear_update", "schoolyear_update", 7, _pk("school_years", -1)),
+    ViewCase("schoolyear_delete", "schoolyear_delete", 7, _pk("school_years", -1)),
+    # Library
+    ViewCase("resource_list", "resource_list", 9),
+    ViewCase(
+        "resource_list_search",
+        "resource_list",
+        10,
+        params=lambda household: {"search": household["resources"][0].title},
+    ),
+    ViewCase("library_create", "library_create", 6),
+    ViewCase("resource_detail", "resource_detail", 8, _pk("resources")),
+    ViewCase("library_update", "library_update", 11, _pk("resources")),
+    ViewCase("library_delete", "library_delete", 7, _pk("resources")),
+    ViewCase(
+        "resource_facets_htmx",
+        "resource_facets_htmx",
+        6,
+        params=lambda household: {"tag": [household["tags"][0].pk]},
+        htmx=True,
+    ),
+    ViewCase(
+        "resource_search_htmx",
+        "resource_search_htmx",
+        6,
+        params=lambda household: {"search": household["resources"][0].author},
+        htmx=True,
+    ),
+    ViewCase("resource_create_modal_htmx", "resource_create_modal_htmx", 6, htmx=True),
+    # Tags
+    ViewCase("tag_list", "tag_list", 10),
+    ViewCase("tag_create", "tag_create", 7),
+    ViewCase("tag_detail", "tag_detail", 10, _pk("tags")),
+    ViewCase("tag_update", "tag_update", 10, _pk("tags")),
+    ViewCase("tag_delete", "tag_delete", 7, _pk("tags")),
+    ViewCase(
+        "tag_autocomplete_htmx",
+        "tag_autocomplete_htmx",
+        5,
+        params=lambda household: {"q": "Tag"},
+        htmx=True,
+    ),
+    ViewCase("tag_create_modal_htmx", "tag_create_modal_htmx", 7, htmx=True),
+    # Color palettes
+    ViewCase("color_palette_list", "color_palette_list", 34),
+    ViewCase("color_palette_create", "color_palette_create", 4),
+    ViewCase("color_palette_import", "color_palette_import", 5),
+    ViewCase(
+        "color_palette_preview_htmx",
+        "color_palette_preview_htmx",
+        5,
+        params=lambda household: {"csv_content": "#112233, #445566, nope"},
+        method="post",
+        htmx=True,
+    ),
+    ViewCase("color_palette_update", "color_palette_update", 7, _pk("palettes")),
+    ViewCase("color_palette_delete", "color_palette_delete", 7, _pk("palettes")),
+    ViewCase(
+        "color_palette_set_active",
+        "color_palette_set_active",
+        7,
+        _pk("palettes"),
+        method="post",
+    ),
+    ViewCase(
+        "remove_color_from_palette",
+        "remove_color_from_palette",
+        7,
+        lambda household: {
+            "palette_pk": household["palette"].pk,
+            "color_pk": household["colors"][0].pk,
+        },
+        method="delete",
+        htmx=True,
+    ),
+    ViewCase("color_create", "color_create", 5),
+    ViewCase("color_update", "color_update", 10, _pk("colors")),
+    ViewCase("color_delete", "color_delete", 9, _pk("colors")),
+    # Grade levels
+    ViewCase("gradelevel_list", "gradelevel_list", 7),
+    ViewCase("gradelevel_create", "gradelevel_create", 4),
+    ViewCase("gradelevel_create_pk12", "gradelevel_create_pk12", 5, method="post"),
+    ViewCase("gradelevel_detail", "gradelevel_detail", 12, _pk("grade_levels")),
+    ViewCase("gradelevel_update", "gradelevel_update", 7, _pk("grade_levels")),
+    ViewCase("gradelevel_delete", "gradelevel_delete", 7, _pk("grade_levels")),
+    ViewCase("studentgradeyear_create", "studentgradeyear_create", 7),
+    ViewCase(
+        "studentgradeyear_create_for_student",
+        "studentgradeyear_create_for_student",
+        8,
+        lambda household: {"student_pk": household["students"][0].pk},
+    ),
+    ViewCase(
+        "studentgradeyear_update",
+        "studentgradeyear_update",
+        13,
+        _pk("student_grade_years"),
+    ),
+    ViewCase(
+        "studentgradeyear_delete",
+        "studentgradeyear_delete",
+        10,
+        _pk("student_grade_years"),
+    ),
+    # Curriculum
+    ViewCase("coursetemplate_list", "coursetemplate_list", 7),
+    ViewCase("coursetemplate_create", "coursetemplate_create", 4),
+    ViewCase(
+        "coursetemplate_detail",
+        "coursetemplate_detail",
+        11,
+        _pk("templates"),
+    ),
+    ViewCase(
+        "coursetemplate_update",
+        "coursetemplate_update",
+        10,
+        _pk("templates"),
+    ),
+    ViewCase(
+        "coursetemplate_delete",
+        "coursetemplate_delete",
+        7,
+        _pk("templates"),
+    ),
+    ViewCase(
+        "resource_create",
+        "resource_create",
+        7,
+        lambda household: {"course_pk": household["courses"][0].pk},
+    ),
+    ViewCase(
+        "resource_update",
+        "resource_update",
+        9,
+        _pk("curriculum_resources"),
+    ),
+    ViewCase(
+        "resource_delete",
+        "resource_delete",
+        9,
+        _pk("curriculum_resources"),
+    ),
+    # Enrollments
+    ViewCase("courseenrollment_list", "courseenrollment_list", 8),
+    ViewCase("courseenrollment_create", "courseenrollment_create", 7),
+    ViewCase(
+        "filter_courses_by_student",
+        "filter_courses_by_student",
+        7,
+        params=lambda household: {
+            "student": household["students"][0].pk,
+            "school_year": household["school_years"][-1].pk,
+        },
+        htmx=True,
+    ),
+    ViewCase(
+        "courseenrollment_detail",
+        "courseenrollment_detail",
+        10,
+        _pk("enrollments", -1),
+    ),
+    ViewCase(
+        "courseenrollment_update",
+        "courseenrollment_update",
+        10,
+        _pk("enrollments", -1),
+    ),
+    ViewCase(
+        "courseenrollment_delete",
+        "courseenrollment_delete",
+        10,
+        _pk("enrollments", -1),
+    ),
+    # Students
+    ViewCase("student_list", "student_list", 8),
+    ViewCase("student_create", "student_create", 5),
+    ViewCase("student_detail", "student_detail", 13, _pk("students")),
+    ViewCase("student_update", "student_update", 9, _pk("students")),
+    ViewCase("student_delete", "student_delete", 7, _pk("students")),
+    ViewCase(
+        "student_reading_list",
+        "student_reading_list",
+        15,
+        _pk("students"),
+        per_row=True,
+    ),
+    # Reading list
+    ViewCase("reading_list", "reading_list", 11),
+    ViewCase("readinglist_create", "readinglist_create", 11),
+    ViewCase("readinglist_detail", "readinglist_detail", 12, _pk("reading_list")),
+    ViewCase("readinglist_update", "readinglist_update", 13, _pk("reading_list")),
+    ViewCase("readinglist_delete", "readinglist_delete", 9, _pk("reading_list")),
+    ViewCase(
+        "reading_list_quick_update",
+        "reading_list_quick_update",
+        6,
+        _pk("reading_list"),
+        params=lambda household: {"status": "COMPLETED"},
+        method="post",
+        htmx=True,
+    ),
+    ViewCase("book_tag_preferences", "book_tag_preferences", 10),
+    # Courses
+    ViewCase("course_list", "course_list", 16, per_row=True),
+    ViewCase("course_create", "course_create", 7),
+    ViewCase("course_detail", "course_detail", 24, _pk("courses"), per_row=True),
+    ViewCase("course_update", "course_update", 13, _pk("courses")),
+    ViewCase("course_delete", "course_delete", 7, _pk("courses")),
+    # Attendance
+    ViewCase(
+        "attendance_calendar",
+        "attendance_calendar",
+        8,
+        params=_latest_day,
+    ),
+    ViewCase(
+        "attendance_calendar_month",
+        "attendance_calendar",
+        8,
+        params=lambda household: {"view": "month", **_latest_day(household)},
+    ),
+    ViewCase("attendance_report", "attendance_report", 10, params=_active_year),
+    ViewCase("attendance_report_pdf", "attendance_report_pdf", 14, params=_active_year),
+    ViewCase(
+        "attendance_history_csv",
+        "attendance_history_csv",
+        6,
+        params=_active_year,
+    ),
+    ViewCase(
+        "report_export_status",
+        "report_export_status",
+        5,
+        lambda household: {"pk": household["report_export"].pk},
+        htmx=True,
+    ),
+    ViewCase("attendance_status_list", "attendance_status_list", 5),
+    ViewCase("attendance_status_create", "attendance_status_create", 6),
+    ViewCase(
+        "attendance_status_update",
+        "attendance_status_update",
+        9,
+        _pk("statuses"),
+    ),
+    ViewCase(
+        "attendance_status_delete",
+        "attendance_status_delete",
+        7,
+        _pk("statuses"),
+    ),
+    ViewCase("dailylog_entry", "dailylog_entry", 10),
+    ViewCase(
+        "dailylog_entry_student",
+        "dailylog_entry_student",
+        10,
+        lambda household: {"student_pk": household["students"][0].pk},
+    ),
+    ViewCase("dailylog_entry_date", "dailylog_entry_date", 12, _student_day),
+    ViewCase(
+        "dailylog_entry_post",
+        "dailylog_entry_date",
+        17,
+        _student_day,
+        params=lambda household: {
+            "status": household["statuses"][1].code,
+            "general_notes": "Field day",
+            **{
+                f"course_notes_{enrollment.pk}": "Chapter 4"
+                for enrollment in household["enrollments"][-5:]
+            },
+        },
+        method="post",
+    ),
+    ViewCase(
+        "attendance_quick_toggle",
+        "attendance_quick_toggle",
+        7,
+        _student_day,
+        htmx=True,
+    ),
+    ViewCase(
+        "attendance_quick_update",
+        "attendance_quick_update",
+        14,
+        _student_day,
+        params=lambda household: {"status": household["statuses"][2].code},
+        method="post",
+        htmx=True,
+    ),
+    ViewCase(
+        "attendance_quick_delete",
+        "attendance_quick_delete",
+        10,
+        _student_day,
+        method="delete",
+        htmx=True,
+    ),
+    ViewCase(
+        "attendance_bulk_update",
+        "attendance_bulk_update",
+        7,
+        params=_latest_day,
+        htmx=True,
+    ),
+    ViewCase(
+        "attendance_bulk_update_post",
+        "attendance_bulk_update",
+        30,
+        params=lambda household: {
+            "students": [student.pk for student in household["students"]],
+            "start_date": (
+                household["daily_logs"][-1].date - timedelta(days=6)
+            ).isoformat(),
+            "end_date": household["daily_logs"][-1].date.isoformat(),
+            "status": household["statuses"][0].code,
+            "weekdays_only": "on",
+        },
+        method="post",
+        htmx=True,
+        per_row=True,
+    ),
+    ViewCase(
+        "attendance_course_notes",
+        "attendance_course_notes",
+        9,
+        _student_day,
+        htmx=True,
+    ),
+    ViewCase(
+        "attendance_save_course_notes",
+        "attendance_save_course_notes",
+        14,
+        _student_day,
+        params=lambda household: {
+            f"enrollment_{enrollment.pk}": "Chapter 5"
+            for enrollment in household["enrollments"][-5:]
+        },
+        method="post",
+        htmx=True,
+    ),
+    # Daily logs
+    ViewCase("dailylog_list", "dailylog_list", 6),
+    ViewCase("dailylog_create", "dailylog_create", 5),
+    ViewCase("dailylog_detail", "dailylog_detail", 11, _pk("daily_logs", -1)),
+    ViewCase("dailylog_update", "dailylog_update", 8, _pk("daily_logs", -1)),
+    ViewCase("dailylog_delete", "dailylog_delete", 9, _pk("daily_logs", -1)),
+]
+
+
+@pytest.fixture(scope="module")
+def household(django_db_setup, django_db_blocker):
+    """
+    Seed one household for the whole module.
+
+    The rows are written inside a transaction that is rolled back once the
+    module finishes; each test runs in a savepoint inside it.
+    """
+    with django_db_blocker.unblock(), transaction.atomic():
+        user = UserFactory()
+        household = seed_household(
+            user,
+            LARGE_HOUSEHOLD if LARGE else SMALL_HOUSEHOLD,
+        )
+        household["user"] = user
+        yield household
+        transaction.set_rollback(True)
+
+
+def _request(client, case, household):
+    url = reverse(
+        f"academics:{case.url_name}",
+        kwargs=case.kwargs(household) if case.kwargs else None,
+    )
+    params = case.params(household) if case.params else {}
+    headers = {"HX-Request": "true"} if case.htmx else {}
+    response = getattr(client, case.method)(url, params, headers=headers)
+    if response.streaming:
+        b"".join(response.streaming_content)
+    return response
+
+
+@pytest.mark.parametrize(
+    "case",
+    [
+        pytest.param(
+            case,
+            id=case.id,
+            marks=pytest.mark.xfail(
+                LARGE and case.per_row,
+                reason="queries grow with the household",
+                strict=True,
+            ),
+        )
+        for case in CASES
+    ],
+)
+def test_query_budget(client, household, case, record_property):
+    client.force_login(household["user"])
+    # Budgets are for a cold cache, so they do not depend on test order
+    cache.clear()
+
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        response = _request(client, case, household)
+        elapsed = time.perf_counter() - started
+
+    record_property("queries", len(queries))
+    record_property("seconds", round(elapsed, 4))
+    assert response.status_code < 400, response.status_code  # noqa: PLR2004
+    assert len(queries) <= case.budget, "\n".join(
+        [f"{case.id} ran {len(queries)} queries, budget is {case.budget}:"]
+        + [query["sql"] for query in queries.captured_queries],
+    )
+    if LARGE:
+        assert elapsed <= LATENCY_BUDGET, f"{case.id} took {elapsed:.2f}s"
+
+
+def test_every_url_has_a_budget():
+    benchmarked = {case.url_name for case in CASES} | UNBENCHMARKED_URLS
+    assert {pattern.name for pattern in urlpatterns} <= benchmarked
@@ -0,0 +1,120 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+
+from idahomeschool.academics.reading_stats import get_reading_stats
+from idahomeschool.academics.tests.factories import ReadingListFactory
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+TODAY = datetime.date(2025, 3, 15)
+
+
+@pytest.fixture
+def student(user: User):
+    return StudentFactory(user=user)
+
+
+def test_reading_stats(user: User, student, django_assert_num_queries):
+    fall, spring = (
+        SchoolYearFactory(user=user, name=name, start_date=start)
+        for name, start in (
+            ("2023-2024", datetime.date(2023, 8, 1)),
+            ("2024-2025", datetime.date(2024, 8, 1)),
+        )
+    )
+    for completed, school_year, rating in (
+        (datetime.date(2025, 3, 1), spring, 5),
+        (datetime.date(2025, 1, 20), spring, 4),
+        (datetime.date(2025, 1, 5), spring, None),
+        # Outside the last twelve months
+        (datetime.date(2024, 2, 10), fall, 3),
+        (None, None, None),
+    ):
+        ReadingListFactory(
+            student=student,
+            status="COMPLETED",
+            completed_date=completed,
+            school_year=school_year,
+            rating=rating,
+        )
+    ReadingListFactory(student=student, status="READING")
+    ReadingListFactory(student=student, status="DID_NOT_FINISH", rating=2)
+    # Other students count only towards the household
+    ReadingListFactory(student=StudentFactory(user=user), status="TO_READ")
+
+    with django_assert_num_queries(1):
+        stats = get_reading_stats(user, student, today=TODAY)
+    with django_assert_num_queries(0):
+        assert get_reading_stats(user, student, today=TODAY) == stats
+
+    assert stats["status_counts"] == {
+        "TO_READ": 0,
+        "READING": 1,
+        "COMPLETED": 5,
+        "DID_NOT_FINISH": 1,
+    }
+    assert stats["total"] == 7  # noqa: PLR2004
+    assert stats["average_rating"] == 3.5  # noqa: PLR2004
+    assert stats["completed_by_year"] == [
+        ("2023-2024", 1),
+        ("2024-2025", 3),
+        (None, 1),
+    ]
+    by_month = dict(stats["completed_by_month"])
+    assert len(by_month) == 12  # noqa: PLR2004
+    assert min(by_month) == datetime.date(2024, 4, 1)
+    assert by_month[datetime.date(2025, 1, 1)] == 2  # noqa: PLR2004
+    assert by_month[datetime.date(2025, 3, 1)] == 1
+    assert stats["books_per_month"] == pytest.approx(3 / 12, abs=0.05)
+
+    household = get_reading_stats(user, today=TODAY)
+    assert household["status_counts"]["TO_READ"] == 1
+    assert household["total"] == 8  # noqa: PLR2004
+
+
+def test_reading_stats_invalidated(
+    user: User,
+    student,
+    django_capture_on_commit_callbacks,
+):
+    entry = ReadingListFactory(student=student, status="READING")
+    assert get_reading_stats(user, student)["status_counts"]["READING"] == 1
+
+    with django_capture_on_commit_callbacks(execute=True):
+        entry.status = "COMPLETED"
+        entry.save()
+    counts = get_reading_stats(user, student)["status_counts"]
+    assert (counts["READING"], counts["COMPLETED"]) == (0, 1)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        entry.delete()
+    assert get_reading_stats(user, student)["total"] == 0
+
+
+def test_student_reading_list_counts(client, user: User, student):
+    ReadingListFactory.create_batch(2, student=student, status="TO_READ")
+    ReadingListFactory(student=student, status="COMPLETED")
+    client.force_login(user)
+
+    response = client.get(reverse("academics:student_reading_list", args=[student.pk]))
+
+    assert response.context["student"] == student
+    assert response.context["to_read_count"] == 2  # noqa: PLR2004
+    assert response.context["completed_count"] == 1
+    assert response.context["reading_count"] == 0
+
+
+def test_dashboard_reading_counts(client, user: User, student):
+    ReadingListFactory(student=student, status="READING")
+    ReadingListFactory.create_batch(2, student=student, status="COMPLETED")
+    client.force_login(user)
+
+    response = client.get(reverse("academics:dashboard"))
+
+    assert response.context["reading_in_progress_count"] == 1
+    assert response.context["reading_completed_count"] == 2  # noqa: PLR2004
@@ -0,0 +1,129 @@
+import re
+from io import BytesIO
+from io import StringIO
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.template import Context
+from django.template import Template
+from PIL import Image
+
+from idahomeschool.academics.renditions import generate_next_renditions
+from idahomeschool.academics.renditions import image_sources
+from idahomeschool.academics.tests.factories import ResourceFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _upload(size=(400, 300), name="photo.png", mode="RGBA"):
+    buffer = BytesIO()
+    Image.new(mode, size, (200, 80, 40)).save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+def test_generate_next_renditions(user: User):
+    student = StudentFactory(user=user, photo=_upload())
+    # Smaller than most rendition sizes
+    resource = ResourceFactory(user=user, image=_upload((90, 120), "cover.png"))
+
+    assert generate_next_renditions() == student
+    assert generate_next_renditions() == resource
+    assert generate_next_renditions() is None
+
+    student.refresh_from_db()
+    renditions = student.photo_renditions
+    assert renditions["source"] == student.photo.name
+    assert (renditions["width"], renditions["height"]) == (400, 300)
+    assert sorted((r["size"], r["format"]) for r in renditions["images"]) == [
+        (size, image_format)
+        for size in (64, 128, 256)
+        for image_format in ("jpeg", "webp")
+    ]
+    for rendition in renditions["images"]:
+        with default_storage.open(rendition["name"]) as file, Image.open(file) as img:
+            assert min(img.size) == rendition["size"]
+            assert img.format == rendition["format"].upper()
+
+    resource.refresh_from_db()
+    assert sorted({r["size"] for r in resource.image_renditions["images"]}) == [64, 90]
+
+
+def test_failed_renditions_are_recorded(user: User):
+    broken = SimpleUploadedFile("broken.png", b"not an image")
+    student = StudentFactory(user=user)
+    # Skips the form's image validation, like an upload of a damaged file
+    student.photo.save("broken.png", broken)
+
+    generate_next_renditions()
+
+    student.refresh_from_db()
+    assert "error" in student.photo_renditions
+    assert generate_next_renditions() is None
+    assert image_sources(student.photo, 64)["src"] == student.photo.url
+
+
+def test_image_sources_picks_smallest_adequate(user: User):
+    student = StudentFactory(user=user, photo=_upload())
+    assert image_sources(student.photo, 40) == {
+        "src": student.photo.url,
+        "webp_srcset": "",
+        "jpeg_srcset": "",
+    }
+    generate_next_renditions()
+    student.refresh_from_db()
+
+    small = image_sources(student.photo, 40)
+    large = image_sources(student.photo, 200)
+
+    assert small["src"].endswith("_64.jpeg")
+    assert re.fullmatch(r"\S+_64\.webp 1x, \S+_128\.webp 2x", small["webp_srcset"])
+    # Nothing larger than 256 exists, so 1x and 2x share it
+    assert large["jpeg_srcset"].count(",") == 0
+    assert large["jpeg_srcset"].endswith("_256.jpeg 1x")
+
+
+def test_replaced_image_is_rendered_again(
+    user: User,
+    django_capture_on_commit_callbacks,
+):
+    student = StudentFactory(user=user, photo=_upload())
+    generate_next_renditions()
+    student.refresh_from_db()
+    old_names = [r["name"] for r in student.photo_renditions["images"]]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        student.photo = _upload(name="new.png")
+        student.save()
+
+    assert student.photo_renditions == {}
+    assert not any(default_storage.exists(name) for name in old_names)
+    # Queued for the worker again
+    assert generate_next_renditions() == student
+
+    with django_capture_on_commit_callbacks(execute=True):
+        student.refresh_from_db()
+        student.photo = None
+        student.save()
+    assert student.photo_renditions == {}
+
+
+def test_responsive_image_tag(user: User):
+    student = StudentFactory(user=user, photo=_upload())
+    template = Template(
+        "{% load academics_extras %}"
+        '{% responsive_image student.photo 64 alt=student.name css_class="size-16" %}',
+    )
+    assert "<picture" not in template.render(Context({"student": student}))
+
+    call_command("generate_image_renditions", "--once", stdout=StringIO())
+    student.refresh_from_db()
+    html = template.render(Context({"student": student}))
+
+    assert '<source type="image/webp" srcset="' in html
+    assert f'alt="{student.name}"' in html
+    assert 'class="size-16"' in html
+    assert "_64.jpeg 1x, " in html
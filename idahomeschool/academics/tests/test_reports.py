@@ -0,0 +1,69 @@
+from datetime import date
+from datetime import timedelta
+
+import pytest
+
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.reports import build_attendance_report
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _statuses(user):
+    AttendanceStatus.create_defaults_for_user(user)
+    return {s.code: s for s in AttendanceStatus.objects.filter(user=user)}
+
+
+def test_build_attendance_report_counts(user: User):
+    statuses = _statuses(user)
+    school_year = SchoolYearFactory(user=user)
+    first, second = StudentFactory.create_batch(2, user=user)
+    start = school_year.start_date
+    for offset, code in enumerate(["PRESENT", "PRESENT", "SICK", "FIELD_TRIP"]):
+        DailyLogFactory(
+            student=first,
+            date=start + timedelta(days=offset),
+            attendance_status=statuses[code],
+        )
+    # Outside of the school year
+    DailyLogFactory(
+        student=first,
+        date=school_year.end_date + timedelta(days=1),
+        attendance_status=statuses["PRESENT"],
+    )
+
+    report = build_attendance_report(
+        [first, second],
+        statuses.values(),
+        school_year,
+    )
+
+    assert [row["student"] for row in report] == [first, second]
+    assert report[0]["total_days"] == 4  # noqa: PLR2004
+    assert report[0]["instructional_days"] == 3  # noqa: PLR2004
+    assert report[0]["status_counts"]["PRESENT"]["count"] == 2  # noqa: PLR2004
+    assert report[0]["status_counts"]["SICK"]["count"] == 1
+    assert report[0]["status_counts"]["ABSENT"]["count"] == 0
+    assert report[1]["total_days"] == 0
+    assert report[1]["instructional_days"] == 0
+
+
+def test_build_attendance_report_query_count(user: User, django_assert_num_queries):
+    statuses = _statuses(user)
+    students = StudentFactory.create_batch(5, user=user)
+    for student in students:
+        for offset, status in enumerate(statuses.values()):
+            DailyLogFactory(
+                student=student,
+                date=date(2024, 9, 2) + timedelta(days=offset),
+                attendance_status=status,
+            )
+
+    with django_assert_num_queries(1):
+        report = build_attendance_report(students, list(statuses.values()))
+
+    assert all(row["total_days"] == len(statuses) for row in report)
@@ -0,0 +1,93 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import CommandError
+from django.core.management import call_command
+
+from idahomeschool.academics.models import AttendanceRollup
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.rollups import find_attendance_rollup_drift
+from idahomeschool.academics.tests.factories import DailyLogFactory
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def statuses(user: User):
+    AttendanceStatus.create_defaults_for_user(user)
+    return {s.code: s for s in AttendanceStatus.objects.filter(user=user)}
+
+
+def _counts(school_year):
+    return {
+        (r.student_id, r.attendance_status.code): r.day_count
+        for r in AttendanceRollup.objects.filter(school_year=school_year)
+        if r.day_count
+    }
+
+
+def test_rollup_follows_daily_log_writes(user: User, statuses):
+    school_year = SchoolYearFactory(user=user)
+    student = StudentFactory(user=user)
+    day = school_year.start_date
+
+    DailyLogFactory(student=student, date=day, attendance_status=statuses["PRESENT"])
+    log, _created = DailyLog.objects.update_or_create(
+        student=student,
+        date=day + timedelta(days=1),
+        defaults={"attendance_status": statuses["PRESENT"], "user": user},
+    )
+    assert _counts(school_year) == {(student.id, "PRESENT"): 2}
+
+    DailyLog.objects.update_or_create(
+        student=student,
+        date=log.date,
+        defaults={"attendance_status": statuses["SICK"], "user": user},
+    )
+    assert _counts(school_year) == {
+        (student.id, "PRESENT"): 1,
+        (student.id, "SICK"): 1,
+    }
+
+    DailyLog.objects.filter(student=student, date=day).delete()
+    assert _counts(school_year) == {(student.id, "SICK"): 1}
+    assert find_attendance_rollup_drift(user=user) == []
+
+
+def test_rollup_rebuilt_when_school_year_dates_change(user: User, statuses):
+    school_year = SchoolYearFactory(user=user)
+    student = StudentFactory(user=user)
+    DailyLogFactory(
+        student=student,
+        date=school_year.start_date - timedelta(days=1),
+        attendance_status=statuses["PRESENT"],
+    )
+    assert _counts(school_year) == {}
+
+    school_year.start_date -= timedelta(days=7)
+    school_year.save()
+
+    assert _counts(school_year) == {(student.id, "PRESENT"): 1}
+
+
+def test_rebuild_command_fixes_drift(user: User, statuses):
+    school_year = SchoolYearFactory(user=user)
+    student = StudentFactory(user=user)
+    DailyLogFactory(
+        student=student,
+        date=school_year.start_date,
+        attendance_status=statuses["PRESENT"],
+    )
+    AttendanceRollup.objects.update(day_count=5)
+
+    with pytest.raises(CommandError):
+        call_command("rebuild_attendance_rollups", "--check")
+
+    call_command("rebuild_attendance_rollups", user=user.username)
+
+    assert _counts(school_year) == {(student.id, "PRESENT"): 1}
+    call_command("rebuild_attendance_rollups", "--check")
@@ -0,0 +1,59 @@
+import pytest
+from django.core.cache import cache
+from django.test import RequestFactory
+
+from idahomeschool.academics.school_years import get_active_school_year
+from idahomeschool.academics.school_years import get_request_active_school_year
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def test_active_school_year_cached(user: User, django_assert_num_queries):
+    SchoolYearFactory(user=user)
+    active = SchoolYearFactory(user=user, is_active=True)
+
+    assert get_active_school_year(user) == active
+    with django_assert_num_queries(0):
+        assert get_active_school_year(user) == active
+
+
+def test_missing_active_school_year_cached(user: User, django_assert_num_queries):
+    SchoolYearFactory(user=user)
+
+    assert get_active_school_year(user) is None
+    with django_assert_num_queries(0):
+        assert get_active_school_year(user) is None
+
+
+def test_active_school_year_invalidated_on_save_and_delete(
+    user: User,
+    django_capture_on_commit_callbacks,
+):
+    first = SchoolYearFactory(user=user, is_active=True)
+    second = SchoolYearFactory(user=user)
+    assert get_active_school_year(user) == first
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second.is_active = True
+        second.save()
+    assert get_active_school_year(user) == second
+
+    with django_capture_on_commit_callbacks(execute=True):
+        second.delete()
+    assert get_active_school_year(user) is None
+
+
+def test_request_active_school_year_resolved_once(
+    user: User,
+    django_assert_num_queries,
+):
+    active = SchoolYearFactory(user=user, is_active=True)
+    request = RequestFactory().get("/")
+    request.user = user
+
+    with django_assert_num_queries(1):
+        assert get_request_active_school_year(request) == active
+        cache.clear()
+        assert get_request_active_school_year(request) == active
@@ -0,0 +1,83 @@
+import pytest
+from django.urls import reverse
+
+from idahomeschool.academics.models import Resource
+from idahomeschool.academics.search import search_resources
+from idahomeschool.academics.search import trigram_search_available
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def library(user: User):
+    return {
+        "history": Resource.objects.create(
+            user=user,
+            title="The Story of the World",
+            author="Susan Wise Bauer",
+            publisher="Well-Trained Mind Press",
+            isbn="978-1-933339-00-4",
+        ),
+        "math": Resource.objects.create(
+            user=user,
+            title="Singapore Math 3A",
+            publisher="Marshall Cavendish",
+            description="A story-driven workbook",
+        ),
+        "latin": Resource.objects.create(
+            user=user,
+            title="Latin for Children",
+            author="Aaron Larsen",
+            publisher="Classical Academic Press",
+        ),
+    }
+
+
+def _search(user, text):
+    return list(search_resources(Resource.objects.filter(user=user), text))
+
+
+def test_search_vector_kept_current(user: User, library):
+    assert _search(user, "latin") == [library["latin"]]
+
+    library["latin"].title = "Lingua Latina"
+    library["latin"].save()
+
+    assert _search(user, "children") == []
+    assert _search(user, "lingua") == [library["latin"]]
+
+
+def test_search_matches_prefixes_stems_and_isbn(user: User, library):
+    assert _search(user, "singa") == [library["math"]]
+    assert _search(user, "bauer wor") == [library["history"]]
+    assert _search(user, "9781933339") == [library["history"]]
+    assert _search(user, "978-1-933339-00-4") == [library["history"]]
+    assert _search(user, "!!!") == []
+
+
+def test_search_ranks_title_above_description(user: User, library):
+    assert _search(user, "story") == [library["history"], library["math"]]
+
+
+def test_search_scoped_to_queryset(user: User, library):
+    Resource.objects.create(user=User.objects.create(username="other"), title="Latin")
+
+    assert _search(user, "latin") == [library["latin"]]
+
+
+def test_search_tolerates_typos(user: User, library):
+    if not trigram_search_available():
+        pytest.skip("pg_trgm is not installed")
+
+    assert _search(user, "Singapour") == [library["math"]]
+
+
+def test_resource_views_use_search(client, user: User, library):
+    client.force_login(user)
+
+    response = client.get(reverse("academics:resource_list"), {"search": "story"})
+    assert list(response.context["resources"]) == [library["history"], library["math"]]
+
+    response = client.get(reverse("academics:resource_search_htmx"), {"search": "lat"})
+    assert list(response.context["resources"]) == [library["latin"]]
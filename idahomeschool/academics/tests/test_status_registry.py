@@ -0,0 +1,58 @@
+import pytest
+
+from idahomeschool.academics.models import AttendanceStatus
+from idahomeschool.academics.status_registry import get_attendance_statuses
+from idahomeschool.academics.tests.factories import AttendanceStatusFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def test_registry_lookups(user: User):
+    AttendanceStatus.create_defaults_for_user(user)
+    present = AttendanceStatus.objects.get(user=user, code="PRESENT")
+
+    statuses = get_attendance_statuses(user)
+
+    assert [s.code for s in statuses.all()] == [
+        s["code"] for s in AttendanceStatus.DEFAULT_STATUSES
+    ]
+    assert statuses.get_by_id(present.id) == present
+    assert statuses.get_by_code("PRESENT") == present
+    assert statuses.get_by_code("MISSING") is None
+    assert statuses.get_by_id(None) is None
+    assert statuses.default() == present
+
+
+def test_registry_default_falls_back_to_first(user: User):
+    first = AttendanceStatusFactory(user=user, display_order=0)
+    AttendanceStatusFactory(user=user, display_order=1)
+
+    assert get_attendance_statuses(user).default() == first
+
+
+def test_registry_warm_cache_has_no_queries(user: User, django_assert_num_queries):
+    AttendanceStatus.create_defaults_for_user(user)
+    get_attendance_statuses(user)
+
+    with django_assert_num_queries(0):
+        statuses = get_attendance_statuses(user)
+        assert statuses.get_by_code("SICK").label == "Sick"
+        assert statuses.default().code == "PRESENT"
+
+
+def test_registry_invalidated_on_save_and_delete(
+    user: User,
+    django_capture_on_commit_callbacks,
+):
+    AttendanceStatus.create_defaults_for_user(user)
+    sick = get_attendance_statuses(user).get_by_code("SICK")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        sick.label = "Ill"
+        sick.save()
+    assert get_attendance_statuses(user).get_by_code("SICK").label == "Ill"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        sick.delete()
+    assert get_attendance_statuses(user).get_by_code("SICK") is None
@@ -0,0 +1,127 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from idahomeschool.academics.forms import CourseEnrollmentForm
+from idahomeschool.academics.models import Student
+from idahomeschool.academics.models import StudentGradeYear
+from idahomeschool.academics.student_grades import grades_for_students
+from idahomeschool.academics.tests.factories import CourseEnrollmentFactory
+from idahomeschool.academics.tests.factories import CourseFactory
+from idahomeschool.academics.tests.factories import GradeLevelFactory
+from idahomeschool.academics.tests.factories import SchoolYearFactory
+from idahomeschool.academics.tests.factories import StudentFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _assign(student, school_year, grade_level):
+    return StudentGradeYear.objects.create(
+        user=student.user,
+        student=student,
+        school_year=school_year,
+        grade_level=grade_level,
+    )
+
+
+def test_grades_for_students(user: User, django_assert_num_queries):
+    this_year, last_year = SchoolYearFactory.create_batch(2, user=user)
+    third, fourth = GradeLevelFactory.create_batch(2, user=user)
+    first, second, ungraded = StudentFactory.create_batch(3, user=user)
+    _assign(first, this_year, fourth)
+    _assign(first, last_year, third)
+    _assign(second, this_year, third)
+    _assign(ungraded, last_year, third)
+
+    with django_assert_num_queries(1):
+        grades = grades_for_students([first, second, ungraded], this_year)
+        assert grades == {first.pk: fourth, second.pk: third}
+        assert grades[first.pk].name == fourth.name
+
+    assert grades_for_students([first.pk], last_year.pk) == {first.pk: third}
+    assert grades_for_students([first], None) == {}
+
+
+def test_get_grade_for_year_uses_prefetched_grade_years(
+    user: User,
+    django_assert_num_queries,
+):
+    this_year, last_year, next_year = SchoolYearFactory.create_batch(3, user=user)
+    third, fourth = GradeLevelFactory.create_batch(2, user=user)
+    student = StudentFactory(user=user)
+    _assign(student, this_year, fourth)
+    _assign(student, last_year, third)
+
+    assert student.get_grade_for_year(this_year) == fourth
+
+    student = Student.objects.prefetch_related("grade_years__grade_level").get(
+        pk=student.pk,
+    )
+    with django_assert_num_queries(0):
+        assert student.get_grade_for_year(this_year) == fourth
+        assert student.get_grade_for_year(last_year) == third
+        assert student.get_grade_for_year(next_year) is None
+
+
+def test_student_list_resolves_grades_in_one_query(client, user: User):
+    school_year = SchoolYearFactory(user=user, is_active=True)
+    grade_level = GradeLevelFactory(user=user)
+    client.force_login(user)
+    url = reverse("academics:student_list")
+    # Warm the active school year cache
+    client.get(url)
+
+    def list_queries(student_count):
+        for student in StudentFactory.create_batch(student_count, user=user):
+            _assign(student, school_year, grade_level)
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        assert all(
+            student.current_grade == grade_level
+            for student in response.context["students"]
+        )
+        return len(queries)
+
+    assert list_queries(2) == list_queries(6)
+
+
+def test_filter_courses_by_student_grade(client, user: User):
+    school_year = SchoolYearFactory(user=user)
+    third, fourth = GradeLevelFactory.create_batch(2, user=user)
+    student = StudentFactory(user=user)
+    _assign(student, school_year, third)
+    matching = CourseFactory(user=user, grade_level=third)
+    universal = CourseFactory(user=user, grade_level=None)
+    other = CourseFactory(user=user, grade_level=fourth)
+    client.force_login(user)
+
+    response = client.get(
+        reverse("academics:filter_courses_by_student"),
+        {"student": student.pk, "school_year": school_year.pk},
+    )
+
+    html = response.content.decode()
+    assert matching.name in html
+    assert universal.name in html
+    assert other.name not in html
+
+
+def test_enrollment_form_keeps_courses_outside_student_grade(user: User):
+    school_year = SchoolYearFactory(user=user)
+    third, fourth = GradeLevelFactory.create_batch(2, user=user)
+    student = StudentFactory(user=user)
+    _assign(student, school_year, third)
+    # Enrolled in a course for another grade
+    course = CourseFactory(user=user, grade_level=fourth)
+    enrollment = CourseEnrollmentFactory(
+        student=student,
+        course=course,
+        school_year=school_year,
+    )
+
+    form = CourseEnrollmentForm(instance=enrollment, user=user)
+
+    assert course.pk in dict(form.fields["course"].choices)
+    assert form["course"].value() == course.pk
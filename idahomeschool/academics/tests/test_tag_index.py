@@ -0,0 +1,115 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from idahomeschool.academics import tag_index
+from idahomeschool.academics.tag_index import get_tag_index
+from idahomeschool.academics.tag_index import search_tags
+from idahomeschool.academics.tests.factories import ResourceFactory
+from idahomeschool.academics.tests.factories import TagFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _names(tags):
+    return [tag["name"] for tag in tags]
+
+
+def test_search_ranks_prefix_matches_by_usage(user: User):
+    math, maps, algebra, _art = (
+        TagFactory(user=user, name=name) for name in ("Math", "Maps", "Algebra", "Art")
+    )
+    ResourceFactory(user=user).tags.add(maps, algebra)
+    ResourceFactory(user=user).tags.add(maps)
+    # Another user's tags never match
+    TagFactory(name="Mammals")
+
+    assert _names(search_tags(user, "ma")) == ["Maps", "Math"]
+    # Substring matches follow the prefix matches
+    assert _names(search_tags(user, "A")) == ["Algebra", "Art", "Maps", "Math"]
+    assert _names(search_tags(user, "a", limit=2)) == ["Algebra", "Art"]
+    assert search_tags(user, "zzz") == []
+    assert search_tags(user, "math") == [
+        {"id": math.id, "name": "Math", "color": math.color},
+    ]
+
+
+def test_search_served_from_cache(user: User, django_assert_num_queries):
+    TagFactory.create_batch(3, user=user)
+
+    with django_assert_num_queries(1):
+        search_tags(user, "tag")
+    with django_assert_num_queries(0):
+        assert len(search_tags(user, "t")) == 3  # noqa: PLR2004
+        assert len(search_tags(user, "")) == 3  # noqa: PLR2004
+
+
+def test_index_invalidated(user: User, django_capture_on_commit_callbacks):
+    tag = TagFactory(user=user, name="Science")
+    other = TagFactory(user=user, name="Spelling")
+    resource = ResourceFactory(user=user)
+    assert _names(search_tags(user, "s")) == ["Science", "Spelling"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        resource.tags.add(other)
+    assert _names(search_tags(user, "s")) == ["Spelling", "Science"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        tag.name = "Biology"
+        tag.save()
+    assert _names(search_tags(user, "s")) == ["Spelling"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        resource.delete()
+    assert len(get_tag_index(user)) == 2  # noqa: PLR2004
+    assert _names(search_tags(user, "")) == ["Biology", "Spelling"]
+
+
+def test_oversized_index_falls_back_to_database(user: User, monkeypatch):
+    monkeypatch.setattr(tag_index, "MAX_INDEXED_TAGS", 2)
+    popular = TagFactory(user=user, name="Popular")
+    ResourceFactory(user=user).tags.add(popular)
+    TagFactory(user=user, name="Rare one")
+    TagFactory(user=user, name="Rare two")
+
+    index = get_tag_index(user)
+
+    assert len(index) == 2  # noqa: PLR2004
+    assert not index.complete
+    assert _names(search_tags(user, "rare")) == ["Rare one", "Rare two"]
+
+
+def test_empty_query_lists_every_tag_by_name(
+    user: User,
+    monkeypatch,
+    django_assert_num_queries,
+):
+    count = 60
+    tags = TagFactory.create_batch(count, user=user)
+    # Usage never reorders the full list
+    ResourceFactory(user=user).tags.add(tags[-1])
+    expected = sorted((tag.name for tag in tags), key=str.casefold)
+
+    with django_assert_num_queries(1):
+        assert _names(search_tags(user, "")) == expected
+    with django_assert_num_queries(0):
+        assert _names(search_tags(user, "")) == expected
+
+    # Tags left out of an oversized index still come from the database
+    cache.clear()
+    monkeypatch.setattr(tag_index, "MAX_INDEXED_TAGS", 10)
+    assert len(search_tags(user, "")) == count
+
+
+def test_autocomplete_view(client, user: User):
+    TagFactory(user=user, name="History")
+    client.force_login(user)
+
+    response = client.get(
+        reverse("academics:tag_autocomplete_htmx"),
+        {"search": "hist"},
+        headers={"HX-Request": "true"},
+    )
+
+    assert _names(response.json()["tags"]) == ["History"]
@@ -0,0 +1,174 @@
+import json
+
+import pytest
+from django.urls import reverse
+
+from idahomeschool.academics.forms import BookTagPreferenceForm
+from idahomeschool.academics.forms import ResourceForm
+from idahomeschool.academics.models import Resource
+from idahomeschool.academics.models import Tag
+from idahomeschool.academics.tags import filter_by_all_tags
+from idahomeschool.academics.tags import parse_tag_ids
+from idahomeschool.academics.tags import parse_tags_data
+from idahomeschool.academics.tests.factories import ResourceFactory
+from idahomeschool.academics.tests.factories import TagFactory
+from idahomeschool.users.models import User
+
+pytestmark = pytest.mark.django_db
+
+
+def _resource_form(user, tags, instance=None):
+    return ResourceForm(
+        {
+            "title": "Story of the World",
+            "resource_type": "BOOK",
+            "tags_data": json.dumps(tags),
+        },
+        user=user,
+        instance=instance,
+    )
+
+
+def test_parse_tags_data_ignores_malformed_input():
+    assert parse_tags_data(None) == []
+    assert parse_tags_data("not json") == []
+    assert parse_tags_data('{"id": 1}') == []
+    assert parse_tags_data('[{"id": 1, "name": "a"}, 3]') == [{"id": 1, "name": "a"}]
+
+
+def test_resource_form_syncs_tags(user: User):
+    history = Tag.objects.create(user=user, name="History")
+    science = Tag.objects.create(user=user, name="Science")
+    other_user = User.objects.create(username="other")
+    other_users_tag = Tag.objects.create(user=other_user, name="Art")
+
+    form = _resource_form(
+        user,
+        [
+            {"id": history.id, "name": "History"},
+            {"id": -1, "name": "Science"},
+            {"id": -2, "name": "Read Aloud"},
+            {"id": other_users_tag.id, "name": "Art"},
+            {"id": -3, "name": "  "},
+        ],
+    )
+    assert form.is_valid(), form.errors
+    resource = form.save()
+
+    assert sorted(resource.tags.values_list("name", flat=True)) == [
+        "Art",
+        "History",
+        "Read Aloud",
+        "Science",
+    ]
+    assert science in resource.tags.all()
+    assert other_users_tag not in resource.tags.all()
+    assert Tag.objects.filter(user=user).count() == 4  # noqa: PLR2004
+
+    form = _resource_form(
+        user,
+        [{"id": history.id, "name": "History"}],
+        instance=resource,
+    )
+    assert form.is_valid(), form.errors
+    form.save()
+    assert list(resource.tags.all()) == [history]
+
+
+def test_resource_form_tag_query_count(user: User, django_assert_max_num_queries):
+    existing = [Tag.objects.create(user=user, name=f"Tag {i}") for i in range(10)]
+    tags = [{"id": tag.id, "name": tag.name} for tag in existing]
+    tags += [{"id": -i, "name": f"New {i}"} for i in range(1, 6)]
+    form = _resource_form(user, tags)
+    assert form.is_valid(), form.errors
+
+    # Insert resource, resolve tags, palette (2), create tags, refetch them,
+    # read current links, insert links
+    with django_assert_max_num_queries(8):
+        resource = form.save()
+
+    assert resource.tags.count() == 15  # noqa: PLR2004
+
+
+def test_book_tag_preference_form_only_uses_existing_tags(user: User):
+    books = Tag.objects.create(user=user, name="Books")
+    novels = Tag.objects.create(user=user, name="Novels")
+    form = BookTagPreferenceForm(
+        {
+            "tags_data": json.dumps(
+                [
+                    {"id": books.id, "name": "Books"},
+                    {"id": -1, "name": "Novels"},
+                    {"id": -2, "name": "Poetry"},
+                    {"id": 999999, "name": "Novels"},
+                ],
+            ),
+        },
+        user=user,
+    )
+    assert form.is_valid(), form.errors
+    preference = form.save()
+
+    assert set(preference.tags.all()) == {books, novels}
+    assert not Tag.objects.filter(name="Poetry").exists()
+    assert not Resource.objects.exists()
+
+
+@pytest.fixture
+def tagged(user: User):
+    history, science, reader = TagFactory.create_batch(3, user=user)
+    resources = {
+        "both": ResourceFactory(user=user, title="Both"),
+        "history": ResourceFactory(user=user, title="History only"),
+        "all": ResourceFactory(user=user, title="All three"),
+        "none": ResourceFactory(user=user, title="Untagged"),
+    }
+    resources["both"].tags.add(history, science)
+    resources["history"].tags.add(history)
+    resources["all"].tags.add(history, science, reader)
+    return {"tags": (history, science, reader), **resources}
+
+
+def test_parse_tag_ids():
+    assert parse_tag_ids(["3", "1", "x", "", "3", None]) == [1, 3]
+
+
+def test_filter_by_all_tags(user: User, tagged, django_assert_num_queries):
+    history, science, reader = tagged["tags"]
+    resources = Resource.objects.filter(user=user).order_by("title")
+
+    with django_assert_num_queries(1):
+        both = list(filter_by_all_tags(resources, [history.id, science.id]))
+
+    assert both == [tagged["all"], tagged["both"]]
+    assert list(filter_by_all_tags(resources, [history.id, reader.id])) == [
+        tagged["all"],
+    ]
+    assert filter_by_all_tags(resources, [history.id]).count() == 3  # noqa: PLR2004
+    assert filter_by_all_tags(resources, []).count() == 4  # noqa: PLR2004
+
+
+def test_resource_list_filters_by_several_tags(client, user: User, tagged):
+    history, science, _reader = tagged["tags"]
+    client.force_login(user)
+
+    response = client.get(
+        reverse("academics:resource_list"),
+        {"tag": [history.id, science.id, "bogus"]},
+    )
+
+    assert list(response.context["resources"]) == [tagged["all"], tagged["both"]]
+    assert response.context["selected_tags"] == [str(history.id), str(science.id)]
+
+
+def test_resource_search_htmx_filters_by_several_tags(client, user: User, tagged):
+    history, science, _reader = tagged["tags"]
+    client.force_login(user)
+
+    response = client.get(
+        reverse("academics:resource_search_htmx"),
+        {"tag_ids[]": [history.id, science.id]},
+        headers={"HX-Request": "true"},
+    )
+
+    assert set(response.context["resources"]) == {tagged["all"], tagged["both"]}
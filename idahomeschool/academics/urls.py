@@ -51,6 +51,11 @@ urlpatterns = [
         views.resource_search_htmx,
         name="resource_search_htmx",
     ),
+    path(
+        "library/facets/",
+        views.resource_facets_htmx,
+        name="resource_facets_htmx",
+    ),
     path(
         "resources/create-modal/",
         views.resource_create_modal_htmx,
@@ -345,6 +350,21 @@ urlpatterns = [
         views.AttendanceReportPDFView.as_view(),
         name="attendance_report_pdf",
     ),
+    path(
+        "attendance/history/csv/",
+        views.AttendanceHistoryCSVView.as_view(),
+        name="attendance_history_csv",
+    ),
+    path(
+        "reports/exports/<int:pk>/status/",
+        views.report_export_status,
+        name="report_export_status",
+    ),
+    path(
+        "reports/exports/<int:pk>/download/",
+        views.report_export_download,
+        name="report_export_download",
+    ),
     # Attendance Status Management URLs
     path(
         "settings/attendance-statuses/",
@@ -393,6 +413,11 @@ urlpatterns = [
         views.attendance_quick_delete,
         name="attendance_quick_delete",
     ),
+    path(
+        "attendance/bulk-update/",
+        views.attendance_bulk_update,
+        name="attendance_bulk_update",
+    ),
     path(
         "attendance/course-notes/<int:student_pk>/<str:log_date>/",
         views.attendance_course_notes,
@@ -6,6 +6,11 @@ from pathlib import Path
 from django.core.files.base import ContentFile
 from PIL import Image
 
+from idahomeschool.academics.renditions import decode_reduced
+from idahomeschool.academics.renditions import flatten_to_rgb
+from idahomeschool.academics.renditions import image_sources
+from idahomeschool.academics.renditions import scaled_size
+
 
 def generate_thumbnail(image_field, size=(150, 150)):
     """
@@ -22,16 +27,12 @@ def generate_thumbnail(image_field, size=(150, 150)):
         return None
 
     try:
-        # Open the image
+        # Open the image, decoding large JPEGs at a reduced scale
         img = Image.open(image_field)
+        scale = min(size[0] / img.width, size[1] / img.height)
+        img = decode_reduced(img, scaled_size(img.size, scale))
 
-        # Convert RGBA to RGB if necessary (for PNG with transparency)
-        if img.mode in ("RGBA", "LA", "P"):
-            background = Image.new("RGB", img.size, (255, 255, 255))
-            if img.mode == "P":
-                img = img.convert("RGBA")
-            background.paste(img, mask=img.split()[-1] if img.mode == "RGBA" else None)
-            img = background
+        img = flatten_to_rgb(img)
 
         # Create thumbnail
         img.thumbnail(size, Image.Resampling.LANCZOS)
@@ -56,6 +57,8 @@ def get_thumbnail_url(student, default="/static/images/default-avatar.png"):
     """
     Get the thumbnail URL for a student's photo.
 
+    Uses the smallest adequate rendition once the worker has generated them.
+
     Args:
         student: Student model instance
         default: Default image URL if no photo exists
@@ -64,5 +67,5 @@ def get_thumbnail_url(student, default="/static/images/default-avatar.png"):
         URL string for the thumbnail or default image
     """
     if student.photo:
-        return student.photo.url
+        return image_sources(student.photo, 64)["src"]
     return default
@@ -8,6 +8,7 @@ organized into logical submodules for better maintainability.
 # Dashboard views
 # Attendance and Daily Log views
 from .attendance import AttendanceCalendarView
+from .attendance import AttendanceHistoryCSVView
 from .attendance import AttendanceReportPDFView
 from .attendance import AttendanceReportView
 from .attendance import AttendanceStatusCreateView
@@ -20,6 +21,7 @@ from .attendance import DailyLogDetailView
 from .attendance import DailyLogEntryView
 from .attendance import DailyLogListView
 from .attendance import DailyLogUpdateView
+from .attendance import attendance_bulk_update
 from .attendance import attendance_course_notes
 from .attendance import attendance_quick_delete
 from .attendance import attendance_quick_toggle
@@ -49,6 +51,10 @@ from .curriculum import CurriculumResourceCreateView
 from .curriculum import CurriculumResourceDeleteView
 from .curriculum import CurriculumResourceUpdateView
 from .dashboard import DashboardView
+
+# Background report exports
+from .exports import report_export_download
+from .exports import report_export_status
 from .grades import GradeLevelCreateView
 from .grades import GradeLevelDeleteView
 from .grades import GradeLevelDetailView
@@ -70,6 +76,7 @@ from .library import ColorPaletteUpdateView
 from .library import ColorUpdateView
 from .library import remove_color_from_palette
 from .library import resource_create_modal_htmx
+from .library import resource_facets_htmx
 from .library import resource_search_htmx
 from .library import ResourceCreateView
 from .library import ResourceDeleteView
@@ -114,6 +121,7 @@ from .students import StudentUpdateView
 
 __all__ = [
     "AttendanceCalendarView",
+    "AttendanceHistoryCSVView",
     "AttendanceReportPDFView",
     "AttendanceReportView",
     "AttendanceStatusCreateView",
@@ -204,6 +212,7 @@ __all__ = [
     # Tags
     "TagListView",
     "TagUpdateView",
+    "attendance_bulk_update",
     "attendance_course_notes",
     "attendance_quick_delete",
     # HTMX endpoints
@@ -214,7 +223,10 @@ __all__ = [
     "filter_courses_by_student",
     "reading_list_quick_update_htmx",
     "remove_color_from_palette",
+    "report_export_download",
+    "report_export_status",
     "resource_create_modal_htmx",
+    "resource_facets_htmx",
     "resource_search_htmx",
     "set_active_palette",
     "tag_autocomplete_htmx",
@@ -1,6 +1,7 @@
 from datetime import date
 from datetime import datetime
 from datetime import timedelta
+from itertools import chain
 
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
@@ -8,6 +9,7 @@ from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.mixins import UserPassesTestMixin
 from django.db.models import Max
 from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.shortcuts import redirect
 from django.shortcuts import render
@@ -21,30 +23,50 @@ from django.views.generic import DetailView
 from django.views.generic import ListView
 from django.views.generic import TemplateView
 from django.views.generic import UpdateView
-from weasyprint import HTML
 
+from idahomeschool.academics.attendance_grid import build_attendance_grid
+from idahomeschool.academics.attendance_grid import calendar_dates
+from idahomeschool.academics.attendance_grid import calendar_version
+from idahomeschool.academics.bulk_attendance import bulk_mark_attendance
+from idahomeschool.academics.conditional import conditional_response
+from idahomeschool.academics.course_notes import active_enrollment_ids
+from idahomeschool.academics.course_notes import sync_course_notes
+from idahomeschool.academics.exports import request_report_export
+from idahomeschool.academics.forms import BulkAttendanceForm
 from idahomeschool.academics.forms import DailyLogForm
+from idahomeschool.academics.history_export import attendance_history_rows
+from idahomeschool.academics.history_export import iter_csv
 from idahomeschool.academics.models import AttendanceStatus
 from idahomeschool.academics.models import ColorPalette
 from idahomeschool.academics.models import CourseEnrollment
 from idahomeschool.academics.models import CourseNote
 from idahomeschool.academics.models import DailyLog
+from idahomeschool.academics.models import ReportExport
 from idahomeschool.academics.models import SchoolYear
 from idahomeschool.academics.models import Student
+from idahomeschool.academics.pagination import CursorPaginationMixin
+from idahomeschool.academics.reports import build_attendance_report
+from idahomeschool.academics.school_years import get_request_active_school_year
+from idahomeschool.academics.status_registry import get_attendance_statuses
+from idahomeschool.academics.views.exports import report_export_file_response
 
 
 # DailyLog / Attendance Views
-class DailyLogListView(LoginRequiredMixin, ListView):
+class DailyLogListView(LoginRequiredMixin, CursorPaginationMixin, ListView):
     """List all daily logs for the current user."""
 
     model = DailyLog
     template_name = "academics/dailylog_list.html"
+    cursor_template_name = "academics/partials/dailylog_rows.html"
     context_object_name = "daily_logs"
     paginate_by = 20
+    # Walks the (user, date) index newest first
+    cursor_ordering = ("-date", "-id")
 
     def get_queryset(self):
         queryset = DailyLog.objects.filter(user=self.request.user).select_related(
             "student",
+            "attendance_status",
         )
 
         # Filter by student if specified
@@ -197,10 +219,7 @@ class DailyLogEntryView(LoginRequiredMixin, View):
             daily_log = None
 
         # Get student's enrollments for the active school year
-        active_year = SchoolYear.objects.filter(
-            user=request.user,
-            is_active=True,
-        ).first()
+        active_year = get_request_active_school_year(request)
         enrollments = CourseEnrollment.objects.filter(
             user=request.user,
             student=student,
@@ -229,9 +248,7 @@ class DailyLogEntryView(LoginRequiredMixin, View):
             )
 
         # Get user's custom attendance statuses
-        attendance_statuses = AttendanceStatus.objects.filter(
-            user=request.user,
-        ).order_by("display_order")
+        attendance_statuses = get_attendance_statuses(request.user).all()
 
         context = {
             "daily_log": daily_log,
@@ -275,17 +292,9 @@ class DailyLogEntryView(LoginRequiredMixin, View):
             return redirect("academics:dailylog_entry")
 
         # Get or create daily log
-        # Use the default attendance status for this user
-        default_status = AttendanceStatus.objects.filter(
-            user=request.user,
-            is_default=True,
-        ).first()
-
-        # Fallback to first status if no default is set
-        if not default_status:
-            default_status = AttendanceStatus.objects.filter(
-                user=request.user,
-            ).order_by("display_order").first()
+        # Use the default attendance status for this user (or the first one)
+        attendance_statuses = get_attendance_statuses(request.user)
+        default_status = attendance_statuses.default()
 
         daily_log, created = DailyLog.objects.get_or_create(
             student=student,
@@ -297,10 +306,7 @@ class DailyLogEntryView(LoginRequiredMixin, View):
         status_code = request.POST.get("status")
         if status_code:
             # Get the AttendanceStatus object by code
-            attendance_status = AttendanceStatus.objects.filter(
-                user=request.user,
-                code=status_code,
-            ).first()
+            attendance_status = attendance_statuses.get_by_code(status_code)
             if attendance_status:
                 daily_log.attendance_status = attendance_status
 
@@ -309,32 +315,19 @@ class DailyLogEntryView(LoginRequiredMixin, View):
         daily_log.save()
 
         # Process course notes
-        enrollments = CourseEnrollment.objects.filter(
-            user=request.user,
-            student=student,
+        enrollment_ids = active_enrollment_ids(
+            request.user,
+            student,
+            get_request_active_school_year(request),
+        )
+        sync_course_notes(
+            daily_log,
+            {
+                enrollment_id: request.POST.get(f"course_notes_{enrollment_id}", "")
+                for enrollment_id in enrollment_ids
+            },
+            request.user,
         )
-        active_year = SchoolYear.objects.filter(
-            user=request.user,
-            is_active=True,
-        ).first()
-        if active_year:
-            enrollments = enrollments.filter(school_year=active_year)
-
-        for enrollment in enrollments:
-            notes_text = request.POST.get(f"course_notes_{enrollment.id}", "").strip()
-            if notes_text:
-                # Create or update course note
-                CourseNote.objects.update_or_create(
-                    daily_log=daily_log,
-                    course_enrollment=enrollment,
-                    defaults={"notes": notes_text, "user": request.user},
-                )
-            else:
-                # Delete course note if exists and notes are empty
-                CourseNote.objects.filter(
-                    daily_log=daily_log,
-                    course_enrollment=enrollment,
-                ).delete()
 
         messages.success(
             request,
@@ -350,149 +343,93 @@ class DailyLogEntryView(LoginRequiredMixin, View):
 
 
 class AttendanceCalendarView(LoginRequiredMixin, TemplateView):
-    """Calendar view showing attendance for the current week (mobile-optimized)."""
+    """
+    Calendar view showing attendance for the current week (mobile-optimized).
 
-    template_name = "academics/attendance_calendar.html"
+    HTMX navigation gets only the grid fragment. Responses carry an ETag and
+    Last-Modified computed from one summary query, so revisiting a grid that
+    has not changed returns 304 without rendering anything.
+    """
 
-    def get_context_data(self, **kwargs):
-        context = super().get_context_data(**kwargs)
-        user = self.request.user
+    template_name = "academics/attendance_calendar.html"
+    grid_template_names = {
+        "week": "academics/partials/calendar_week_grid.html",
+        "month": "academics/partials/calendar_month_grid.html",
+    }
 
-        # Get date range (default to current week)
-        view_type = self.request.GET.get("view", "week")  # week is now default
+    def get(self, request, *args, **kwargs):
+        self.view_type = "month" if request.GET.get("view") == "month" else "week"
 
         # Get student filter
-        selected_student_id = self.request.GET.get("student")
-        if selected_student_id:
+        self.selected_student_id = request.GET.get("student")
+        if self.selected_student_id:
             try:
-                selected_student_id = int(selected_student_id)
+                self.selected_student_id = int(self.selected_student_id)
             except (ValueError, TypeError):
-                selected_student_id = None
+                self.selected_student_id = None
 
         # Get the reference date (default to today)
-        ref_date_str = self.request.GET.get("date")
-        if ref_date_str:
-            try:
-                ref_date = date.fromisoformat(ref_date_str)
-            except ValueError:
-                ref_date = date.today()
-        else:
-            ref_date = date.today()
+        self.today = date.today()
+        try:
+            self.ref_date = date.fromisoformat(request.GET.get("date", ""))
+        except ValueError:
+            self.ref_date = self.today
 
-        if view_type == "week":
-            # Calculate the start of the week (Sunday)
-            days_since_sunday = (ref_date.weekday() + 1) % 7
-            start_date = ref_date - timedelta(days=days_since_sunday)
-            end_date = start_date + timedelta(days=6)
-            # Simple date range for week view
-            date_range = [
-                {"date": start_date + timedelta(days=i), "is_current_month": True}
-                for i in range(7)
-            ]
-            calendar_start_date = start_date
-            calendar_end_date = end_date
-        else:  # month
-            # Calculate the start and end of the month
-            month_start = ref_date.replace(day=1)
-            if ref_date.month == 12:
-                month_end = ref_date.replace(
-                    year=ref_date.year + 1, month=1, day=1,
-                ) - timedelta(days=1)
-            else:
-                month_end = ref_date.replace(
-                    month=ref_date.month + 1, day=1,
-                ) - timedelta(days=1)
-
-            # Calculate calendar grid boundaries (include prev/next month padding)
-            # Start from the Sunday before (or on) the first of the month
-            calendar_start_date = month_start - timedelta(days=month_start.weekday() + 1)
-            if calendar_start_date > month_start:  # Adjust if month starts on Sunday
-                calendar_start_date = month_start - timedelta(days=7)
-
-            # End on the Saturday after (or on) the last of the month
-            days_after = 6 - month_end.weekday()
-            if days_after == 7:  # Month ends on Saturday
-                days_after = 0
-            calendar_end_date = month_end + timedelta(days=days_after)
-
-            # Build date range with is_current_month flag
-            date_range = []
-            current = calendar_start_date
-            while current <= calendar_end_date:
-                date_range.append({
-                    "date": current,
-                    "is_current_month": current.month == ref_date.month and current.year == ref_date.year,
-                })
-                current += timedelta(days=1)
-
-            start_date = month_start
-            end_date = month_end
-
-        # Get students (filtered if needed)
-        students = Student.objects.filter(user=user).prefetch_related("daily_logs")
-        if selected_student_id:
-            students = students.filter(id=selected_student_id)
-
-        # Get daily logs for the entire calendar date range
-        daily_logs = (
-            DailyLog.objects.filter(
-                user=user,
-                date__gte=calendar_start_date,
-                date__lte=calendar_end_date,
-            )
-            .select_related("student", "attendance_status")
-            .prefetch_related("course_notes")
+        self.start_date, self.end_date, self.date_range = calendar_dates(
+            self.view_type,
+            self.ref_date,
         )
 
-        # Filter logs by selected student if applicable
-        if selected_student_id:
-            daily_logs = daily_logs.filter(student_id=selected_student_id)
-
-        # Organize logs by student and date, and track which logs have course notes
-        logs_by_student_date = {}
-        logs_with_notes = set()
-        for log in daily_logs:
-            if log.student_id not in logs_by_student_date:
-                logs_by_student_date[log.student_id] = {}
-            logs_by_student_date[log.student_id][log.date.isoformat()] = log
-
-            # Check if this log has any course notes
-            if log.course_notes.exists():
-                logs_with_notes.add(log.id)
-
-        # Build attendance grid
-        attendance_grid = []
-        for student in students:
-            row = {"student": student, "dates": []}
-            for date_info in date_range:
-                d = date_info["date"] if isinstance(date_info, dict) else date_info
-                log = logs_by_student_date.get(student.id, {}).get(d.isoformat())
-                has_notes = log.id in logs_with_notes if log else False
-                row["dates"].append({"date": d, "log": log, "has_notes": has_notes})
-            attendance_grid.append(row)
-
-        context["view_type"] = view_type
-        context["ref_date"] = ref_date
-        context["start_date"] = start_date
-        context["end_date"] = end_date
-        context["date_range"] = date_range
+        summary, last_modified = calendar_version(
+            request.user,
+            self.date_range[0]["date"],
+            self.date_range[-1]["date"],
+            self.selected_student_id,
+        )
+        return conditional_response(
+            request,
+            summary,
+            last_modified,
+            lambda: super(AttendanceCalendarView, self).get(request, *args, **kwargs),
+        )
+
+    def get_template_names(self):
+        # HTMX navigation only swaps the grid
+        if self.request.htmx:
+            return [self.grid_template_names[self.view_type]]
+        return [self.template_name]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        user = self.request.user
+
+        # Load students once; the filter dropdown lists all of them
+        all_students = list(Student.objects.filter(user=user))
+        students = all_students
+        if self.selected_student_id:
+            students = [s for s in students if s.id == self.selected_student_id]
+
+        # Build attendance grid for the entire calendar date range
+        attendance_grid = build_attendance_grid(user, students, self.date_range)
+
+        context["view_type"] = self.view_type
+        context["grid_template_name"] = self.grid_template_names[self.view_type]
+        context["ref_date"] = self.ref_date
+        context["start_date"] = self.start_date
+        context["end_date"] = self.end_date
+        context["date_range"] = self.date_range
         context["attendance_grid"] = attendance_grid
-        context["students"] = Student.objects.filter(user=user)  # All students for filter dropdown
-        context["selected_student_id"] = selected_student_id
-        context["today"] = date.today()
+        context["students"] = all_students  # All students for filter dropdown
+        context["selected_student_id"] = self.selected_student_id
+        context["today"] = self.today
         context["prev_date"] = (
-            start_date - timedelta(days=7 if view_type == "week" else 30)
+            self.start_date - timedelta(days=7 if self.view_type == "week" else 30)
         ).isoformat()
-        context["next_date"] = (end_date + timedelta(days=1)).isoformat()
+        context["next_date"] = (self.end_date + timedelta(days=1)).isoformat()
 
         # Get user's custom attendance statuses for legend
-        context["attendance_statuses"] = AttendanceStatus.objects.filter(
-            user=user,
-        ).order_by("display_order")
-
-        # If this is an HTMX request, return just the grid partial
-        if self.request.headers.get("HX-Request"):
-            self.template_name = "academics/partials/calendar_week_grid.html"
+        if not self.request.htmx:
+            context["attendance_statuses"] = get_attendance_statuses(user).all()
 
         return context
 
@@ -511,7 +448,7 @@ class AttendanceReportView(LoginRequiredMixin, TemplateView):
         if year_id:
             school_year = get_object_or_404(SchoolYear, pk=year_id, user=user)
         else:
-            school_year = SchoolYear.objects.filter(user=user, is_active=True).first()
+            school_year = get_request_active_school_year(self.request)
 
         # Get student filter
         student_id = self.request.GET.get("student")
@@ -520,44 +457,14 @@ class AttendanceReportView(LoginRequiredMixin, TemplateView):
             students_queryset = students_queryset.filter(pk=student_id)
 
         # Get user's custom attendance statuses
-        attendance_statuses = AttendanceStatus.objects.filter(
-            user=user,
-        ).order_by("display_order")
+        attendance_statuses = get_attendance_statuses(user).all()
 
         # Build report data
-        report_data = []
-        for student in students_queryset:
-            # Get daily logs for this student in the school year
-            logs_query = DailyLog.objects.filter(student=student).select_related("attendance_status")
-            if school_year:
-                logs_query = logs_query.filter(
-                    date__gte=school_year.start_date, date__lte=school_year.end_date,
-                )
-
-            total_days = logs_query.count()
-
-            # Calculate counts for each custom status
-            status_counts = {}
-            instructional_days = 0
-            for status in attendance_statuses:
-                count = logs_query.filter(attendance_status=status).count()
-                status_counts[status.code] = {
-                    "count": count,
-                    "label": status.label,
-                    "abbreviation": status.abbreviation,
-                    "color": status.color,
-                }
-                if status.is_instructional:
-                    instructional_days += count
-
-            report_data.append(
-                {
-                    "student": student,
-                    "total_days": total_days,
-                    "instructional_days": instructional_days,
-                    "status_counts": status_counts,
-                },
-            )
+        report_data = build_attendance_report(
+            students_queryset,
+            attendance_statuses,
+            school_year,
+        )
 
         context["school_year"] = school_year
         context["school_years"] = SchoolYear.objects.filter(user=user)
@@ -581,7 +488,7 @@ class AttendanceReportPDFView(LoginRequiredMixin, View):
         if year_id:
             school_year = get_object_or_404(SchoolYear, pk=year_id, user=user)
         else:
-            school_year = SchoolYear.objects.filter(user=user, is_active=True).first()
+            school_year = get_request_active_school_year(request)
 
         # Get student filter
         student_id = request.GET.get("student")
@@ -590,58 +497,37 @@ class AttendanceReportPDFView(LoginRequiredMixin, View):
             students_queryset = students_queryset.filter(pk=student_id)
 
         # Get user's custom attendance statuses
-        attendance_statuses = AttendanceStatus.objects.filter(
-            user=user,
-        ).order_by("display_order")
+        attendance_statuses = get_attendance_statuses(user).all()
 
         # Build report data (same logic as AttendanceReportView)
-        report_data = []
-        for student in students_queryset:
-            logs_query = DailyLog.objects.filter(student=student).select_related("attendance_status")
-            if school_year:
-                logs_query = logs_query.filter(
-                    date__gte=school_year.start_date, date__lte=school_year.end_date,
-                )
-
-            total_days = logs_query.count()
-
-            # Calculate counts for each custom status
-            status_counts = {}
-            instructional_days = 0
-            for status in attendance_statuses:
-                count = logs_query.filter(attendance_status=status).count()
-                status_counts[status.code] = {
-                    "count": count,
-                    "label": status.label,
-                    "abbreviation": status.abbreviation,
-                    "color": status.color,
-                }
-                if status.is_instructional:
-                    instructional_days += count
-
-            # Get enrollments for this student in the school year
-            enrollments_query = (
-                CourseEnrollment.objects.filter(
-                    user=user,
-                    student=student,
-                )
-                .select_related("course", "school_year")
-                .prefetch_related("course__resources")
+        report_data = build_attendance_report(
+            students_queryset,
+            attendance_statuses,
+            school_year,
+        )
+
+        # Get enrollments for all reported students in one query
+        enrollments_query = (
+            CourseEnrollment.objects.filter(
+                user=user,
+                student__in=[data["student"] for data in report_data],
             )
+            .select_related("course", "school_year")
+            .prefetch_related("course__resources")
+        )
 
-            if school_year:
-                enrollments_query = enrollments_query.filter(school_year=school_year)
+        if school_year:
+            enrollments_query = enrollments_query.filter(school_year=school_year)
 
-            report_data.append(
-                {
-                    "student": student,
-                    "total_days": total_days,
-                    "instructional_days": instructional_days,
-                    "status_counts": status_counts,
-                    "enrollments": enrollments_query,
-                },
+        enrollments_by_student = {}
+        for enrollment in enrollments_query:
+            enrollments_by_student.setdefault(enrollment.student_id, []).append(
+                enrollment,
             )
 
+        for data in report_data:
+            data["enrollments"] = enrollments_by_student.get(data["student"].id, [])
+
         # Chunk report_data into groups of 3 for table layout
         report_data_chunks = []
         for i in range(0, len(report_data), 3):
@@ -660,13 +546,67 @@ class AttendanceReportPDFView(LoginRequiredMixin, View):
         # Render HTML template
         html_string = render_to_string("academics/attendance_report_pdf.html", context)
 
-        # Generate PDF
-        html = HTML(string=html_string)
-        pdf = html.write_pdf()
-
-        # Return PDF response
-        response = HttpResponse(pdf, content_type="application/pdf")
+        # Queue PDF generation for the run_report_exports worker; an unchanged
+        # report that was generated before is returned right away
         filename = f"attendance_report_{school_year.name if school_year else 'all'}_{date.today().isoformat()}.pdf"
+        export = request_report_export(
+            user,
+            ReportExport.KIND_ATTENDANCE_PDF,
+            html_string,
+            filename,
+        )
+        if export.status == ReportExport.STATUS_DONE:
+            return report_export_file_response(export)
+
+        return render(
+            request,
+            "academics/report_export_status.html",
+            {"export": export},
+        )
+
+
+class AttendanceHistoryCSVView(LoginRequiredMixin, View):
+    """Streaming CSV export of daily logs and their course notes."""
+
+    def get(self, request):
+        """Stream the filtered attendance history as a CSV download."""
+        user = request.user
+
+        # Get optional filters
+        year_id = request.GET.get("year")
+        school_year = None
+        if year_id:
+            school_year = get_object_or_404(SchoolYear, pk=year_id, user=user)
+
+        student_id = request.GET.get("student")
+        student = None
+        if student_id:
+            student = get_object_or_404(Student, pk=student_id, user=user)
+
+        start = request.GET.get("start")
+        end = request.GET.get("end")
+        try:
+            start_date = date.fromisoformat(start) if start else None
+            end_date = date.fromisoformat(end) if end else None
+        except ValueError:
+            return HttpResponse("Invalid date format", status=400)
+
+        rows = attendance_history_rows(
+            user,
+            student=student,
+            school_year=school_year,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        # Rows are fetched and encoded while the response is sent; the byte
+        # order mark lets Excel detect UTF-8
+        response = StreamingHttpResponse(
+            chain(["\ufeff"], iter_csv(rows)),
+            content_type="text/csv; charset=utf-8",
+        )
+        year_name = school_year.name if school_year else "all"
+        filename = f"attendance_history_{year_name}_{date.today().isoformat()}.csv"
         response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
         return response
@@ -692,20 +632,23 @@ def attendance_quick_toggle(request, student_pk, log_date):
     except ValueError:
         return HttpResponse("Invalid date format", status=400)
 
-    # Get existing log if any
-    daily_log = DailyLog.objects.filter(student=student, date=date_obj).first()
+    # Get existing log's status id if any
+    status_id = (
+        DailyLog.objects.filter(student=student, date=date_obj)
+        .values_list("attendance_status_id", flat=True)
+        .first()
+    )
 
     # Get user's custom attendance statuses
-    attendance_statuses = AttendanceStatus.objects.filter(
-        user=request.user,
-    ).order_by("display_order")
+    attendance_statuses = get_attendance_statuses(request.user)
+    current_status = attendance_statuses.get_by_id(status_id)
 
     context = {
         "student": student,
         "date": date_obj,
         "date_str": log_date,
-        "current_status": daily_log.attendance_status.code if (daily_log and daily_log.attendance_status) else None,
-        "attendance_statuses": attendance_statuses,
+        "current_status": current_status.code if current_status else None,
+        "attendance_statuses": attendance_statuses.all(),
     }
 
     return render(request, "academics/partials/status_selector.html", context)
@@ -716,7 +659,7 @@ def attendance_quick_toggle(request, student_pk, log_date):
 def attendance_quick_update(request, student_pk, log_date):
     """
     HTMX endpoint: Update attendance status for a specific student/date.
-    Returns updated badge HTML fragment.
+    Returns the updated cell HTML fragment.
     """
     student = get_object_or_404(Student, pk=student_pk, user=request.user)
 
@@ -730,10 +673,9 @@ def attendance_quick_update(request, student_pk, log_date):
     new_status_code = request.POST.get("status")
 
     # Get the AttendanceStatus object for this user
-    attendance_status = AttendanceStatus.objects.filter(
-        user=request.user,
-        code=new_status_code,
-    ).first()
+    attendance_status = get_attendance_statuses(request.user).get_by_code(
+        new_status_code,
+    )
 
     if not attendance_status:
         return HttpResponse("Invalid status", status=400)
@@ -755,8 +697,8 @@ def attendance_quick_update(request, student_pk, log_date):
         "has_notes": has_notes,
     }
 
-    # Return updated badge
-    response = render(request, "academics/partials/status_badge.html", context)
+    # Return updated cell
+    response = render(request, "academics/partials/calendar_cell.html", context)
 
     # Close the dropdown by also clearing the selector container
     response["HX-Trigger"] = "closeDropdown"
@@ -769,7 +711,7 @@ def attendance_quick_update(request, student_pk, log_date):
 def attendance_quick_delete(request, student_pk, log_date):
     """
     HTMX endpoint: Delete attendance log for a specific student/date.
-    Returns empty badge HTML fragment.
+    Returns the emptied cell HTML fragment.
     """
     student = get_object_or_404(Student, pk=student_pk, user=request.user)
 
@@ -789,7 +731,71 @@ def attendance_quick_delete(request, student_pk, log_date):
         "has_notes": False,
     }
 
-    return render(request, "academics/partials/status_badge.html", context)
+    return render(request, "academics/partials/calendar_cell.html", context)
+
+
+@require_http_methods(["GET", "POST"])
+@login_required
+def attendance_bulk_update(request):
+    """
+    HTMX endpoint: Mark one status for several students over a date range.
+    GET returns the bulk entry modal; a valid POST writes every cell in one
+    transaction and returns the updated badges as out-of-band swaps.
+    """
+    attendance_statuses = get_attendance_statuses(request.user)
+
+    if request.method == "POST":
+        form = BulkAttendanceForm(
+            request.POST,
+            user=request.user,
+            attendance_statuses=attendance_statuses,
+        )
+        if form.is_valid():
+            students = list(form.cleaned_data["students"])
+            dates = form.get_dates()
+            bulk_mark_attendance(
+                request.user,
+                students,
+                dates,
+                attendance_statuses.get_by_code(form.cleaned_data["status"]),
+            )
+
+            context = {
+                "attendance_grid": build_attendance_grid(request.user, students, dates),
+            }
+            response = render(
+                request,
+                "academics/partials/bulk_attendance_cells.html",
+                context,
+            )
+            # Close the modal
+            response["HX-Trigger"] = "closeDropdown"
+            return response
+    else:
+        # Default to Monday-Friday of the week being viewed
+        try:
+            ref_date = date.fromisoformat(request.GET.get("date", ""))
+        except ValueError:
+            ref_date = date.today()
+        monday = ref_date - timedelta(days=ref_date.weekday())
+        default_status = attendance_statuses.default()
+        form = BulkAttendanceForm(
+            initial={
+                "students": Student.objects.filter(user=request.user),
+                "start_date": monday,
+                "end_date": monday + timedelta(days=4),
+                "status": default_status.code if default_status else None,
+                "weekdays_only": True,
+            },
+            user=request.user,
+            attendance_statuses=attendance_statuses,
+        )
+
+    return render(
+        request,
+        "academics/partials/bulk_attendance_modal.html",
+        {"form": form},
+    )
 
 
 @require_http_methods(["GET"])
@@ -811,7 +817,7 @@ def attendance_course_notes(request, student_pk, log_date):
     daily_log = DailyLog.objects.filter(student=student, date=date_obj).first()
 
     # Get active school year
-    active_year = SchoolYear.objects.filter(user=request.user, is_active=True).first()
+    active_year = get_request_active_school_year(request)
 
     # Get enrollments for this student
     enrollments = CourseEnrollment.objects.filter(
@@ -860,17 +866,9 @@ def attendance_save_course_notes(request, student_pk, log_date):
         return HttpResponse("Invalid date format", status=400)
 
     # Get or create daily log
-    # Use the default attendance status for this user
-    default_status = AttendanceStatus.objects.filter(
-        user=request.user,
-        is_default=True,
-    ).first()
-
-    # Fallback to first status if no default is set
-    if not default_status:
-        default_status = AttendanceStatus.objects.filter(
-            user=request.user,
-        ).order_by("display_order").first()
+    # Use the default attendance status for this user (or the first one)
+    attendance_statuses = get_attendance_statuses(request.user)
+    default_status = attendance_statuses.default()
 
     daily_log, created = DailyLog.objects.get_or_create(
         student=student,
@@ -878,62 +876,31 @@ def attendance_save_course_notes(request, student_pk, log_date):
         defaults={"attendance_status": default_status, "user": request.user},
     )
 
-    # Get active school year
-    active_year = SchoolYear.objects.filter(user=request.user, is_active=True).first()
-
-    # Get enrollments for this student
-    enrollments = CourseEnrollment.objects.filter(
-        user=request.user,
-        student=student,
+    # Save course notes for the student's enrollments
+    enrollment_ids = active_enrollment_ids(
+        request.user,
+        student,
+        get_request_active_school_year(request),
     )
-
-    if active_year:
-        enrollments = enrollments.filter(school_year=active_year)
-
-    # Save course notes
-    saved_count = 0
-    for enrollment in enrollments:
-        note_text = request.POST.get(f"enrollment_{enrollment.id}", "").strip()
-
-        if note_text:
-            # Create or update course note
-            CourseNote.objects.update_or_create(
-                daily_log=daily_log,
-                course_enrollment=enrollment,
-                defaults={"notes": note_text, "user": request.user},
-            )
-            saved_count += 1
-        else:
-            # Delete course note if text is empty
-            CourseNote.objects.filter(
-                daily_log=daily_log, course_enrollment=enrollment,
-            ).delete()
-
-    # Check if there are any course notes for this log
-    has_notes = CourseNote.objects.filter(daily_log=daily_log).exists()
-
-    # Render updated badge with out-of-band swap to update the cell
-    # The badge template already has the wrapper div with id, so we need to add hx-swap-oob to it
-    badge_html = render_to_string(
-        "academics/partials/status_badge.html",
+    has_notes = sync_course_notes(
+        daily_log,
         {
-            "student": student,
-            "date_str": log_date,
-            "log": daily_log,
-            "has_notes": has_notes,
+            enrollment_id: request.POST.get(f"enrollment_{enrollment_id}", "")
+            for enrollment_id in enrollment_ids
         },
+        request.user,
     )
 
-    # Add hx-swap-oob attribute to the badge HTML
-    # The badge template starts with <div id="cell-...">
-    badge_html_with_oob = badge_html.replace(
-        f'<div id="cell-{student_pk}-{log_date}"',
-        f'<div id="cell-{student_pk}-{log_date}" hx-swap-oob="true"',
-        1,
-    )
-
-    # Return updated badge HTML with OOB swap to update the badge, and closes modal
-    return HttpResponse(badge_html_with_oob)
+    # Update the cell with out-of-band swaps; the empty main response closes
+    # the modal
+    context = {
+        "student": student,
+        "date_str": log_date,
+        "log": daily_log,
+        "has_notes": has_notes,
+        "oob": True,
+    }
+    return render(request, "academics/partials/calendar_cell.html", context)
 
 
 # =============================================================================
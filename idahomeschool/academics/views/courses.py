@@ -2,7 +2,6 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.mixins import UserPassesTestMixin
-from django.db.models import Q
 from django.http import HttpResponse
 from django.urls import reverse_lazy
 from django.views.decorators.http import require_http_methods
@@ -12,23 +11,28 @@ from django.views.generic import DetailView
 from django.views.generic import ListView
 from django.views.generic import UpdateView
 
+from idahomeschool.academics.conditional import ConditionalGetMixin
+from idahomeschool.academics.course_options import get_course_options
 from idahomeschool.academics.forms import CourseEnrollmentForm
 from idahomeschool.academics.forms import CourseForm
 from idahomeschool.academics.models import Course
 from idahomeschool.academics.models import CourseEnrollment
+from idahomeschool.academics.models import CourseTemplate
 from idahomeschool.academics.models import GradeLevel
 from idahomeschool.academics.models import SchoolYear
 from idahomeschool.academics.models import Student
+from idahomeschool.academics.student_grades import grades_for_students
 
 
 # Course Views
-class CourseListView(LoginRequiredMixin, ListView):
+class CourseListView(LoginRequiredMixin, ConditionalGetMixin, ListView):
     """List all courses for the current user."""
 
     model = Course
     template_name = "academics/course_list.html"
     context_object_name = "courses"
     paginate_by = None  # Disable pagination for grouped view
+    conditional_models = (Course, GradeLevel, CourseTemplate, CourseEnrollment)
 
     def get_queryset(self):
         queryset = (
@@ -273,37 +277,23 @@ def filter_courses_by_student(request):
     student_id = request.GET.get("student")
     school_year_id = request.GET.get("school_year")
 
-    # Get all courses for the user
-    courses = Course.objects.filter(user=request.user).select_related(
-        "grade_level",
-    )
+    student_grade = None
 
     # If both student and school year are provided, filter by grade level
     if student_id and school_year_id:
-        try:
-            student = Student.objects.get(pk=student_id, user=request.user)
-            school_year = SchoolYear.objects.get(
-                pk=school_year_id,
-                user=request.user,
-            )
-
-            # Get the student's grade level for this school year
-            student_grade = student.get_grade_for_year(school_year)
-
-            if student_grade:
-                # Filter: matching grade level or no grade level (universal)
-                courses = courses.filter(
-                    Q(grade_level=student_grade) | Q(grade_level__isnull=True),
-                )
-        except (Student.DoesNotExist, SchoolYear.DoesNotExist):
-            pass
-
-    # Render course options
-    html = '<option value="">---------</option>'
-    for course in courses.order_by("grade_level__order", "name"):
-        grade_label = (
-            f" ({course.grade_level.name})" if course.grade_level else " (Any)"
+        school_year = SchoolYear.objects.filter(
+            pk=school_year_id,
+            user=request.user,
+        ).first()
+
+        # Get the student's grade level for this school year
+        grades = grades_for_students(
+            Student.objects.filter(pk=student_id, user=request.user),
+            school_year,
         )
-        html += f'<option value="{course.pk}">{course.name}{grade_label}</option>'
+        student_grade = next(iter(grades.values()), None)
+
+    # Matching grade level or no grade level (universal), pre-rendered
+    html = get_course_options(request.user, student_grade)["html"]
 
     return HttpResponse(html)
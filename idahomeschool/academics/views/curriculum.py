@@ -11,11 +11,13 @@ from django.views.generic import DetailView
 from django.views.generic import ListView
 from django.views.generic import UpdateView
 
+from idahomeschool.academics.conditional import ConditionalGetMixin
 from idahomeschool.academics.forms import CourseTemplateForm
 from idahomeschool.academics.forms import CurriculumResourceForm
 from idahomeschool.academics.models import Course
 from idahomeschool.academics.models import CourseTemplate
 from idahomeschool.academics.models import CurriculumResource
+from idahomeschool.academics.models import Resource
 
 
 # CourseTemplate Views
@@ -45,12 +47,18 @@ class CourseTemplateListView(LoginRequiredMixin, ListView):
         return context
 
 
-class CourseTemplateDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
+class CourseTemplateDetailView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    ConditionalGetMixin,
+    DetailView,
+):
     """Detail view for a course template."""
 
     model = CourseTemplate
     template_name = "academics/coursetemplate_detail.html"
     context_object_name = "course_template"
+    conditional_models = (CourseTemplate, Course, Resource)
 
     def test_func(self):
         return self.get_object().user == self.request.user
@@ -0,0 +1,47 @@
+from django.contrib.auth.decorators import login_required
+from django.http import FileResponse
+from django.http import Http404
+from django.shortcuts import get_object_or_404
+from django.shortcuts import render
+from django.views.decorators.http import require_http_methods
+
+from idahomeschool.academics.models import ReportExport
+
+# =============================================================================
+# Background Report Exports
+# =============================================================================
+
+
+def report_export_file_response(export):
+    """Return the finished file of an export as a download."""
+    return FileResponse(
+        export.file.open("rb"),
+        as_attachment=True,
+        filename=export.filename,
+    )
+
+
+@require_http_methods(["GET"])
+@login_required
+def report_export_status(request, pk):
+    """
+    HTMX endpoint: Poll the status of a report export.
+    Returns the status fragment, which keeps polling until the job finishes.
+    """
+    export = get_object_or_404(ReportExport, pk=pk, user=request.user)
+    return render(
+        request,
+        "academics/partials/report_export_status.html",
+        {"export": export},
+    )
+
+
+@require_http_methods(["GET"])
+@login_required
+def report_export_download(request, pk):
+    """Download the generated file of a finished report export."""
+    export = get_object_or_404(ReportExport, pk=pk, user=request.user)
+    if export.status != ReportExport.STATUS_DONE:
+        msg = "Report export is not ready"
+        raise Http404(msg)
+    return report_export_file_response(export)
@@ -2,6 +2,7 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.mixins import UserPassesTestMixin
+from django.db import transaction
 from django.shortcuts import redirect
 from django.shortcuts import render
 from django.urls import reverse_lazy
@@ -12,11 +13,11 @@ from django.views.generic import DetailView
 from django.views.generic import ListView
 from django.views.generic import UpdateView
 
+from idahomeschool.academics.conditional import invalidate_data_version
 from idahomeschool.academics.forms import GradeLevelForm
 from idahomeschool.academics.models import GradeLevel
-from idahomeschool.academics.models import SchoolYear
-from idahomeschool.academics.models import Student
 from idahomeschool.academics.models import StudentGradeYear
+from idahomeschool.academics.school_years import get_request_active_school_year
 
 
 # GradeLevel Views
@@ -55,21 +56,22 @@ class GradeLevelDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
         # Get courses for this grade
         context["courses"] = grade_level.courses.all()
 
-        # Get students currently in this grade (active year)
-        active_year = SchoolYear.objects.filter(
-            user=self.request.user,
-            is_active=True,
-        ).first()
-        if active_year:
-            context["current_students"] = Student.objects.filter(
-                grade_years__grade_level=grade_level,
-                grade_years__school_year=active_year,
-            )
-
         # Get all student-year assignments for this grade
-        context["student_assignments"] = StudentGradeYear.objects.filter(
-            grade_level=grade_level,
-        ).select_related("student", "school_year")
+        assignments = list(
+            StudentGradeYear.objects.filter(
+                grade_level=grade_level,
+            ).select_related("student", "school_year"),
+        )
+        context["student_assignments"] = assignments
+
+        # Get students currently in this grade (active year) from the same rows
+        active_year = get_request_active_school_year(self.request)
+        if active_year:
+            context["current_students"] = [
+                assignment.student
+                for assignment in assignments
+                if assignment.school_year_id == active_year.pk
+            ]
 
         return context
 
@@ -189,6 +191,7 @@ def create_pk12_grades(request):
         for name, order in grades
     ]
     GradeLevel.objects.bulk_create(grade_objects)
+    transaction.on_commit(lambda: invalidate_data_version(user.pk, GradeLevel))
 
     messages.success(
         request,
@@ -5,12 +5,13 @@ from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.mixins import UserPassesTestMixin
+from django.db import transaction
 from django.db.models import Count
-from django.db.models import Q
 from django.http import HttpResponse
 from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.shortcuts import render
+from django.urls import reverse
 from django.urls import reverse_lazy
 from django.views.generic import CreateView
 from django.views.generic import DeleteView
@@ -18,6 +19,13 @@ from django.views.generic import DetailView
 from django.views.generic import ListView
 from django.views.generic import UpdateView
 
+from idahomeschool.academics.conditional import ConditionalGetMixin
+from idahomeschool.academics.conditional import conditional_response
+from idahomeschool.academics.conditional import get_data_version
+from idahomeschool.academics.conditional import invalidate_data_version
+from idahomeschool.academics.facets import FACET_MODELS
+from idahomeschool.academics.facets import get_resource_facets
+from idahomeschool.academics.facets import parse_resource_filters
 from idahomeschool.academics.forms import ColorPaletteImportForm
 from idahomeschool.academics.forms import ResourceForm
 from idahomeschool.academics.forms import TagForm
@@ -25,41 +33,39 @@ from idahomeschool.academics.models import Color
 from idahomeschool.academics.models import ColorPalette
 from idahomeschool.academics.models import Resource
 from idahomeschool.academics.models import Tag
+from idahomeschool.academics.search import search_resources
+from idahomeschool.academics.tag_index import search_tags
+from idahomeschool.academics.tags import filter_by_all_tags
+from idahomeschool.academics.tags import parse_tag_ids
 
 
 # Resource Views
-class ResourceListView(LoginRequiredMixin, ListView):
+class ResourceListView(LoginRequiredMixin, ConditionalGetMixin, ListView):
     """List all resources in the library for the current user."""
 
     model = Resource
     template_name = "academics/resource_list.html"
     context_object_name = "resources"
     paginate_by = 20
+    conditional_models = (Resource, Tag)
 
     def get_queryset(self):
         queryset = Resource.objects.filter(user=self.request.user).prefetch_related(
             "tags",
         )
 
-        # Search functionality
-        search_query = self.request.GET.get("search", "")
-        if search_query:
-            queryset = queryset.filter(
-                Q(title__icontains=search_query)
-                | Q(author__icontains=search_query)
-                | Q(publisher__icontains=search_query)
-                | Q(isbn__icontains=search_query),
-            )
+        filters = parse_resource_filters(self.request.GET)
 
         # Filter by resource type
-        resource_type = self.request.GET.get("resource_type", "")
-        if resource_type:
-            queryset = queryset.filter(resource_type=resource_type)
+        if filters["resource_type"]:
+            queryset = queryset.filter(resource_type=filters["resource_type"])
+
+        # Filter by tags (resources must have all selected tags)
+        queryset = filter_by_all_tags(queryset, filters["tag_ids"])
 
-        # Filter by tag
-        tag_id = self.request.GET.get("tag", "")
-        if tag_id:
-            queryset = queryset.filter(tags__id=tag_id)
+        # Ranked full-text search (best matches first)
+        if filters["search"]:
+            return search_resources(queryset, filters["search"])
 
         return queryset.order_by("title")
 
@@ -67,7 +73,12 @@ class ResourceListView(LoginRequiredMixin, ListView):
         context = super().get_context_data(**kwargs)
         context["search_query"] = self.request.GET.get("search", "")
         context["selected_resource_type"] = self.request.GET.get("resource_type", "")
-        context["selected_tag"] = self.request.GET.get("tag", "")
+        context["selected_tags"] = [
+            str(tag_id) for tag_id in parse_tag_ids(self.request.GET.getlist("tag"))
+        ]
+        filters = self.request.GET.copy()
+        filters.pop("page", None)
+        context["filter_query"] = filters.urlencode()
         context["resource_types"] = Resource.RESOURCE_TYPE_CHOICES
         context["tags"] = Tag.objects.filter(user=self.request.user)
         return context
@@ -156,6 +167,71 @@ class ResourceDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
         return super().delete(request, *args, **kwargs)
 
 
+# Most common tags listed in the facet sidebar (selected tags are always listed)
+TAG_FACET_LIMIT = 25
+
+
+def _facet_url(params, key, values):
+    """Link to the resource list with one filter parameter replaced."""
+    params = params.copy()
+    params.pop("page", None)
+    params.setlist(key, values)
+    query = params.urlencode()
+    url = reverse("academics:resource_list")
+    return f"{url}?{query}" if query else url
+
+
+@login_required
+def resource_facets_htmx(request):
+    """HTMX endpoint for the resource library's facet sidebar."""
+    filters = parse_resource_filters(request.GET)
+    summary, last_modified = get_data_version(request.user, FACET_MODELS)
+
+    def render_facets():
+        facets = get_resource_facets(request.user, filters)
+        type_labels = dict(Resource.RESOURCE_TYPE_CHOICES)
+        selected_type = filters["resource_type"]
+        selected_tags = filters["tag_ids"]
+
+        type_facets = [
+            {
+                "label": type_labels.get(value, value),
+                "count": count,
+                "selected": value == selected_type,
+                # Picking the selected type again clears the filter
+                "url": _facet_url(
+                    request.GET,
+                    "resource_type",
+                    [] if value == selected_type else [value],
+                ),
+            }
+            for value, count in facets["types"]
+        ]
+        tag_facets = [
+            {
+                "name": name,
+                "color": color,
+                "count": count,
+                "selected": tag_id in selected_tags,
+                # Clicking a tag adds it to the selection, or removes it
+                "url": _facet_url(
+                    request.GET,
+                    "tag",
+                    [str(other) for other in sorted({*selected_tags} ^ {tag_id})],
+                ),
+            }
+            for rank, (tag_id, name, color, count) in enumerate(facets["tags"])
+            if rank < TAG_FACET_LIMIT or tag_id in selected_tags
+        ]
+        return render(
+            request,
+            "academics/partials/resource_facets.html",
+            {"type_facets": type_facets, "tag_facets": tag_facets},
+        )
+
+    return conditional_response(request, summary, last_modified, render_facets)
+
+
 @login_required
 def resource_search_htmx(request):
     """HTMX endpoint for searching resources."""
@@ -175,17 +251,10 @@ def resource_search_htmx(request):
     queryset = Resource.objects.filter(user=request.user).prefetch_related("tags")
 
     # Filter by tag IDs (AND logic - resource must have ALL selected tags)
-    if tag_ids:
-        for tag_id in tag_ids:
-            queryset = queryset.filter(tags__id=tag_id)
-        queryset = queryset.distinct()
+    queryset = filter_by_all_tags(queryset, parse_tag_ids(tag_ids))
 
     if search_query:
-        queryset = queryset.filter(
-            Q(title__icontains=search_query)
-            | Q(author__icontains=search_query)
-            | Q(publisher__icontains=search_query),
-        )
+        queryset = search_resources(queryset, search_query)
 
     # Limit results to 20
     resources = queryset[:20]
@@ -203,23 +272,11 @@ def resource_search_htmx(request):
 
 @login_required
 def tag_autocomplete_htmx(request):
-    """HTMX endpoint for tag autocomplete."""
+    """HTMX endpoint for tag autocomplete, served from the cached tag index."""
     search_query = request.GET.get("search", "").strip()
 
-    # If no search query, return all tags (useful for showing full list on focus)
-    # Otherwise, filter by search query and limit results
-    if search_query:
-        tags = Tag.objects.filter(
-            user=request.user,
-            name__icontains=search_query,
-        ).values("id", "name", "color").order_by("name")[:10]
-    else:
-        # Return all tags when no search (browsing mode)
-        tags = Tag.objects.filter(
-            user=request.user,
-        ).values("id", "name", "color").order_by("name")
-
-    return JsonResponse({"tags": list(tags)})
+    # Without a search query every tag is listed by name (browsing mode)
+    return JsonResponse({"tags": search_tags(request.user, search_query)})
 
 
 @login_required
@@ -333,13 +390,14 @@ def tag_create_modal_htmx(request):
 
 
 # Tag Views
-class TagListView(LoginRequiredMixin, ListView):
+class TagListView(LoginRequiredMixin, ConditionalGetMixin, ListView):
     """List all tags for the current user."""
 
     model = Tag
     template_name = "academics/tag_list.html"
     context_object_name = "tags"
     paginate_by = 50
+    conditional_models = (Tag, Resource, ColorPalette, Color)
 
     def get_queryset(self):
         return Tag.objects.filter(user=self.request.user).annotate(
@@ -453,13 +511,14 @@ class TagDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
 
 
 # Color Palette Views
-class ColorPaletteListView(LoginRequiredMixin, ListView):
+class ColorPaletteListView(LoginRequiredMixin, ConditionalGetMixin, ListView):
     """List all color palettes (collections) for the current user."""
 
     model = ColorPalette
     template_name = "academics/color_palette_list.html"
     context_object_name = "palettes"
     paginate_by = 50
+    conditional_models = (ColorPalette, Color)
 
     def get_queryset(self):
         return ColorPalette.objects.filter(
@@ -633,39 +692,84 @@ def _process_hex_code(hex_code, line_num):
     return hex_code.upper(), None
 
 
-def _import_colors_from_lines(lines, user, *, palette=None):
-    """Import colors from CSV lines and return counts and errors."""
-    imported_count = 0
-    skipped_count = 0
-    errors = []
+def _parse_hex_lines(lines):
+    """
+    Validate hex codes from CSV lines, dropping repeats.
+
+    Args:
+        lines: Lines of the pasted CSV
 
+    Returns:
+        Tuple of (codes, duplicates, errors): a dict of each distinct hex
+        code to the line it first appears on, the number of repeated lines
+        and the error messages of invalid lines
+    """
+    codes = {}
+    duplicates = 0
+    errors = []
     for line_num, line in enumerate(lines, start=1):
         hex_code, error = _process_hex_code(line, line_num)
-
         if error:
             errors.append(error)
-            skipped_count += 1
-            continue
+        elif hex_code in codes:
+            duplicates += 1
+        elif hex_code is not None:
+            codes[hex_code] = line_num
+    return codes, duplicates, errors
 
-        if hex_code is None:
-            continue
 
-        # Check if color already exists for this user
-        color, created = Color.objects.get_or_create(
-            user=user,
-            color=hex_code,
-            defaults={"name": ""},
+def _import_colors_from_lines(lines, user, *, palette=None):
+    """
+    Import colors from CSV lines and return counts and errors.
+
+    Takes the same few queries however long the list is: one lookup of the
+    user's existing colors, one insert of the new ones and one insert into
+    the palette's through table.
+
+    Args:
+        lines: Lines of the pasted CSV
+        user: Owner of the colors
+        palette: ColorPalette to add every listed color to, if any
+
+    Returns:
+        Tuple of (imported, skipped, errors); repeated, existing and invalid
+        lines count as skipped
+    """
+    codes, duplicates, errors = _parse_hex_lines(lines)
+
+    color_ids = {}
+    existing = Color.objects.filter(user=user, color__in=codes).order_by("pk")
+    for hex_code, color_id in existing.values_list("color", "pk"):
+        color_ids.setdefault(hex_code, color_id)
+
+    new_colors = Color.objects.bulk_create(
+        [
+            Color(user=user, color=hex_code, name="")
+            for hex_code in codes
+            if hex_code not in color_ids
+        ],
+    )
+    color_ids.update({color.color: color.pk for color in new_colors})
+
+    if palette and color_ids:
+        through = Color.palettes.through
+        through.objects.bulk_create(
+            [
+                through(color_id=color_id, colorpalette_id=palette.pk)
+                for color_id in color_ids.values()
+            ],
+            # Colors already in the palette
+            ignore_conflicts=True,
         )
 
-        if not created:
-            skipped_count += 1
-        else:
-            imported_count += 1
-
-        # Add color to palette if specified
-        if palette:
-            color.palettes.add(palette)
+    if color_ids:
+        # Bulk inserts send no signals
+        transaction.on_commit(
+            lambda: invalidate_data_version(user.pk, Color, ColorPalette),
+        )
 
+    imported_count = len(new_colors)
+    skipped_count = len(codes) - imported_count + duplicates + len(errors)
     return imported_count, skipped_count, errors
 
 
@@ -696,34 +800,25 @@ def color_palette_preview_htmx(request):
             {"preview_colors": [], "preview_errors": []},
         )
 
-    preview_colors = []
-    preview_errors = []
-
     # Split by both newlines and commas
     lines = csv_content.replace(",", "\n").split("\n")
-
-    for line_num, line in enumerate(lines, start=1):
-        hex_code, error = _process_hex_code(line, line_num)
-
-        if error:
-            preview_errors.append(error)
-            continue
-
-        if hex_code is None:
-            continue
-
-        exists = Color.objects.filter(
-            user=request.user,
-            color=hex_code,
-        ).exists()
-
-        preview_colors.append(
-            {
-                "hex_code": hex_code,
-                "line_num": line_num,
-                "exists": exists,
-            },
-        )
+    codes, _duplicates, preview_errors = _parse_hex_lines(lines)
+
+    # One lookup for every code in the list
+    existing = set(
+        Color.objects.filter(user=request.user, color__in=codes).values_list(
+            "color",
+            flat=True,
+        ),
+    )
+    preview_colors = [
+        {
+            "hex_code": hex_code,
+            "line_num": line_num,
+            "exists": hex_code in existing,
+        }
+        for hex_code, line_num in codes.items()
+    ]
 
     new_count = sum(1 for c in preview_colors if not c["exists"])
     existing_count = sum(1 for c in preview_colors if c["exists"])
@@ -26,16 +26,21 @@ from idahomeschool.academics.models import ReadingList
 from idahomeschool.academics.models import SchoolYear
 from idahomeschool.academics.models import Student
 from idahomeschool.academics.models import Tag
+from idahomeschool.academics.pagination import CursorPaginationMixin
+from idahomeschool.academics.reading_stats import get_reading_stats
 
 
 # Reading List Views
-class ReadingListView(LoginRequiredMixin, ListView):
+class ReadingListView(LoginRequiredMixin, CursorPaginationMixin, ListView):
     """List all reading list entries for all students."""
 
     model = ReadingList
     template_name = "academics/reading_list.html"
+    cursor_template_name = "academics/partials/reading_list_page.html"
     context_object_name = "reading_list_entries"
     paginate_by = 20
+    # Walks the (user, -updated_at, id) index, most recently updated first
+    cursor_ordering = ("-updated_at", "id")
 
     def get_queryset(self):
         queryset = ReadingList.objects.filter(
@@ -67,7 +72,7 @@ class ReadingListView(LoginRequiredMixin, ListView):
                 | Q(resource__author__icontains=search_query),
             )
 
-        return queryset.order_by("-updated_at")
+        return queryset
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -79,6 +84,17 @@ class ReadingListView(LoginRequiredMixin, ListView):
         context["selected_school_year"] = self.request.GET.get("school_year", "")
         context["search_query"] = self.request.GET.get("search", "")
 
+        # Statistics for the selected student, or the whole household
+        selected = next(
+            (
+                student
+                for student in context["students"]
+                if str(student.pk) == context["selected_student"]
+            ),
+            None,
+        )
+        context["reading_stats"] = get_reading_stats(self.request.user, selected)
+
         # Get book tag preferences
         book_tags = BookTagPreference.get_book_tags_for_user(self.request.user)
         context["book_tags"] = book_tags
@@ -96,8 +112,9 @@ class StudentReadingListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
     paginate_by = 20
 
     def test_func(self):
-        student = get_object_or_404(Student, pk=self.kwargs["pk"])
-        return student.user == self.request.user
+        # Kept for get_context_data, which would otherwise fetch it again
+        self.student = get_object_or_404(Student, pk=self.kwargs["pk"])
+        return self.student.user_id == self.request.user.pk
 
     def get_queryset(self):
         student_id = self.kwargs["pk"]
@@ -121,19 +138,20 @@ class StudentReadingListView(LoginRequiredMixin, UserPassesTestMixin, ListView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        student = get_object_or_404(Student, pk=self.kwargs["pk"])
-        context["student"] = student
+        context["student"] = self.student
         context["school_years"] = SchoolYear.objects.filter(user=self.request.user)
         context["statuses"] = ReadingList.STATUS_CHOICES
         context["selected_status"] = self.request.GET.get("status", "")
         context["selected_school_year"] = self.request.GET.get("school_year", "")
 
         # Get counts by status
-        all_entries = ReadingList.objects.filter(student=student)
-        context["to_read_count"] = all_entries.filter(status="TO_READ").count()
-        context["reading_count"] = all_entries.filter(status="READING").count()
-        context["completed_count"] = all_entries.filter(status="COMPLETED").count()
-        context["dnf_count"] = all_entries.filter(status="DID_NOT_FINISH").count()
+        stats = get_reading_stats(self.request.user, self.student)
+        counts = stats["status_counts"]
+        context["reading_stats"] = stats
+        context["to_read_count"] = counts["TO_READ"]
+        context["reading_count"] = counts["READING"]
+        context["completed_count"] = counts["COMPLETED"]
+        context["dnf_count"] = counts["DID_NOT_FINISH"]
 
         return context
 
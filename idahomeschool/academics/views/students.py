@@ -12,12 +12,20 @@ from django.views.generic import DetailView
 from django.views.generic import ListView
 from django.views.generic import UpdateView
 
+from idahomeschool.academics.conditional import ConditionalGetMixin
 from idahomeschool.academics.forms import StudentForm
 from idahomeschool.academics.forms import StudentGradeYearForm
+from idahomeschool.academics.models import Course
+from idahomeschool.academics.models import CourseEnrollment
+from idahomeschool.academics.models import GradeLevel
 from idahomeschool.academics.models import ReadingList
+from idahomeschool.academics.models import Resource
 from idahomeschool.academics.models import SchoolYear
 from idahomeschool.academics.models import Student
 from idahomeschool.academics.models import StudentGradeYear
+from idahomeschool.academics.reading_stats import get_reading_stats
+from idahomeschool.academics.school_years import get_request_active_school_year
+from idahomeschool.academics.student_grades import grades_for_students
 
 
 # Student Views
@@ -30,12 +38,8 @@ class StudentListView(LoginRequiredMixin, ListView):
     paginate_by = 20
 
     def get_queryset(self):
-        queryset = (
-            Student.objects.filter(user=self.request.user)
-            .annotate(
-                course_count=Count("course_enrollments", distinct=True),
-            )
-            .prefetch_related("grade_years__grade_level", "grade_years__school_year")
+        queryset = Student.objects.filter(user=self.request.user).annotate(
+            course_count=Count("course_enrollments", distinct=True),
         )
 
         # Search functionality
@@ -48,33 +52,47 @@ class StudentListView(LoginRequiredMixin, ListView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Get active school year for grade display
-        active_year = SchoolYear.objects.filter(
-            user=self.request.user,
-            is_active=True,
-        ).first()
+        active_year = get_request_active_school_year(self.request)
         context["active_year"] = active_year
 
         # Add current grade to each student for display
         if active_year:
-            for student in context["students"]:
-                student.current_grade = student.get_grade_for_year(active_year)
+            students = list(context["students"])
+            grades = grades_for_students(students, active_year)
+            for student in students:
+                student.current_grade = grades.get(student.pk)
 
         return context
 
 
-class StudentDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
+class StudentDetailView(
+    LoginRequiredMixin,
+    UserPassesTestMixin,
+    ConditionalGetMixin,
+    DetailView,
+):
     """Detail view for a student."""
 
     model = Student
     template_name = "academics/student_detail.html"
     context_object_name = "student"
+    conditional_models = (
+        Student,
+        CourseEnrollment,
+        Course,
+        SchoolYear,
+        StudentGradeYear,
+        GradeLevel,
+        ReadingList,
+        Resource,
+    )
 
     def test_func(self):
         return self.get_object().user == self.request.user
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        student = self.get_object()
+        student = self.object
 
         context["enrollments"] = student.course_enrollments.select_related(
             "course",
@@ -92,6 +110,7 @@ class StudentDetailView(LoginRequiredMixin, UserPassesTestMixin, DetailView):
             .select_related("resource", "school_year")
             .order_by("-updated_at")[:5]
         )
+        context["reading_stats"] = get_reading_stats(self.request.user, student)
 
         return context
 
@@ -136,15 +155,15 @@ class StudentUpdateView(LoginRequiredMixin, UserPassesTestMixin, UpdateView):
         # For HTMX requests, return the updated card and row
         if self.request.htmx:
             # Get active school year for grade display
-            active_year = SchoolYear.objects.filter(
-                user=self.request.user,
-                is_active=True,
-            ).first()
+            active_year = get_request_active_school_year(self.request)
 
             # Add current grade to student for display
             student = self.object
             if active_year:
-                student.current_grade = student.get_grade_for_year(active_year)
+                student.current_grade = grades_for_students(
+                    [student],
+                    active_year,
+                ).get(student.pk)
 
             # Add course count
             student.course_count = student.course_enrollments.count()
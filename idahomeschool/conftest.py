@@ -1,4 +1,5 @@
 import pytest
+from django.core.cache import cache
 
 from idahomeschool.users.models import User
 from idahomeschool.users.tests.factories import UserFactory
@@ -9,6 +10,14 @@ def _media_storage(settings, tmpdir) -> None:
     settings.MEDIA_ROOT = tmpdir.strpath
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    # Cached lookups must not leak between tests
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user(db) -> User:
     return UserFactory()